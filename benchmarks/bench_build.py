@@ -0,0 +1,40 @@
+"""
+Benchmark of building documents through the API.
+
+Run with ``python benchmarks/bench_build.py``. This times adding values to
+a document after its tables, where they are inserted before the first
+table, then dumping a dict whose tables come before its values.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from tomlkit import document
+from tomlkit import dumps
+
+
+def _build(values: int) -> None:
+    doc = document()
+    doc["tool"] = {"name": "x"}
+    doc["deps"] = {"a": "1.0"}
+    for i in range(values):
+        doc[f"key{i}"] = i
+
+
+DATA = {
+    **{f"table{i}": {"a": i} for i in range(10)},
+    **{f"key{i}": i for i in range(5_000)},
+}
+
+
+def main(number: int = 3) -> None:
+    ms = timeit.timeit(lambda: _build(5_000), number=number) / number * 1000
+    print(f"add 5000 values before tables: {ms:.1f}ms")
+
+    ms = timeit.timeit(lambda: dumps(DATA), number=number) / number * 1000
+    print(f"dump 5000 values after tables: {ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark of parser checkpoints.
+
+Run with ``python benchmarks/bench_checkpoints.py``. This times saving and
+restoring a position in the source with ``Source.save()``/``restore()``, as
+the parser does to look ahead, against the ``Source.state`` context manager
+it used before, then times parsing documents made of the items that look
+ahead the most: strings, booleans and table headers.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from tomlkit import parse
+from tomlkit.source import Source
+
+
+INPUTS = {
+    "strings": "".join(f'key{i} = "value {i}"\n' for i in range(20_000)),
+    "booleans": "".join(f"key{i} = true\n" for i in range(20_000)),
+    "tables": "".join(f"[table{i}]\nkey = 1\n" for i in range(5_000)),
+}
+
+
+def _state(source: Source) -> None:
+    with source.state(save_marker=True, restore=True):
+        source.inc()
+
+
+def _checkpoint(source: Source) -> None:
+    checkpoint, marker = source.save(), source.marker
+    try:
+        source.inc()
+    finally:
+        source.restore(checkpoint, marker)
+
+
+def _ns(func: object, number: int) -> float:
+    return timeit.timeit(func, number=number) / number * 1e9  # type: ignore[arg-type]
+
+
+def main(number: int = 100_000) -> None:
+    source = Source("a = 1\n")
+    state = _ns(lambda: _state(source), number)
+    checkpoint = _ns(lambda: _checkpoint(source), number)
+    print(
+        f"look ahead: {checkpoint:.0f}ns (with the state context manager: {state:.0f}ns)"
+    )
+
+    for name, text in INPUTS.items():
+        ms = timeit.timeit(lambda t=text: parse(t), number=5) / 5 * 1000  # type: ignore[misc]
+        print(f"parse {name}: {ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Benchmark of datetime parsing.
+
+Run with ``python benchmarks/bench_datetimes.py``. This times parsing a
+document of timestamps and dates which repeat, as in lock files, then
+reports how often ``parse_rfc3339()`` found them in its cache, to size it.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from tomlkit import parse
+from tomlkit._utils import parse_rfc3339
+
+
+TEXT = "".join(
+    f"updated{i} = 1979-05-27T07:32:00.{i % 50:06d}-07:00\n"
+    f"released{i} = 2024-01-{i % 28 + 1:02d}\n"
+    for i in range(20_000)
+)
+
+
+def main(number: int = 5) -> None:
+    ms = timeit.timeit(lambda: parse(TEXT), number=number) / number * 1000
+    print(f"parse datetimes: {ms:.1f}ms")
+
+    info = parse_rfc3339.cache_info()
+    ratio = info.hits / (info.hits + info.misses)
+    print(f"cache: {info.hits} hits, {info.misses} misses ({ratio:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark of rendering edited documents.
+
+Run with ``python benchmarks/bench_edit.py``. This times ``as_string()`` on a
+lock file of 3,000 packages as parsed, then after editing a value in one of
+its tables: the first time, then once the rest of the document was rendered.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from tomlkit import parse
+
+
+TEXT = "".join(
+    f"""\
+[[package]]
+name = "pkg{i}"
+version = "1.{i}.0"
+description = "A package"
+optional = false
+python-versions = ">=3.9"
+files = [
+    {{file = "pkg{i}.whl", hash = "sha256:{i:064d}"}},
+    {{file = "pkg{i}.tar.gz", hash = "sha256:{i:064d}"}},
+]
+
+[package.dependencies]
+foo = ">=1.0"
+bar = {{version = "^2.0", optional = true}}
+
+"""
+    for i in range(3_000)
+)
+
+
+def main(number: int = 5) -> None:
+    doc = parse(TEXT)
+    ms = timeit.timeit(doc.as_string, number=number) / number * 1000
+    print(f"as_string unchanged: {ms:.1f}ms")
+
+    def edit() -> None:
+        doc["package"][1500]["version"] = "2.0"
+        doc.as_string()
+
+    ms = timeit.timeit(edit, number=1) * 1000
+    print(f"as_string after the first edit: {ms:.1f}ms")
+
+    ms = timeit.timeit(edit, number=number) / number * 1000
+    print(f"as_string after the next edits: {ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark of nested arrays and inline tables.
+
+Run with ``python benchmarks/bench_nested.py``. This times parsing values
+nested as deep as the parser allows, and wide arrays of small arrays and
+inline tables, as in data files and lock files.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from tomlkit import parse
+from tomlkit.parser import Parser
+
+
+DEPTH = Parser.MAX_NESTING_DEPTH
+
+
+def _deep(values: int) -> str:
+    half = DEPTH // 2
+    return "".join(
+        f"array{i} = {'[' * DEPTH}{i}{']' * DEPTH}\n"
+        f"table{i} = {'{a = [' * half}{i}{']}' * half}\n"
+        for i in range(values)
+    )
+
+
+def _wide(values: int) -> str:
+    rows = ", ".join(
+        f"[{j}, {j + 1}, [{j}, {{x = {j}, y = [{j}]}}]]" for j in range(20)
+    )
+    return "".join(f"rows{i} = [{rows}]\n" for i in range(values))
+
+
+INPUTS = {
+    "deep": _deep(500),
+    "wide": _wide(500),
+}
+
+
+def main(number: int = 3) -> None:
+    for name, text in INPUTS.items():
+        ms = timeit.timeit(lambda t=text: parse(t), number=number) / number * 1000  # type: ignore[misc]
+        print(f"parse {name}: {ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
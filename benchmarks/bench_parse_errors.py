@@ -0,0 +1,74 @@
+"""
+Benchmark of parse errors in large documents.
+
+Run with ``python benchmarks/bench_parse_errors.py``. The errors are near the
+top of each document, so that parsing stops early: this times raising the
+error and catching it, then also formatting its message, which needs its line
+and column, and compares the latter with locating the error by scanning
+``splitlines()`` as it used to be done every time an error was created. It
+then times locating many errors in the same document.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from tomlkit import parse
+from tomlkit.exceptions import ParseError
+from tomlkit.source import Source
+
+
+BODY = "".join(f'key{i} = "value {i}"  # comment\n' for i in range(50_000))
+
+INPUTS = {
+    "invalid value": "bad = nope\n" + BODY,
+    "unclosed array": "bad = [1, 2\n" + BODY,
+    "invalid table name": "[a b]\n" + BODY,
+}
+
+
+def _splitlines_linecol(source: str, idx: int) -> tuple[int, int]:
+    cur = 0
+    for i, line in enumerate(source.splitlines()):
+        if cur + len(line) + 1 > idx:
+            return i + 1, idx - cur
+
+        cur += len(line) + 1
+
+    return len(source.splitlines()), 0
+
+
+def _parse(text: str, read: bool) -> None:
+    try:
+        parse(text)
+    except ParseError as e:
+        if read:
+            str(e)
+
+
+def _ms(func: object, number: int) -> float:
+    return timeit.timeit(func, number=number) / number * 1000  # type: ignore[arg-type]
+
+
+def main(number: int = 100) -> None:
+    for name, text in INPUTS.items():
+        raised = _ms(lambda t=text: _parse(t, False), number)
+        read = _ms(lambda t=text: _parse(t, True), number)
+        scan = _ms(lambda t=text: _splitlines_linecol(t, 10), number)
+        print(
+            f"{name}: {raised:.3f}ms, {read:.3f}ms with the message "
+            f"(locating it with splitlines(): {scan:.3f}ms)"
+        )
+
+    source = Source(BODY)
+    offsets = range(0, len(BODY), len(BODY) // 1000)
+    index = _ms(lambda: [source._to_linecol(i) for i in offsets], 1)
+    scan = _ms(lambda: [_splitlines_linecol(BODY, i) for i in offsets[:10]], 1)
+    print(
+        f"{len(offsets)} errors in the same document: {index:.3f}ms "
+        f"(with splitlines(): {scan * len(offsets) / 10:.3f}ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
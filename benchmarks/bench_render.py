@@ -0,0 +1,51 @@
+"""
+Benchmark of rendering documents made of many tables.
+
+Run with ``python benchmarks/bench_render.py``. This times the first
+``as_string()`` of documents built with 5,000 to 40,000 tables and arrays of
+tables elements, then checks that the time grows about linearly with their
+number: rendering each table must not look back at what was rendered before.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from tomlkit import document
+from tomlkit import table
+from tomlkit.toml_document import TOMLDocument
+
+
+SIZES = (5_000, 10_000, 20_000, 40_000)
+
+
+def _build(tables: int) -> TOMLDocument:
+    doc = document()
+    doc["title"] = "tables"
+    for i in range(tables // 2):
+        t = table()
+        t.add("name", f"t{i}")
+        t.add("sub", {"x": i})
+        doc[f"t{i}"] = t
+    doc["elements"] = [{"y": i} for i in range(tables // 2)]
+
+    return doc
+
+
+def main() -> None:
+    times = []
+    for tables in SIZES:
+        doc = _build(tables)
+        # Rendered once, as the text is cached until the document changes
+        s = timeit.timeit(doc.as_string, number=1)
+        times.append(s)
+        print(f"as_string ({tables} tables): {s:.3f}s")
+
+    growth = times[-1] / times[0]
+    scale = SIZES[-1] / SIZES[0]
+    print(f"growth: {growth:.1f}x for {scale:.0f}x tables")
+    assert growth < scale * 2, "rendering is not linear in the number of tables"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark of documents made of many table headers.
+
+Run with ``python benchmarks/bench_table_headers.py``. This times parsing
+50,000 table headers: nested tables and arrays of tables grouped under their
+parent, then tables which are not, so that each of them adds another part
+to out-of-order tables, whose parts are validated as they are appended.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from tomlkit import parse
+
+
+def _nested(groups: int) -> str:
+    parts = []
+    for i in range(groups):
+        parts.append(f"[g{i}]\nx = 1\n")
+        parts.extend(f"[g{i}.s{j}.t.u]\ny = 2\n" for j in range(3))
+        parts.extend(f"[g{i}.k{j}]\nz = 3\n" for j in range(3))
+        parts.append(f"[[g{i}.arr]]\nw = 4\n[[g{i}.arr]]\nw = 5\n[g{i}.arr.sub]\n")
+
+    return "".join(parts)
+
+
+def _out_of_order(headers: int) -> str:
+    return "".join(f"[root.x{i % 100}.y.z{i}.w]\nv = {i}\n" for i in range(headers))
+
+
+INPUTS = {
+    "nested": _nested(5_000),
+    "out of order": _out_of_order(10_000),
+}
+
+
+def main(number: int = 1) -> None:
+    for name, text in INPUTS.items():
+        headers = text.count("]\n")
+        s = timeit.timeit(lambda t=text: parse(t), number=number) / number  # type: ignore[misc]
+        print(f"parse {name} ({headers} headers): {s:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
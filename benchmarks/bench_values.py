@@ -0,0 +1,45 @@
+"""
+Benchmark of parsing into plain values.
+
+Run with ``python benchmarks/bench_values.py``. This times parsing a lock
+file into a document then unwrapping it, against ``parse(preserve=False)``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from tomlkit import parse
+
+
+TEXT = "".join(
+    f"[[package]]\n"
+    f'name = "package-{i}"\n'
+    f'version = "{i % 7}.{i % 13}.{i % 5}"\n'
+    f'description = "Package number {i}"\n'
+    f"optional = {'true' if i % 3 else 'false'}\n"
+    f'python-versions = ">=3.9"\n'
+    f"files = [\n"
+    f'    {{file = "package-{i}.tar.gz", hash = "sha256:{i:064x}"}},\n'
+    f'    {{file = "package-{i}-py3-none-any.whl", hash = "sha256:{i + 1:064x}"}},\n'
+    f"]\n"
+    f"\n"
+    f"[package.dependencies]\n"
+    f'dependency-{i + 1} = ">={i % 4}.0"\n'
+    f'dependency-{i + 2} = {{version = "*", markers = "python_version < \\"3.11\\""}}\n'
+    f"\n"
+    for i in range(5_000)
+)
+
+
+def main(number: int = 3) -> None:
+    for name, parse_values in [
+        ("parse().unwrap()", lambda: parse(TEXT).unwrap()),
+        ("parse(preserve=False)", lambda: parse(TEXT, preserve=False)),
+    ]:
+        ms = timeit.timeit(parse_values, number=number) / number * 1000
+        print(f"{name}: {ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,18 @@
 import io
 import json
+import mmap
 import os
+import re
 
 from datetime import date
 from datetime import datetime
 from datetime import time
+from pathlib import Path
 from types import MappingProxyType
+from typing import IO
 from typing import Any
 from typing import Callable
+from typing import cast
 
 import pytest
 
@@ -25,6 +30,9 @@ from tomlkit.exceptions import InvalidDateTimeError
 from tomlkit.exceptions import InvalidNumberError
 from tomlkit.exceptions import InvalidStringError
 from tomlkit.exceptions import InvalidTimeError
+from tomlkit.exceptions import KeyAlreadyPresent
+from tomlkit.exceptions import ParseError
+from tomlkit.exceptions import TOMLKitError
 from tomlkit.exceptions import UnexpectedCharError
 from tomlkit.items import AoT
 from tomlkit.items import Array
@@ -35,6 +43,7 @@ from tomlkit.items import Float
 from tomlkit.items import InlineTable
 from tomlkit.items import Integer
 from tomlkit.items import Key
+from tomlkit.items import String
 from tomlkit.items import Table
 from tomlkit.items import Time
 from tomlkit.parser import Parser
@@ -96,6 +105,200 @@ def test_load_from_file_object(example_name: str) -> None:
         assert isinstance(load(fp), TOMLDocument)
 
 
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "example",
+        "fruit",
+        "hard",
+        "sections_with_same_start",
+        "pyproject",
+        "0.5.0",
+        "test",
+        "newline_in_strings",
+        "preserve_quotes_in_string",
+        "string_slash_whitespace_newline",
+        "table_names",
+    ],
+)
+def test_load_gives_the_same_document_as_parse(
+    example: Callable[[str], str], example_name: str
+) -> None:
+    content = example(example_name)
+    expected = parse(content)
+
+    doc = load(io.StringIO(content))
+    assert doc.as_string() == content
+    assert doc == expected
+    assert list(doc) == list(expected)
+
+    doc = load(io.BytesIO(content.encode("utf-8")))
+    assert doc.as_string() == content
+
+
+def test_load_arrays_of_tables_one_element_at_a_time() -> None:
+    content = """\
+[[package]]
+name = "a"
+
+[package.dependencies]
+b = "^1.0"
+
+[[package]]
+name = "b"
+
+[[package.files]]
+file = "b.whl"
+
+[metadata]
+lock-version = "2.0"
+"""
+    doc = load(io.StringIO(content))
+
+    assert doc.as_string() == content
+    assert isinstance(doc["package"], AoT)
+    assert doc.unwrap() == parse(content).unwrap()
+
+
+def test_load_reports_errors_at_their_line_in_the_file() -> None:
+    content = '[a]\nb = 1\n\n[c]\nd = "e\n'
+    with pytest.raises(ParseError) as expected:
+        parse(content)
+
+    with pytest.raises(ParseError) as e:
+        load(io.StringIO(content))
+
+    assert (e.value.line, e.value.col) == (expected.value.line, expected.value.col)
+    assert e.value.line == 5
+
+
+def test_load_falls_back_to_parse_for_non_utf8_bytes() -> None:
+    assert load(io.BytesIO('a = "\xe9"\n'.encode("latin1"))) == {"a": "\xe9"}
+
+
+class _ReadOnly:
+    """
+    A file-like object with only a ``read()`` method, without a size.
+    """
+
+    def __init__(self, data: str | bytes) -> None:
+        self._data = data
+
+    def read(self) -> str | bytes:
+        return self._data
+
+    @classmethod
+    def of(cls, data: str | bytes) -> IO[Any]:
+        # Typed as the files load() takes, which it only calls read() on
+        return cast("IO[Any]", cls(data))
+
+
+class _Unseekable(io.BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+
+def test_load_from_read_only_file_objects() -> None:
+    content = '[a]\nb = "\xe9"\n'
+
+    assert load(_ReadOnly.of(content)) == {"a": {"b": "\xe9"}}
+    assert load(_ReadOnly.of(content.encode()), preserve=False) == {"a": {"b": "\xe9"}}
+    assert load(_Unseekable(content.encode())).as_string() == content
+    # Not UTF-8
+    assert load(_Unseekable(content.encode("latin1"))) == {"a": {"b": "\xe9"}}
+
+
+def test_load_options() -> None:
+    content = "a = [[1]]\n\n[b]\nc = 1\n"
+
+    doc = load(io.StringIO(content), lazy=True)
+    assert doc.as_string() == content
+    assert doc["b"] == {"c": 1}
+
+    doc = load(io.StringIO(content), track_positions=True)
+    assert doc.locate(["b", "c"]) == (content.index("1\n"), len(content) - 1)
+
+    assert load(io.BytesIO(content.encode()), workers=2) == parse(content)
+
+    with pytest.raises(ParseError, match="nested more than 1 levels"):
+        load(io.StringIO(content), max_depth=1)
+
+    with pytest.raises(ParseError, match="nested more than 1 levels"):
+        load(io.StringIO(content), preserve=False, max_depth=1)
+
+
+@pytest.mark.parametrize(
+    "example_name", ["example", "fruit", "hard", "pyproject", "0.5.0", "test"]
+)
+def test_parse_bytes_like_objects(
+    example: Callable[[str], str], example_name: str, tmp_path: Path
+) -> None:
+    content = example(example_name)
+    data = content.encode()
+    path = tmp_path / "example.toml"
+    path.write_bytes(data)
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        doc = parse(m)
+        assert doc.as_string() == content
+
+    values = json.dumps(parse(content).unwrap(), default=str)
+    for source in (bytearray(data), memoryview(data), data):
+        assert parse(source).as_string() == content
+        assert json.dumps(parse(source, preserve=False), default=str) == values
+
+
+def test_parse_with_workers() -> None:
+    # Large enough to be split across several batches
+    description = "x" * 200
+    packages = "".join(
+        f'[[package]]\nname = "pkg{i}"\ndescription = "{description}"\n\n'
+        '  [package.extras]\n  dev = ["a", "b"]\n\n'
+        for i in range(300)
+    )
+    content = f'title = "lock"\n\n[a.b]\nc = 1\n\n{packages}[a.d]\ne = 2\n'
+
+    doc = parse(content, workers=2)
+
+    assert doc.as_string() == parse(content).as_string()
+    assert doc == parse(content)
+    assert doc["a"] == {"b": {"c": 1}, "d": {"e": 2}}
+    assert len(doc["package"]) == 300
+    assert loads(content.encode(), preserve=False, workers=2) == parse(content).unwrap()
+
+    with pytest.raises(ParseError) as e:
+        parse(content + "[a.b]\nf = 3\n", workers=2)
+
+    assert str(e.value) == 'Key "b" already exists. at line 2109 col 0'
+
+    with pytest.raises(UnexpectedCharError) as e:
+        parse(content + "[c]\nf = nope\n", workers=2)
+
+    assert (e.value.line, e.value.col) == (2109, 4)
+
+
+def test_parse_bytes_like_objects_without_byte_order_mark() -> None:
+    data = b"\xef\xbb\xbfa = 1\n"
+
+    assert parse(data).as_string() == "a = 1\n"
+    assert parse(memoryview(data)).as_string() == "a = 1\n"
+    assert parse(bytearray('a = "\xe9"\n'.encode("latin1"))) == {"a": "\xe9"}
+
+
+def test_parse_memory_map_can_be_closed_after_an_error(tmp_path: Path) -> None:
+    path = tmp_path / "invalid.toml"
+    path.write_bytes(b"a = 1\n\n[b]\nc = \n")
+
+    with open(path, "rb") as f:
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with pytest.raises(ParseError) as e:
+            parse(m)
+
+        m.close()
+
+    assert e.value.line == 4
+
+
 @pytest.mark.parametrize("example_name", ["0.5.0", "pyproject", "table_names"])
 def test_parsed_document_are_properly_json_representable(
     example: Callable[[str], str], json_example: Callable[[str], str], example_name: str
@@ -134,6 +337,161 @@ def test_parse_raises_errors_for_invalid_toml_files(
         parse(invalid_example(example_name))
 
 
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "example",
+        "fruit",
+        "hard",
+        "sections_with_same_start",
+        "pyproject",
+        "0.5.0",
+        "test",
+        "newline_in_strings",
+        "preserve_quotes_in_string",
+        "string_slash_whitespace_newline",
+        "table_names",
+    ],
+)
+def test_parse_values_only_matches_unwrapped_document(
+    example: Callable[[str], str], example_name: str
+) -> None:
+    content = example(example_name)
+    values = parse(content, preserve=False)
+
+    assert type(values) is dict
+    # Compared through JSON so that NaN values compare equal
+    expected = json.dumps(parse(content).unwrap(), default=json_serial)
+    assert json.dumps(values, default=json_serial) == expected
+    assert load(io.StringIO(content), preserve=False).keys() == values.keys()
+
+
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "section_with_trailing_characters",
+        "array_with_invalid_chars",
+        "invalid_number",
+        "newline_in_singleline_string",
+        "array_duplicate_comma",
+        "inline_table_no_comma",
+    ],
+)
+def test_parse_values_only_raises_the_same_errors(
+    invalid_example: Callable[[str], str], example_name: str
+) -> None:
+    content = invalid_example(example_name)
+    with pytest.raises(ParseError) as expected:
+        parse(content)
+
+    with pytest.raises(ParseError) as e:
+        loads(content, preserve=False)
+
+    assert type(e.value) is type(expected.value)
+    assert str(e.value) == str(expected.value)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "a = 1\na = 2\n",
+        "a = {b = 1, b = 2}\n",
+        "a = [1, 2\n",
+        "a = [1 2]\n",
+        "a = 01\n",
+        'a = "\\q"\n',
+        "a = 'b\n",
+        "a.b = 1\na.b.c = 2\n",
+        "[a]\n[a]\n",
+        "[a]\nb = 1\n[a.b]\n",
+        "[[a]]\n[a]\n",
+        "a = 1\n[a.b]\n",
+        "[a]b = 1\n",
+        "[[a]\n",
+        "a = 1 b = 2\n",
+        "= 1\n",
+    ],
+)
+def test_parse_values_only_raises_the_same_errors_as_the_regular_parse(
+    content: str,
+) -> None:
+    with pytest.raises(TOMLKitError) as expected:
+        parse(content)
+
+    values: list[Callable[[], Any]] = [
+        lambda: parse(content, preserve=False),
+        lambda: load(io.StringIO(content), preserve=False),
+    ]
+    for parse_values in values:
+        with pytest.raises(TOMLKitError) as e:
+            parse_values()
+
+        assert type(e.value) is type(expected.value)
+        assert str(e.value) == str(expected.value)
+
+
+def test_parse_values_only_falls_back_on_any_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def put_plain(*args: Any) -> None:
+        raise RuntimeError("not a parse error")
+
+    monkeypatch.setattr(tomlkit.parser, "_put_plain", put_plain)
+    content = "a = 1\n[b]\nc = [2]\n"
+
+    assert loads(content, preserve=False) == {"a": 1, "b": {"c": [2]}}
+    assert load(io.StringIO(content), preserve=False) == {"a": 1, "b": {"c": [2]}}
+
+
+def test_parse_values_only_validates_structure() -> None:
+    with pytest.raises(ParseError, match='Key "a" already exists'):
+        loads("[a]\nb = 1\n[a]\nc = 2\n", preserve=False)
+
+    assert loads("[a.b]\nx = 1\n[c]\n[a]\ny = 2  # c\n", preserve=False) == {
+        "a": {"b": {"x": 1}, "y": 2},
+        "c": {},
+    }
+
+
+def test_parse_values_only_builds_no_items(monkeypatch: pytest.MonkeyPatch) -> None:
+    def trivia() -> None:
+        raise AssertionError("an item was built")
+
+    monkeypatch.setattr(tomlkit.parser, "Trivia", trivia)
+    content = "a = 1  # c\n\n[[t]]\nb = ['x', {c = true}]\n[t.d]\ne.f = \"g\"\n"
+
+    assert loads(content, preserve=False) == {
+        "a": 1,
+        "t": [{"b": ["x", {"c": True}], "d": {"e": {"f": "g"}}}],
+    }
+    assert loads(content.encode(), preserve=False) == loads(content, preserve=False)
+    assert load(io.StringIO(content), preserve=False) == loads(content, preserve=False)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        'a = "\\u00e9" \nb = 1979-05-27 07:32:00\nc = [1.5, -1, 0x1f]\n',
+        "a.b = 1\n[a.c]\n",
+        "[a.b.c]\n[a.b]\n[a.x]\n[a.b.c.d]\n",
+        "[a.b.c]\n[a.b]\n[a]\n[a.b.x]\n",
+        "[[a.b]]\n[x]\n[a.b.c]\n",
+        "x = [1,\r2]\n",
+        "x = {a.b = 1, a = 2}\n",
+    ],
+)
+def test_parse_values_only_matches_the_regular_parse(content: str) -> None:
+    try:
+        expected = parse(content).unwrap()
+    except TOMLKitError as e:
+        for source in (content, memoryview(content.encode())):
+            with pytest.raises(type(e), match=re.escape(str(e))):
+                parse(source, preserve=False)
+    else:
+        assert parse(content, preserve=False) == expected
+        assert parse(memoryview(content.encode()), preserve=False) == expected
+
+
 @pytest.mark.parametrize(
     "example_name",
     [
@@ -212,6 +570,23 @@ def test_dump_to_file_object() -> None:
     assert fp.getvalue() == 'foo = "bar"\n'
 
 
+def test_dump_document_to_file_object_in_chunks() -> None:
+    doc = parse("a = 1\n\n[t]\nb = [1, 2]\n\n[[arr]]\nc = 3\n")
+    doc["t"]["b"].append(3)
+
+    class Chunks(io.StringIO):
+        writes = 0
+
+        def write(self, s: str) -> int:
+            self.writes += 1
+            return super().write(s)
+
+    fp = Chunks()
+    dump(doc, fp)
+    assert fp.getvalue() == doc.as_string()
+    assert fp.writes > 1
+
+
 def test_dump_nested_dotted_table() -> None:
     a: Any = tomlkit.parse("a.b.c.d='e'")["a"]
     assert a == {"b": {"c": {"d": "e"}}}
@@ -611,3 +986,204 @@ def test_parse_accepts_nesting_at_the_depth_limit() -> None:
     assert parse(array).as_string() == array
     dotted = ".".join(["a"] * depth) + " = 1"
     assert parse(dotted).as_string() == dotted
+
+
+@pytest.mark.parametrize(
+    "string", ["x = [[[1]]]", b"x = [[[1]]]", memoryview(b"x = [[[1]]]")]
+)
+def test_parse_max_depth(string: str | bytes | memoryview) -> None:
+    assert parse(string, max_depth=3) == {"x": [[[1]]]}
+    with pytest.raises(ParseError) as e:
+        parse(string, max_depth=2)
+
+    assert str(e.value) == "TOML value nested more than 2 levels deep at line 1 col 6"
+
+
+def test_parse_max_depth_of_dotted_keys() -> None:
+    assert parse("a.b = 1", max_depth=2) == {"a": {"b": 1}}
+    with pytest.raises(ParseError, match="TOML key nested more than 2 levels deep"):
+        parse("a.b.c = 1", max_depth=2)
+
+
+def test_iterparse_yields_events_with_paths_and_offsets() -> None:
+    content = """\
+a = 1  # c
+
+[[package]]
+name = "x"
+[package.deps]
+b.c = [1,
+  2]
+"""
+    events = list(tomlkit.iterparse(content))
+
+    assert [(e.kind, e.path) for e in events] == [
+        ("key_value", ("a",)),
+        ("whitespace", ()),
+        ("aot_header", ("package",)),
+        ("key_value", ("package", "name")),
+        ("table_header", ("package", "deps")),
+        ("key_value", ("package", "deps", "b", "c")),
+    ]
+    assert "".join(content[e.start : e.end] for e in events) == content
+    first, last = events[0].value, events[5].value
+    assert isinstance(first, Integer)
+    assert first.trivia.comment == "# c"
+    assert isinstance(last, Array)
+    assert last.unwrap() == [1, 2]
+
+    from_file = list(tomlkit.iterparse(io.StringIO(content)))
+    assert [(e.kind, e.path, e.start, e.end) for e in from_file] == [
+        (e.kind, e.path, e.start, e.end) for e in events
+    ]
+
+
+def test_iterparse_is_lazy() -> None:
+    events = tomlkit.iterparse(
+        '[[package]]\nname = "a"\n[[package]]\nname = "b"\n= 1\n'
+    )
+
+    for event in events:
+        if event.kind == "key_value":
+            break
+
+    assert event.path == ("package", "name")
+    assert isinstance(event.value, String)
+    assert event.value.unwrap() == "a"
+    with pytest.raises(ParseError):
+        list(events)
+
+
+@pytest.mark.parametrize(
+    "example_name",
+    [
+        "section_with_trailing_characters",
+        "array_with_invalid_chars",
+        "invalid_number",
+        "newline_in_singleline_string",
+        "array_duplicate_comma",
+        "inline_table_no_comma",
+    ],
+)
+def test_validate_returns_the_parse_error(
+    invalid_example: Callable[[str], str], example_name: str
+) -> None:
+    content = invalid_example(example_name)
+    with pytest.raises(ParseError) as expected:
+        parse(content)
+
+    errors = tomlkit.validate(content)
+
+    assert [type(e) for e in errors] == [type(expected.value)]
+    assert str(errors[0]) == str(expected.value)
+
+
+@pytest.mark.parametrize("example_name", ["example", "0.5.0", "pyproject"])
+def test_validate_valid_documents(
+    example: Callable[[str], str], example_name: str
+) -> None:
+    assert tomlkit.validate(example(example_name)) == []
+    assert tomlkit.validate(io.BytesIO(example(example_name).encode())) == []
+
+
+def test_validate_all_errors() -> None:
+    content = (
+        "a = 1\na = 2\n"
+        "[t]\nb = [\n"
+        "[u]\nc = 1\n"
+        "[v]\nd = 1\nd = 2\n"
+        "[[w]]\n[[w]]\ne = 1\n"
+        "[w]\n"
+    )
+
+    errors = tomlkit.validate(content, all_errors=True)
+
+    assert [type(e) for e in errors] == [
+        ParseError,
+        UnexpectedCharError,
+        KeyAlreadyPresent,
+        ParseError,
+    ]
+    assert [(e.line, e.col) for e in errors if isinstance(e, ParseError)] == [
+        (3, 0),
+        (5, 1),
+        (13, 0),
+    ]
+    assert str(errors[0]) == 'Key "a" already exists. at line 3 col 0'
+    assert str(errors[2]) == 'Key "d" already exists.'
+    assert str(errors[-1]) == 'Key "w" already exists. at line 13 col 0'
+    assert [str(e) for e in tomlkit.validate(content)] == [str(errors[0])]
+
+
+def test_validate_all_errors_after_several_unclosed_arrays() -> None:
+    content = (
+        "[a]\nx = [\n[b]\n[c]\nz = [1 2]\n[c.d]\nw = 1\nw = 2\n[f]\ng = 1\ng = 2\n"
+    )
+
+    errors = tomlkit.validate(content, all_errors=True)
+
+    assert [type(e) for e in errors] == [
+        UnexpectedCharError,
+        UnexpectedCharError,
+        KeyAlreadyPresent,
+        KeyAlreadyPresent,
+    ]
+    assert [e.line for e in errors if isinstance(e, ParseError)] == [3, 5]
+
+
+_INVALID_DOCUMENTS = [
+    "d = 1\nd = 2\n[x]\n",
+    "a = 1\na = 2\n",
+    "a = [1 2]\n[b]\n",
+    "[a]\nb = [\n[c]\nd = 1\n",
+    "[a]\nb = 1\n[a]\nc = 1\n",
+    "[a]\nb = {x = 1, x = 2}\n[c]\n",
+    "[a]\nb.c = 1\n[a.b]\n",
+    "[[a]]\nb = 1\n[a]\n",
+    "a = 1\n[[a]]\nb = 1\n[[a]]\n",
+    "[a]\n[[a.b]]\n[[a.b]]\nc = 1\n[a.b]\n",
+    "[a]\nb = 01\n",
+    '[a]\nb = "c\n[d]\n',
+    "[a\nb = 1\n",
+    "[a]\n= 1\n[b]\n",
+    "[a]\nb = 1979-05-27 1\n",
+]
+
+
+@pytest.mark.parametrize("content", _INVALID_DOCUMENTS)
+def test_invalid_documents_raise_the_same_error_from_every_entry_point(
+    content: str, tmp_path: Path
+) -> None:
+    data = content.encode()
+    path = tmp_path / "invalid.toml"
+    path.write_bytes(data)
+    entry_points: list[Callable[[], Any]] = [
+        lambda: parse(content),
+        lambda: parse(content, preserve=False),
+        lambda: parse(bytearray(data)),
+        lambda: parse(memoryview(data), preserve=False),
+        lambda: load(io.StringIO(content)),
+        lambda: load(io.BytesIO(data), preserve=False),
+    ]
+    errors = []
+    for entry_point in entry_points:
+        with pytest.raises(TOMLKitError) as e:
+            entry_point()
+
+        errors.append((type(e.value), str(e.value)))
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        with pytest.raises(TOMLKitError) as e:
+            parse(m)
+
+        errors.append((type(e.value), str(e.value)))
+
+    found = tomlkit.validate(content)
+    errors.append((type(found[0]), str(found[0])))
+
+    assert errors == [errors[0]] * len(errors)
+
+
+def test_validate_falls_back_to_parse_for_non_utf8_bytes() -> None:
+    assert tomlkit.validate(b'a = "\xe9"\n') == []
+    assert tomlkit.validate(io.BytesIO(b'a = "\xe9"\n')) == []
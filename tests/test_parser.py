@@ -1,3 +1,5 @@
+import io
+import pickle
 import sys
 
 import pytest
@@ -9,8 +11,12 @@ from tomlkit.exceptions import InvalidUnicodeValueError
 from tomlkit.exceptions import ParseError
 from tomlkit.exceptions import UnexpectedCharError
 from tomlkit.items import Integer
+from tomlkit.items import Key
 from tomlkit.items import StringType
 from tomlkit.parser import Parser
+from tomlkit.parser import split_units
+from tomlkit.source import Source
+from tomlkit.source import iter_lines
 
 
 def test_parser_should_raise_an_internal_error_if_parsing_wrong_type_of_string() -> (
@@ -235,3 +241,173 @@ def test_parser_rejects_overlong_decimal_integer() -> None:
     # the value just under the limit is still a normal integer
     value = Parser("a = " + "9" * 4300).parse()["a"]
     assert isinstance(value, Integer)
+
+
+def test_split_units_groups_tables_with_their_descendants() -> None:
+    content = """\
+a = [
+  [1, 2],
+]
+[b]
+c = '''
+[not.a.header]
+'''
+[b.d]  # "[x]"
+[[e]]
+[e.f]
+[[e]]
+[e.g]
+[h]
+"""
+    units = list(split_units(content.splitlines(keepends=True)))
+
+    assert "".join(unit.text for unit in units) == content
+    assert [(unit.line_offset, unit.aot) for unit in units] == [
+        (0, None),
+        (3, None),
+        (8, None),
+        (10, "e"),
+        (12, None),
+    ]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 1024])
+def test_iter_lines_splits_on_line_feeds_only(size: int) -> None:
+    content = "a = 1\r\n\n# é€\nb = 2"
+
+    assert list(iter_lines(io.StringIO(content, newline=""), size)) == [
+        "a = 1\r\n",
+        "\n",
+        "# é€\n",
+        "b = 2",
+    ]
+    assert list(iter_lines(io.BytesIO(content.encode("utf-8")), size)) == list(
+        iter_lines(io.StringIO(content, newline=""))
+    )
+
+
+def test_parse_errors_are_located_when_looked_up() -> None:
+    content = "a = 1\r\nb = [\n  1,\n  nope,\n]\n"
+    parser = Parser(content)
+
+    with pytest.raises(UnexpectedCharError) as e:
+        parser.parse()
+
+    assert e.value._position is not None
+    assert str(e.value) == "Unexpected character: 'n' at line 4 col 2"
+    assert (e.value.line, e.value.col) == (4, 2)
+    assert e.value._position is None
+
+    errors = [parser._src.parse_error() for _ in range(2)]
+    assert [(error.line, error.col) for error in errors] == [(4, 2), (4, 2)]
+
+
+def test_parse_errors_can_be_pickled() -> None:
+    with pytest.raises(UnexpectedCharError) as e:
+        Parser("a = 1\nb = nope\n").parse()
+
+    error = pickle.loads(pickle.dumps(e.value))
+
+    assert type(error) is UnexpectedCharError
+    assert str(error) == "Unexpected character: 'n' at line 2 col 4"
+
+
+def test_parse_basic_strings_with_escapes() -> None:
+    content = (
+        'a = "\\u00e9\\t\\"x\\"\\\\\\U0001F600\\x41\\e"\n'
+        'b = """\\\n   one ""\\u00e9"" \\\r\n  two\r\nthree"""""\n'
+    )
+    doc = Parser(content).parse()
+
+    assert doc["a"] == 'é\t"x"\\\U0001f600A\x1b'
+    assert doc["b"] == 'one ""é"" two\r\nthree""'
+    assert doc.as_string() == content
+
+
+@pytest.mark.parametrize(
+    "content, position",
+    [
+        ('a = "\\u00e9\\u00e9\\uD800"', (1, 18)),
+        ('a = "\\u00e9\\u00e9\\q"', (1, 18)),
+        ('a = """\\u00e9\n\\u00e9\x01"""', (2, 6)),
+    ],
+)
+def test_parse_basic_strings_with_invalid_escapes(
+    content: str, position: tuple[int, int]
+) -> None:
+    with pytest.raises(ParseError) as e:
+        Parser(content).parse()
+
+    assert (e.value.line, e.value.col) == position
+
+
+def test_source_checkpoints() -> None:
+    src = Source("a = 1\n")
+    src.inc()
+    src.mark()
+    checkpoint, marker = src.save(), src.marker
+
+    src.inc_n(5)
+    src.mark()
+    assert src.end()
+
+    src.restore(checkpoint)
+    assert (src.idx, src.current, src.marker) == (1, " ", 6)
+
+    src.restore(checkpoint, marker)
+    assert src.marker == 1
+
+
+def test_table_headers_are_parsed_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    content = "[a]\n[a.b]\n[a.b.c]\n[[d]]\n[[d]]\n[d.e]\n[f]\n"
+    parse_key = Parser._parse_key
+    keys = []
+
+    def spy(parser: Parser) -> Key:
+        key = parse_key(parser)
+        keys.append(key.as_string())
+        return key
+
+    monkeypatch.setattr(Parser, "_parse_key", spy)
+    doc = Parser(content).parse()
+
+    assert keys == ["a", "a.b", "a.b.c", "d", "d", "d.e", "f"]
+    assert doc.as_string() == content
+
+
+def test_parse_interleaved_out_of_order_tables() -> None:
+    content = "".join(f"[root.x{i % 3}.y.z{i}.w]\nv = {i}\n" for i in range(9))
+    doc = Parser(content).parse()
+
+    assert list(doc["root"]["x1"]["y"]) == ["z1", "z4", "z7"]
+    assert doc["root"]["x1"]["y"]["z4"]["w"]["v"] == 4
+    assert doc.as_string() == content
+
+    with pytest.raises(ParseError, match='Key "w" already exists'):
+        Parser(content + "[root.x1.y.z4.w]\n").parse()
+
+
+def test_repeated_keys_are_shared() -> None:
+    content = '[[p]]\nname = "a"\n\n[[p]]\nname = "b"\n\n[[p]]\nname  =  "c"\n'
+    doc = Parser(content).parse()
+    keys = [table.value.body[0][0] for table in doc["p"]]
+
+    assert keys[0] is keys[1]
+    assert keys[2] is not keys[0]
+
+    doc["p"][0]["name"] = "z"
+    del doc["p"][1]["name"]
+
+    assert doc.as_string() == '[[p]]\nname = "z"\n\n[[p]]\n\n[[p]]\nname  =  "c"\n'
+
+
+def test_parse_nesting_deeper_than_the_recursion_limit() -> None:
+    depth = sys.getrecursionlimit()
+    content = "x = " + "[{a = " * depth + "1" + "}]" * depth
+    doc = Parser(content, max_depth=2 * depth).parse()
+
+    value = doc["x"]
+    for _ in range(depth):
+        value = value[0]["a"]
+
+    assert value == 1
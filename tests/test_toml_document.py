@@ -16,9 +16,12 @@ from tomlkit import parse
 from tomlkit import ws
 from tomlkit._utils import _utc
 from tomlkit.api import document
+from tomlkit.container import Container
 from tomlkit.exceptions import NonExistentKey
 from tomlkit.exceptions import ParseError
 from tomlkit.exceptions import TOMLKitError
+from tomlkit.items import AoT
+from tomlkit.items import Null
 from tomlkit.toml_document import TOMLDocument
 
 
@@ -1666,3 +1669,508 @@ a.b = 1
     doc["z"] = 2
 
     assert doc.as_string() == "a.b = 1\nz = 2\n"
+
+
+LAZY_CONTENT = """\
+title = "lazy"
+
+[[package]]
+name = "a"
+
+[package.dependencies]
+b = "^1.0"
+
+[[package]]
+name = "b"  # second
+
+[tool.x]
+y = [
+  [1, 2],
+]
+z = '''
+[not.a.table]
+'''
+
+[tool.x.sub]
+k = 1
+"""
+
+
+@pytest.mark.parametrize(
+    "example_name", ["example", "fruit", "hard", "pyproject", "0.5.0", "test"]
+)
+def test_lazy_document_is_the_same_as_eager(
+    example: Callable[[str], str], example_name: str
+) -> None:
+    content = example(example_name)
+    doc = parse(content, lazy=True)
+
+    assert doc.as_string() == content
+    assert json.dumps(doc, default=str) == json.dumps(parse(content), default=str)
+    assert doc.as_string() == content
+
+
+def test_lazy_document_only_parses_accessed_tables() -> None:
+    doc = parse(LAZY_CONTENT, lazy=True)
+
+    assert list(doc) == ["title", "package", "tool"]
+    packages = doc.item("package")
+    assert isinstance(packages, AoT)
+    assert all(t._lazy is not None for t in packages.body)
+    assert all(dict.__len__(t) == 0 for t in packages.body)
+
+    assert doc["package"][1]["name"] == "b"
+    assert packages.body[0]._lazy is not None
+    assert packages.body[1]._lazy is None
+    assert type(packages.body[1].value) is Container
+    assert doc["tool"]["x"]["z"] == "[not.a.table]\n"
+    assert doc["tool"]["x"]["sub"] == {"k": 1}
+
+    assert doc.as_string() == LAZY_CONTENT
+    assert doc == parse(LAZY_CONTENT)
+
+
+def test_lazy_tables_can_be_modified_copied_and_pickled() -> None:
+    doc = parse(LAZY_CONTENT, lazy=True)
+    copied = copy.copy(doc["package"][0])
+    doc["tool"]["x"]["sub"]["k"] = 2
+    assert "k = 2\n" in doc.as_string()
+
+    assert copied == {"name": "a", "dependencies": {"b": "^1.0"}}
+    loaded = pickle.loads(pickle.dumps(parse(LAZY_CONTENT, lazy=True)))
+    assert loaded.as_string() == LAZY_CONTENT
+
+    doc = parse(LAZY_CONTENT, lazy=True)
+    packages = doc.item("package")
+    assert isinstance(packages, AoT)
+    package = packages.body[0]
+    assert dict(package) == {"name": "a", "dependencies": {"b": "^1.0"}}
+    assert dict.keys(package) == {"name", "dependencies"}
+    assert pickle.loads(pickle.dumps(package)) == package
+
+
+def test_lazy_document_raises_syntax_errors_on_access() -> None:
+    doc = parse("[a]\nb = 1\n\n[c]\nd = \n", lazy=True)
+
+    assert doc["a"]["b"] == 1
+    with pytest.raises(ParseError) as e:
+        doc["c"]["d"]
+
+    assert e.value.line == 5
+
+
+REPARSE_CONTENT = """\
+title = "reparse"
+
+[a]
+b = 1
+
+[[c]]
+d = 1
+
+[[c]]
+d = 2
+"""
+
+
+def test_reparse_only_parses_the_edited_table() -> None:
+    doc = parse(REPARSE_CONTENT, incremental=True)
+    a = doc["a"]
+    first = doc["c"][0]
+    second = doc["c"][1]
+
+    start = REPARSE_CONTENT.index("d = 2") + 4
+    doc.reparse(start, start + 1, "[3, 4]")
+    assert doc["c"][1] == {"d": [3, 4]}
+    assert doc["c"][0] is first
+    assert doc["a"] is a
+
+    start = REPARSE_CONTENT.index("b = 1")
+    doc.reparse(start, start, "z = 2\n")
+    assert doc["a"] == {"z": 2, "b": 1}
+    assert doc["c"][1] is not second
+
+    doc.reparse(0, 0, "# comment\n")
+    expected = "# comment\n" + REPARSE_CONTENT.replace("b = 1", "z = 2\nb = 1")
+    expected = expected.replace("d = 2", "d = [3, 4]")
+    assert doc.as_string() == expected
+    assert doc == parse(expected)
+    assert list(doc) == ["title", "a", "c"]
+
+
+def test_reparse_falls_back_to_a_full_parse() -> None:
+    doc = parse(REPARSE_CONTENT, incremental=True)
+
+    start = REPARSE_CONTENT.index("[a]") + 1
+    doc.reparse(start, start + 1, "e")
+    assert list(doc) == ["title", "e", "c"]
+
+    start = REPARSE_CONTENT.index("d = 1")
+    doc.reparse(start, start, "[f]\n")
+    assert doc.as_string() == parse(doc.as_string()).as_string()
+    assert doc["f"] == {"d": 1}
+    assert len(doc["c"]) == 2
+
+
+def test_reparse_raises_on_invalid_edits_and_keeps_the_document() -> None:
+    doc = parse(REPARSE_CONTENT, incremental=True)
+
+    start = REPARSE_CONTENT.index("b = 1")
+    with pytest.raises(ParseError) as e:
+        doc.reparse(start, start + 5, "b = ")
+
+    assert e.value.line == 4
+    assert doc.as_string() == REPARSE_CONTENT
+
+    with pytest.raises(ParseError):
+        doc.reparse(0, 0, "a = 1\n")
+
+    assert doc == parse(REPARSE_CONTENT)
+
+
+def test_document_stays_consistent_after_reparse() -> None:
+    doc = parse(REPARSE_CONTENT, incremental=True)
+
+    start = REPARSE_CONTENT.index("d = 2") + 4
+    doc.reparse(start, start + 1, "3")
+    assert dict.__getitem__(doc, "c") == [{"d": 1}, {"d": 3}]
+    assert json.loads(json.dumps(doc))["c"] == [{"d": 1}, {"d": 3}]
+
+    doc.reparse(0, 0, "y = 2\n")
+    expected = parse(doc.as_string())
+    doc["z"] = expected["z"] = 3
+    assert doc.as_string() == expected.as_string()
+
+
+def test_reparse_keeps_the_edits_made_since_parsing() -> None:
+    assert parse(REPARSE_CONTENT)._source is None
+
+    doc = parse(REPARSE_CONTENT, incremental=True)
+    doc["a"]["x"] = 2
+    doc["c"].append({"d": 3})
+
+    # The offsets are those of the rendering of the edited document
+    content = doc.as_string()
+    start = content.index("b = 1") + 4
+    doc.reparse(start, start + 1, "5")
+    assert doc["a"] == {"b": 5, "x": 2}
+    assert doc["c"][2] == {"d": 3}
+    assert doc.as_string() == content.replace("b = 1", "b = 5")
+
+    # Parsed from the edited text, the document is reparsed by chunk again
+    c = doc["c"]
+    start = doc.as_string().index("b = 5") + 4
+    doc.reparse(start, start + 1, "6")
+    assert doc["a"]["b"] == 6
+    assert doc["c"] is c
+
+
+def test_locate_items_of_a_document_parsed_with_positions() -> None:
+    content = """\
+title = "positions"  # comment
+a.b = { c = [1, 2.5] }
+
+[tool . "x"]
+d = 1979-05-27 # date
+
+[[e]]
+f = true
+
+[[e]]
+f = false
+"""
+    doc = parse(content, track_positions=True)
+
+    def text(path: Any, key: bool = False) -> str:
+        span = doc.locate(path, key=key)
+        assert span is not None
+        return content[span[0] : span[1]]
+
+    assert text("title") == '"positions"'
+    assert text("title", key=True) == "title"
+    assert text(["a", "b", "c"]) == "[1, 2.5]"
+    assert text(["a", "b", "c", 1]) == "2.5"
+    assert text(["a", "b"], key=True) == "b"
+    assert text("tool", key=True) == "tool"
+    assert text(["tool", "x"]) == '[tool . "x"]'
+    assert text(["tool", "x"], key=True) == '"x"'
+    assert text(["tool", "x", "d"]) == "1979-05-27"
+    assert text(["e", 1]) == "[[e]]"
+    assert text(["e", 1, "f"]) == "false"
+
+    assert doc.locate("tool") is None
+    assert doc.locate("e") is None
+    with pytest.raises(NonExistentKey):
+        doc.locate(["title", "x"])
+
+    doc["new"] = 1
+    assert doc.locate("new") is None
+    assert parse(content).locate("title") is None
+
+    doc.reparse(0, 0, "\n")
+    assert doc["new"] == 1
+    start = doc.as_string().rindex("false")
+    assert doc.locate(["e", 1, "f"]) == (start, start + 5)
+
+
+def test_removed_items_are_dropped_from_the_body() -> None:
+    content = "".join(f"k{i} = {i}\n" for i in range(40))
+    content += "[a.x]\np = 1\n[b]\nq = 2\n[a.y]\nr = 3\n"
+    doc = parse(content)
+
+    removed = [f"k{i}" for i in range(40) if i % 4]
+    for key in removed:
+        del doc[key]
+
+    nulls = sum(isinstance(v, Null) for _, v in doc.body)
+    assert nulls < Container.COMPACT_THRESHOLD
+    assert len(doc.body) == 13 + nulls
+    assert doc.as_string() == "".join(
+        line
+        for line in content.splitlines(keepends=True)
+        if line.split(" ")[0] not in removed
+    )
+    assert doc["a"] == {"x": {"p": 1}, "y": {"r": 3}}
+    assert doc["k36"] == 36
+
+    doc["a"]["z"] = 1
+    assert parse(doc.as_string()) == doc
+
+
+def test_remove_many() -> None:
+    content = "".join(f"k{i} = {i}\n" for i in range(20)) + "[t]\nx = 1\ny = 2\n"
+    doc = parse(content)
+
+    with pytest.raises(NonExistentKey):
+        doc.remove_many(["k0", "missing"])
+
+    assert doc["k0"] == 0
+
+    doc.remove_many(f"k{i}" for i in range(19))
+    doc["t"].remove_many(["x", "x"])
+
+    assert doc.as_string() == "k19 = 19\n[t]\ny = 2\n"
+    assert not any(isinstance(v, Null) for _, v in doc.body)
+
+
+@pytest.mark.parametrize("count", [3, 20])
+def test_value_added_after_removing_all_values_is_placed_as_in_a_new_table(
+    count: int,
+) -> None:
+    doc = parse("".join(f"k{i} = {i}\n" for i in range(count)) + "[t]\n")
+    doc.remove_many(f"k{i}" for i in range(count))
+    doc["n"] = 0
+
+    # With the blank line added before the first table, as when the document
+    # never had values: the placeholders of the removed values do not change
+    # where it goes, whether or not they have been dropped yet
+    expected = parse("[t]\n")
+    expected["n"] = 0
+    assert doc.as_string() == expected.as_string() == "n = 0\n\n[t]\n"
+
+
+def test_compacting_an_inline_table_keeps_its_commas() -> None:
+    content = "t = {a = 1, b = 2, c = 3, d = 4, e = 5}\n"
+    doc, compacted = parse(content), parse(content)
+    compacted["t"].value.COMPACT_THRESHOLD = 1
+
+    for key in ("e", "a", "d", "b"):
+        del doc["t"][key]
+        del compacted["t"][key]
+
+        assert compacted.as_string() == doc.as_string()
+
+    assert len(compacted["t"].value.body) < len(doc["t"].value.body)
+    assert compacted.as_string() == "t = {  c = 3  }\n"
+
+
+def test_values_added_after_tables_go_before_them() -> None:
+    doc = document()
+    doc["t"] = {"x": 1}
+    for i in range(3):
+        doc[f"k{i}"] = i
+    doc["u"] = {"y": 2}
+    doc["k3"] = 3
+
+    assert doc.as_string() == dedent(
+        """\
+        k0 = 0
+        k1 = 1
+        k2 = 2
+        k3 = 3
+
+        [t]
+        x = 1
+
+        [u]
+        y = 2
+        """
+    )
+    for key, idx in doc._map.items():
+        assert isinstance(idx, int)
+        assert doc.body[idx][0] == key
+
+
+def test_unchanged_document_renders_its_source() -> None:
+    content = "a = 1\n\n[t]\nb = [1, 2]\n\n[[arr]]\nc = {d = 3}\n"
+    doc = parse(content)
+
+    assert doc.as_string() is doc.as_string()
+    assert doc.as_string() == content
+
+
+def test_edits_are_rendered_after_caching() -> None:
+    doc = parse("a = 1\n\n[t]\nb = [1, 2]\nc = {d = {e = 3}}\n\n[u]\nf = 4\n")
+    doc.as_string()
+
+    doc["t"]["b"].append(3)
+    doc["t"]["c"]["d"]["e"] = 5
+    doc["u"]["f"].trivia.comment = "# four"
+    doc["u"]["f"].trivia.comment_ws = " "
+    doc["a"] = 2
+
+    assert doc.as_string() == (
+        "a = 2\n\n[t]\nb = [1, 2, 3]\nc = {d = {e = 5}}\n\n[u]\nf = 4 # four\n"
+    )
+    assert doc.as_string() == parse(doc.as_string()).as_string()
+
+
+def test_array_of_tables_in_inline_table_is_rendered_after_caching() -> None:
+    doc = parse("x = {a.b = 1}\n")
+    doc["x"]["a"]["c"] = [{"q": 1}]
+
+    assert "q = 1" in doc.as_string()
+
+    doc["x"]["a"]["c"][0]["q"] = 2
+
+    assert "q = 2" in doc.as_string()
+
+
+def test_reordered_document_is_rendered_from_its_items() -> None:
+    content = "[[a]]\nx = 1\n[b]\ny = 2\n[[a]]\nx = 3\n"
+    doc = parse(content)
+
+    assert doc.as_string() == "[[a]]\nx = 1\n[[a]]\nx = 3\n[b]\ny = 2\n"
+
+
+def test_iter_render_joins_into_as_string() -> None:
+    doc = parse("a = [1, 2]\n\n[t]\nb = 1\n[t.u]\nc = 2\n\n[[arr]]\nd = [\n  3,\n]\n")
+    doc["t"]["u"]["c"] = 4
+    doc["e"] = [5, 6]
+
+    fragments = list(doc.iter_render())
+
+    assert len(fragments) > 1
+    assert "".join(fragments) == doc.as_string()
+
+
+def test_value_is_cached_until_the_document_changes() -> None:
+    doc = parse(
+        "a = 1\n\n[t]\nb = 2\n\n[[arr]]\nc = 3\n\n[v.x]\nd = 4\n[u]\n[v.y]\ne = 5\n"
+    )
+    value = doc.value
+    hits = Container.value_cache_info().hits
+
+    assert doc.value == value
+    assert Container.value_cache_info().hits == hits + 1
+
+    parse("f = 6\n")["f"] = 7
+    assert doc.value == value
+    assert Container.value_cache_info().hits == hits + 2
+
+    doc["t"]["b"] = 8
+    doc["arr"].append({"c": 9})
+    doc["v"]["x"]["d"] = 10
+
+    assert doc.value == {
+        "a": 1,
+        "t": {"b": 8},
+        "arr": [{"c": 3}, {"c": 9}],
+        "v": {"x": {"d": 10}, "y": {"e": 5}},
+        "u": {},
+    }
+    assert doc.value["t"] == doc["t"].value.value
+
+
+def test_value_can_be_modified() -> None:
+    content = "a = 1\n\n[t]\nx = 2\n\n[u.v]\nw = 3\n\n[[z]]\nq = 4\n"
+    doc = parse(content)
+    expected = {"a": 1, "t": {"x": 2}, "u": {"v": {"w": 3}}, "z": [{"q": 4}]}
+
+    value = doc.value
+    value["a"] = 99
+    value["t"]["y"] = 5
+    value["u"]["v"].clear()
+    value["z"].append({"q": 5})
+
+    assert doc.value == expected
+    assert doc == expected
+    assert doc["t"].value.value == {"x": 2}
+    assert doc.as_string() == content
+
+
+def test_edits_after_a_table_is_added_in_place_are_rendered() -> None:
+    doc = parse("x = { c = { } }\n")
+    doc["x"]["c"]["t"] = {"u": 1}
+    doc.as_string()
+
+    doc["x"]["c"]["t"]["u"] += 5
+
+    assert doc.as_string() == "x = { c = { t = {u = 6}} }\n"
+
+
+def test_view_reads_the_document_as_plain_values() -> None:
+    doc = parse(
+        'a = 1\nb = "c"\nd = 1979-05-27T07:32:00Z\n\n[t]\ne = [1, [2], {f = true}]\n'
+        "\n[[arr]]\ng = 1.5\n\n[v.x]\nh = 1\n[u]\n[v.y]\nh = 2\n"
+    )
+    view = doc.view()
+
+    assert view == doc.unwrap()
+    assert_is_ppo(view["a"], int)
+    assert_is_ppo(view["b"], str)
+    assert_is_ppo(view["d"], datetime)
+    assert_is_ppo(view["t"]["e"][2]["f"], bool)
+    assert_is_ppo(view["arr"][0]["g"], float)
+    assert view["v"] == {"x": {"h": 1}, "y": {"h": 2}}
+    assert "zz" not in view
+    with pytest.raises(KeyError):
+        view["zz"]
+
+    doc["t"]["e"].append(3)
+    assert view["t"]["e"] == [1, [2], {"f": True}, 3]
+    with pytest.raises(TypeError):
+        view["a"] = 2  # type: ignore[index]
+
+
+def test_out_of_order_table_proxy_is_cached_until_a_part_changes() -> None:
+    doc = parse("[a.x]\nb = 1\n\n[c]\n\n[a.y]\nd = 2\n")
+    proxy = doc["a"]
+
+    assert doc["a"] is proxy
+    doc["c"]["e"] = 3
+    assert doc["a"] is proxy
+
+    doc["a"]["x"]["b"] = 4
+    assert doc["a"] is proxy
+    assert doc["a"]["x"]["b"] == 4
+
+    doc["a"]["f"] = 5
+    assert doc["a"] is not proxy
+    assert doc["a"] == {"f": 5, "x": {"b": 4}, "y": {"d": 2}}
+
+
+def test_array_of_tables_in_parts_of_an_out_of_order_table_can_be_changed() -> None:
+    doc = parse("[[a.e]]\nq = 1\n[c]\n[[a.e]]\nq = 2\n")
+
+    doc["a"]["e"].append({"q": 3})
+    assert doc["a"]["e"] == [{"q": 1}, {"q": 2}, {"q": 3}]
+    assert parse(doc.as_string()).unwrap() == doc.unwrap()
+
+    aot = doc["a"]["e"]
+    del aot[0]
+    aot[0] = {"q": 4}
+    aot.insert(0, {"q": 5})
+    assert aot == [{"q": 5}, {"q": 4}, {"q": 3}]
+    assert doc.unwrap() == {"a": {"e": [{"q": 5}, {"q": 4}, {"q": 3}]}, "c": {}}
+    assert parse(doc.as_string()).unwrap() == doc.unwrap()
@@ -1,8 +1,12 @@
 import os
 
 from collections.abc import Callable
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+
+from tomlkit.exceptions import ParseError
 from tomlkit.toml_document import TOMLDocument
 from tomlkit.toml_file import TOMLFile
 
@@ -55,6 +59,22 @@ def test_keep_old_eol_2(tmp_path: Path) -> None:
         assert fh.read() == b"a = 1\nb = 3\n"
 
 
+def test_keep_old_eol_across_chunks(tmp_path: Path) -> None:
+    toml_path = tmp_path / "pyproject.toml"
+    with open(toml_path, "wb+") as fh:
+        fh.write(b'a = 1\r\n\r\n[t]\r\nb = [\r\n  2,\r\n]\r\nc = "d"\r\n')
+
+    toml_f = TOMLFile(toml_path)
+    content = toml_f.read()
+    content["t"]["b"].append(3)
+    toml_f.write(content)
+
+    with open(toml_path, "rb") as fh:
+        assert fh.read() == (
+            b'a = 1\r\n\r\n[t]\r\nb = [\r\n  2,\r\n  3,\r\n]\r\nc = "d"\r\n'
+        )
+
+
 def test_mixed_eol(tmp_path: Path) -> None:
     toml_path = tmp_path / "pyproject.toml"
     with open(toml_path, "wb+") as fh:
@@ -118,3 +138,68 @@ def test_readwrite_eol_windows(tmp_path: Path) -> None:
     toml_f.write(doc)
     readback = toml_f.read()
     assert doc.as_string() == readback.as_string()
+
+
+def test_write_keeps_the_file_if_rendering_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    toml_path = tmp_path / "pyproject.toml"
+    toml_path.write_bytes(b"a = 1\n")
+    toml_f = TOMLFile(toml_path)
+    doc = toml_f.read()
+
+    def iter_render() -> Iterator[str]:
+        yield "b = 2\n"
+        raise ValueError("rendering failed")
+
+    monkeypatch.setattr(doc, "iter_render", iter_render)
+    with pytest.raises(ValueError):
+        toml_f.write(doc)
+
+    assert toml_path.read_bytes() == b"a = 1\n"
+    assert os.listdir(tmp_path) == ["pyproject.toml"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_write_keeps_the_mode_of_the_file(tmp_path: Path) -> None:
+    toml_path = tmp_path / "pyproject.toml"
+    toml_path.write_bytes(b"a = 1\n")
+    toml_path.chmod(0o640)
+    link = tmp_path / "link.toml"
+    link.symlink_to(toml_path)
+
+    doc = TOMLDocument()
+    doc.add("b", 2)
+    TOMLFile(link).write(doc)
+
+    assert link.is_symlink()
+    assert toml_path.read_bytes() == b"b = 2" + os.linesep.encode()
+    assert toml_path.stat().st_mode & 0o777 == 0o640
+
+
+def test_read_file_with_byte_order_mark(tmp_path: Path) -> None:
+    toml_path = tmp_path / "pyproject.toml"
+    toml_path.write_bytes(b"\xef\xbb\xbfa = 1\r\nb = 2\r\n")
+
+    toml_f = TOMLFile(toml_path)
+    doc = toml_f.read()
+
+    assert doc.as_string() == "a = 1\nb = 2\n"
+    assert toml_f._linesep == "\r\n"
+
+
+def test_validate_file(tmp_path: Path) -> None:
+    toml_path = tmp_path / "pyproject.toml"
+    toml_path.write_bytes(b"a = 1\r\n[b]\r\nc = 2\r\n")
+
+    assert TOMLFile(toml_path).validate() == []
+
+    toml_path.write_bytes(b"a = 1\r\n[b]\r\nc = 2\r\n[b]\r\nd = \r\n")
+    errors = TOMLFile(toml_path).validate(all_errors=True)
+
+    assert [(e.line, e.col) for e in errors if isinstance(e, ParseError)] == [(5, 4)]
+    assert len(errors) == 1
+
+    toml_path.write_bytes(b'a = "\xe9"\n')
+
+    assert TOMLFile(toml_path).validate() == []
@@ -1,9 +1,10 @@
+from __future__ import annotations
+
 from datetime import date
 from datetime import datetime as dt
 from datetime import time
 from datetime import timedelta as td
 from datetime import timezone as tz
-from typing import Union
 
 import pytest
 
@@ -35,12 +36,12 @@ from tomlkit._utils import parse_rfc3339
         ),
     ],
 )
-def test_parse_rfc3339_datetime(string: str, expected: Union[dt, date, time]) -> None:
+def test_parse_rfc3339_datetime(string: str, expected: dt | date | time) -> None:
     assert parse_rfc3339(string) == expected
 
 
 @pytest.mark.parametrize("string, expected", [("1979-05-27", date(1979, 5, 27))])
-def test_parse_rfc3339_date(string: str, expected: Union[dt, date, time]) -> None:
+def test_parse_rfc3339_date(string: str, expected: dt | date | time) -> None:
     assert parse_rfc3339(string) == expected
 
 
@@ -48,5 +49,55 @@ def test_parse_rfc3339_date(string: str, expected: Union[dt, date, time]) -> Non
     "string, expected",
     [("12:34:56", time(12, 34, 56)), ("12:34:56.123456", time(12, 34, 56, 123456))],
 )
-def test_parse_rfc3339_time(string: str, expected: Union[dt, date, time]) -> None:
+def test_parse_rfc3339_time(string: str, expected: dt | date | time) -> None:
     assert parse_rfc3339(string) == expected
+
+
+@pytest.mark.parametrize(
+    "string, expected",
+    [
+        ("1979-05-27t07:32:00z", dt(1979, 5, 27, 7, 32, 0, tzinfo=_utc)),
+        ("1979-05-27 07:32", dt(1979, 5, 27, 7, 32, 0)),
+        ("07:32:00.1234567890", time(7, 32, 0, 123456)),
+        (
+            "1979-05-27T07:32:00.5+05:30",
+            dt(1979, 5, 27, 7, 32, 0, 500000, tz(td(hours=5, minutes=30), "+05:30")),
+        ),
+    ],
+)
+def test_parse_rfc3339_forms(string: str, expected: dt | date | time) -> None:
+    value = parse_rfc3339(string)
+
+    assert value == expected
+    if isinstance(value, dt) and isinstance(expected, dt):
+        assert value.tzname() == expected.tzname()
+
+
+@pytest.mark.parametrize(
+    "string",
+    [
+        "1979-05-27T24:00:00",
+        "24:00:00",
+        "1979-05-27T07:32:00+01:60",
+        "1979-05-27T07:32:00+24:00",
+        "1979-05-27T07:32:00+0100",
+        "1979-05-27T07:32:00,5",
+        "1979-13-27",
+    ],
+)
+def test_parse_rfc3339_invalid(string: str) -> None:
+    with pytest.raises(ValueError):
+        parse_rfc3339(string)
+
+
+def test_parse_rfc3339_is_cached() -> None:
+    parse_rfc3339.cache_clear()
+    first = parse_rfc3339("1979-05-27T07:32:00-07:00")
+    second = parse_rfc3339("1979-05-27T07:32:00-07:00")
+    other = parse_rfc3339("1979-05-28T07:32:00-07:00")
+
+    assert isinstance(first, dt)
+    assert isinstance(other, dt)
+    assert second is first
+    assert other.tzinfo is first.tzinfo
+    assert parse_rfc3339.cache_info()[:2] == (1, 2)
@@ -12,6 +12,7 @@ from tomlkit.api import float_
 from tomlkit.api import inline_table
 from tomlkit.api import integer
 from tomlkit.api import item
+from tomlkit.api import iterparse
 from tomlkit.api import key
 from tomlkit.api import key_value
 from tomlkit.api import load
@@ -23,6 +24,7 @@ from tomlkit.api import string
 from tomlkit.api import table
 from tomlkit.api import time
 from tomlkit.api import unregister_encoder
+from tomlkit.api import validate
 from tomlkit.api import value
 from tomlkit.api import ws
 
@@ -43,6 +45,7 @@ __all__ = [
     "inline_table",
     "integer",
     "item",
+    "iterparse",
     "key",
     "key_value",
     "load",
@@ -54,6 +57,7 @@ __all__ = [
     "table",
     "time",
     "unregister_encoder",
+    "validate",
     "value",
     "ws",
 ]
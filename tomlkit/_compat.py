@@ -5,6 +5,7 @@ import sys
 
 
 PY38 = sys.version_info >= (3, 8)
+PY311 = sys.version_info >= (3, 11)
 
 
 def decode(string: str | bytes, encodings: list[str] | None = None) -> str:
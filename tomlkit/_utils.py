@@ -9,8 +9,11 @@ from datetime import datetime
 from datetime import time
 from datetime import timedelta
 from datetime import timezone
+from functools import cache
+from functools import lru_cache
 from typing import Any
 
+from tomlkit._compat import PY311
 from tomlkit._compat import decode
 
 
@@ -45,7 +48,18 @@ RFC_3339_TIME = re.compile(
 _utc = timezone(timedelta(), "UTC")
 
 
+@lru_cache(maxsize=4096)
 def parse_rfc3339(string: str) -> datetime | date | time:
+    """
+    Parses an RFC 3339 datetime, date or time.
+
+    Results are cached on the text, as documents tend to repeat the same
+    values: ``parse_rfc3339.cache_info()`` reports the hit rate.
+    """
+    shape = _ISOFORMAT_SHAPES.get(string.translate(_DIGITS))
+    if shape is not None:
+        return _parse_isoformat(string, *shape)
+
     m = RFC_3339_DATETIME.match(string)
     if m:
         year = int(m.group("year"))
@@ -60,21 +74,15 @@ def parse_rfc3339(string: str) -> datetime | date | time:
             microsecond = int((f"{m.group('fraction'):<06s}")[:6])
 
         if m.group("tz"):
-            # Timezone
-            tz = m.group("tz")
-            if tz.upper() == "Z":
-                tzinfo = _utc
-            else:
-                sign = tz[0]
-                hour_offset, minute_offset = map(int, tz[1:].split(":"))
-                offset = timedelta(seconds=hour_offset * 3600 + minute_offset * 60)
-                if sign == "-":
-                    offset = -offset
-
-                tzinfo = timezone(offset, tz)
-
             return datetime(
-                year, month, day, hour, minute, second, microsecond, tzinfo=tzinfo
+                year,
+                month,
+                day,
+                hour,
+                minute,
+                second,
+                microsecond,
+                tzinfo=_timezone(m.group("tz")),
             )
         else:
             return datetime(year, month, day, hour, minute, second, microsecond)
@@ -102,6 +110,60 @@ def parse_rfc3339(string: str) -> datetime | date | time:
     raise ValueError("Invalid RFC 3339 string")
 
 
+@cache
+def _timezone(tz: str) -> timezone:
+    # There are at most 2 * 24 * 60 valid offsets
+    if tz.upper() == "Z":
+        return _utc
+
+    sign = tz[0]
+    hour_offset, minute_offset = map(int, tz[1:].split(":"))
+    if hour_offset > 23 or minute_offset > 59:
+        raise ValueError("Invalid RFC 3339 string")
+
+    offset = timedelta(seconds=hour_offset * 3600 + minute_offset * 60)
+    if sign == "-":
+        offset = -offset
+
+    return timezone(offset, tz)
+
+
+def _parse_isoformat(
+    string: str, kind: type[datetime | date | time], tz_length: int
+) -> datetime | date | time:
+    if kind is not date:
+        # Newer versions of fromisoformat() accept 24:00, RFC 3339 does not
+        hour = string[11:13] if kind is datetime else string[:2]
+        if hour > "23":
+            raise ValueError("Invalid RFC 3339 string")
+
+    if not tz_length:
+        return kind.fromisoformat(string)
+
+    value = datetime.fromisoformat(string[:-tz_length])
+
+    return value.replace(tzinfo=_timezone(string[-tz_length:]))
+
+
+_DIGITS = str.maketrans("123456789", "000000000")
+
+# Since Python 3.11, fromisoformat() parses the RFC 3339 forms allowed in
+# TOML, and a few others: it is only given strings of one of these shapes
+# (with digits replaced by 0), mapped to the type to parse and the length
+# of their offset. The other ones go through the regular expressions.
+_ISOFORMAT_SHAPES: dict[str, tuple[type[datetime | date | time], int]] = {}
+if PY311:
+    _ISOFORMAT_SHAPES["0000-00-00"] = (date, 0)
+    for _time in ["00:00", "00:00:00", *(f"00:00:00.{'0' * n}" for n in range(1, 10))]:
+        _ISOFORMAT_SHAPES[_time] = (time, 0)
+        for _tz in ["", "Z", "+00:00", "-00:00"]:
+            for _sep in "T ":
+                _ISOFORMAT_SHAPES[f"0000-00-00{_sep}{_time}{_tz}"] = (
+                    datetime,
+                    len(_tz),
+                )
+
+
 # https://toml.io/en/v1.0.0#string
 CONTROL_CHARS = frozenset(chr(c) for c in range(0x20)) | {chr(0x7F)}
 _escaped = {
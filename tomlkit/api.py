@@ -4,14 +4,18 @@ import contextlib
 import datetime as _datetime
 
 from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
 from typing import IO
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Literal
 from typing import TypeVar
+from typing import overload
 
 from tomlkit._utils import parse_rfc3339
 from tomlkit.container import Container
+from tomlkit.exceptions import TOMLKitError
 from tomlkit.exceptions import UnexpectedCharError
 from tomlkit.items import CUSTOM_ENCODERS
 from tomlkit.items import AoT
@@ -34,23 +38,91 @@ from tomlkit.items import Time
 from tomlkit.items import Trivia
 from tomlkit.items import Whitespace
 from tomlkit.items import item as item
+from tomlkit.parser import Event
 from tomlkit.parser import Parser
+from tomlkit.parser import parse_lines
+from tomlkit.parser import parse_parallel
+from tomlkit.parser import parse_values_lines
+from tomlkit.parser import split_units
+from tomlkit.parser import validate_lines
+from tomlkit.source import iter_lines
 from tomlkit.toml_document import TOMLDocument as TOMLDocument
 
 
 if TYPE_CHECKING:
+    from mmap import mmap
+
     from tomlkit.items import Encoder
 
     E = TypeVar("E", bound=Encoder)
 
+    # Text, or UTF-8 encoded bytes in any of these buffers
+    _Input = str | bytes | bytearray | memoryview | mmap
+
+
+@overload
+def loads(
+    string: _Input,
+    *,
+    preserve: Literal[True] = ...,
+    lazy: bool = ...,
+    track_positions: bool = ...,
+    incremental: bool = ...,
+    workers: int | None = ...,
+    max_depth: int | None = ...,
+) -> TOMLDocument: ...
+
+
+@overload
+def loads(
+    string: _Input,
+    *,
+    preserve: Literal[False],
+    lazy: bool = ...,
+    track_positions: bool = ...,
+    incremental: bool = ...,
+    workers: int | None = ...,
+    max_depth: int | None = ...,
+) -> dict[str, Any]: ...
+
+
+@overload
+def loads(
+    string: _Input,
+    *,
+    preserve: bool = ...,
+    lazy: bool = ...,
+    track_positions: bool = ...,
+    incremental: bool = ...,
+    workers: int | None = ...,
+    max_depth: int | None = ...,
+) -> TOMLDocument | dict[str, Any]: ...
+
 
-def loads(string: str | bytes) -> TOMLDocument:
+def loads(
+    string: _Input,
+    *,
+    preserve: bool = True,
+    lazy: bool = False,
+    track_positions: bool = False,
+    incremental: bool = False,
+    workers: int | None = None,
+    max_depth: int | None = None,
+) -> TOMLDocument | dict[str, Any]:
     """
     Parses a string into a TOMLDocument.
 
     Alias for parse().
     """
-    return parse(string)
+    return parse(
+        string,
+        preserve=preserve,
+        lazy=lazy,
+        track_positions=track_positions,
+        incremental=incremental,
+        workers=workers,
+        max_depth=max_depth,
+    )
 
 
 def dumps(data: Mapping[str, Any], sort_keys: bool = False) -> str:
@@ -77,11 +149,106 @@ def dumps(data: Mapping[str, Any], sort_keys: bool = False) -> str:
         raise TypeError(msg) from ex
 
 
-def load(fp: IO[str] | IO[bytes]) -> TOMLDocument:
+@overload
+def load(
+    fp: IO[str] | IO[bytes],
+    *,
+    preserve: Literal[True] = ...,
+    lazy: bool = ...,
+    track_positions: bool = ...,
+    incremental: bool = ...,
+    workers: int | None = ...,
+    max_depth: int | None = ...,
+) -> TOMLDocument: ...
+
+
+@overload
+def load(
+    fp: IO[str] | IO[bytes],
+    *,
+    preserve: Literal[False],
+    lazy: bool = ...,
+    track_positions: bool = ...,
+    incremental: bool = ...,
+    workers: int | None = ...,
+    max_depth: int | None = ...,
+) -> dict[str, Any]: ...
+
+
+@overload
+def load(
+    fp: IO[str] | IO[bytes],
+    *,
+    preserve: bool = ...,
+    lazy: bool = ...,
+    track_positions: bool = ...,
+    incremental: bool = ...,
+    workers: int | None = ...,
+    max_depth: int | None = ...,
+) -> TOMLDocument | dict[str, Any]: ...
+
+
+def load(
+    fp: IO[str] | IO[bytes],
+    *,
+    preserve: bool = True,
+    lazy: bool = False,
+    track_positions: bool = False,
+    incremental: bool = False,
+    workers: int | None = None,
+    max_depth: int | None = None,
+) -> TOMLDocument | dict[str, Any]:
     """
     Load toml document from a file-like object.
+
+    Seekable files are read and parsed one top-level table at a time, so
+    their whole text is never held in memory at once, only the resulting
+    document. Other file-like objects, and files parsed with ``lazy``,
+    ``track_positions``, ``incremental`` or ``workers``, are read in one go.
+    The options are those of :func:`parse`.
     """
-    return parse(fp.read())
+
+    def parse_all() -> TOMLDocument | dict[str, Any]:
+        return parse(
+            fp.read(),
+            preserve=preserve,
+            lazy=lazy,
+            track_positions=track_positions,
+            incremental=incremental,
+            workers=workers,
+            max_depth=max_depth,
+        )
+
+    seekable = getattr(fp, "seekable", None)
+    tell = getattr(fp, "tell", None)
+    if (
+        lazy
+        or track_positions
+        or incremental
+        or (workers is not None and workers > 1)
+        or seekable is None
+        or tell is None
+        or not seekable()
+    ):
+        return parse_all()
+
+    start = tell()
+    try:
+        if not preserve:
+            values = parse_values_lines(iter_lines(fp), max_depth)
+            if values is not None:
+                return values
+
+            # Left to the regular parse, from the start
+            fp.seek(start)
+
+        doc = parse_lines(iter_lines(fp), preserve=preserve, max_depth=max_depth)
+    except UnicodeDecodeError:
+        # Not UTF-8: fall back to the encodings tried by parse()
+        fp.seek(start)
+        return parse_all()
+
+    return doc if preserve else doc.unwrap()
 
 
 def dump(data: Mapping[str, Any], fp: IO[str], *, sort_keys: bool = False) -> None:
@@ -96,14 +263,213 @@ def dump(data: Mapping[str, Any], fp: IO[str], *, sort_keys: bool = False) -> No
     >>> with open("output.toml", "w") as fp:
     ...     tomlkit.dump(data, fp)
     """
+    if isinstance(data, Container) and not sort_keys:
+        # Written as it is rendered, rather than built in full first
+        for chunk in data.iter_render():
+            fp.write(chunk)
+        return
+
     fp.write(dumps(data, sort_keys=sort_keys))
 
 
-def parse(string: str | bytes) -> TOMLDocument:
+@overload
+def parse(
+    string: _Input,
+    *,
+    preserve: Literal[True] = ...,
+    lazy: bool = ...,
+    track_positions: bool = ...,
+    incremental: bool = ...,
+    workers: int | None = ...,
+    max_depth: int | None = ...,
+) -> TOMLDocument: ...
+
+
+@overload
+def parse(
+    string: _Input,
+    *,
+    preserve: Literal[False],
+    lazy: bool = ...,
+    track_positions: bool = ...,
+    incremental: bool = ...,
+    workers: int | None = ...,
+    max_depth: int | None = ...,
+) -> dict[str, Any]: ...
+
+
+@overload
+def parse(
+    string: _Input,
+    *,
+    preserve: bool = ...,
+    lazy: bool = ...,
+    track_positions: bool = ...,
+    incremental: bool = ...,
+    workers: int | None = ...,
+    max_depth: int | None = ...,
+) -> TOMLDocument | dict[str, Any]: ...
+
+
+def parse(
+    string: _Input,
+    *,
+    preserve: bool = True,
+    lazy: bool = False,
+    track_positions: bool = False,
+    incremental: bool = False,
+    workers: int | None = None,
+    max_depth: int | None = None,
+) -> TOMLDocument | dict[str, Any]:
     """
     Parses a string or bytes into a TOMLDocument.
+
+    Bytes-like objects other than ``bytes``, such as a ``memoryview`` or a
+    ``mmap`` of a file, are decoded and parsed one top-level table at a time,
+    so that their whole text is never in memory next to them. Input that is
+    not valid UTF-8 is decoded as a whole, as for ``bytes``. A leading byte
+    order mark is ignored.
+
+    :param preserve: if false, only the values are kept and a plain ``dict``
+        is returned, as ``parse(string).unwrap()`` would. Usual documents
+        are read straight into dicts, lists and scalars, without building
+        the items that keep their whitespace and comments.
+    :param lazy: if true, only the table headers are parsed up front and the
+        content of each top-level table is parsed when the table is first
+        accessed, so syntax errors in it are only raised then. Tables that
+        are never accessed are rendered from the original text.
+    :param track_positions: if true, the offsets of every key, value and
+        table header in ``string`` are recorded, to be looked up with
+        :meth:`TOMLDocument.locate`. Ignored when ``preserve`` is false.
+    :param incremental: if true, ``string`` is kept along with the offsets of
+        its top-level tables, so that :meth:`TOMLDocument.reparse` only
+        parses again the table an edit falls in. Ignored when ``preserve``
+        is false.
+    :param workers: if greater than 1, the top-level tables are parsed in
+        that many processes, for documents made of many tables. Ignored when
+        ``lazy``, ``track_positions`` or ``incremental`` is true.
+    :param max_depth: how deep arrays, inline tables and dotted keys may be
+        nested, :attr:`Parser.MAX_NESTING_DEPTH` by default. A ``ParseError``
+        is raised for values and keys nested deeper.
+
+    :Example:
+
+    >>> parse('a = 1  # comment', preserve=False)
+    {'a': 1}
+    """
+    if (
+        workers is not None
+        and workers > 1
+        and not (lazy or track_positions or incremental)
+    ):
+        if not isinstance(string, (str, bytes)):
+            string = bytes(string)
+
+        doc = parse_parallel(string, workers, preserve=preserve, max_depth=max_depth)
+
+        return doc if preserve else doc.unwrap()
+
+    if not isinstance(string, (str, bytes)):
+        if not (lazy or track_positions or incremental):
+            lines = iter_lines(string)
+            try:
+                if not preserve:
+                    values = parse_values_lines(lines, max_depth)
+                    if values is not None:
+                        return values
+
+                    # Left to the regular parse, from the start
+                    lines.close()
+                    lines = iter_lines(string)
+
+                doc = parse_lines(lines, preserve=preserve, max_depth=max_depth)
+            except UnicodeDecodeError:
+                pass
+            else:
+                return doc if preserve else doc.unwrap()
+            finally:
+                # Releases the buffer if parsing failed
+                lines.close()
+
+        string = bytes(string)
+
+    parser = Parser(string, max_depth=max_depth)
+    if not preserve:
+        return parser.parse_values()
+
+    return parser.parse(
+        lazy=lazy, track_positions=track_positions, incremental=incremental
+    )
+
+
+def iterparse(source: str | bytes | IO[str] | IO[bytes]) -> Iterator[Event]:
     """
-    return Parser(string).parse()
+    Parses a string, bytes or file-like object into a stream of events,
+    without building a TOMLDocument.
+
+    Each event has a ``kind`` (``"table_header"``, ``"aot_header"``,
+    ``"key_value"``, ``"comment"`` or ``"whitespace"``), the key ``path`` it
+    belongs to, its ``start`` and ``end`` offsets in the source and, except
+    for headers, the parsed ``value`` item. Files are read one top-level
+    table at a time. Only the syntax is checked: redefined keys or tables
+    are not detected.
+
+    :Example:
+
+    >>> [e.path for e in iterparse('[[package]]\nname = "a"\n') if e.kind == "key_value"]
+    [('package', 'name')]
+    """
+    if isinstance(source, (str, bytes)):
+        yield from Parser(source).iter_events()
+        return
+
+    offset = 0
+    for unit in split_units(iter_lines(source)):
+        yield from Parser(unit.text, unit.line_offset).iter_events(offset)
+        offset += len(unit.text)
+
+
+def validate(
+    source: str | bytes | IO[str] | IO[bytes], *, all_errors: bool = False
+) -> list[TOMLKitError]:
+    """
+    Checks that a string, bytes or file-like object is a valid TOML document,
+    without building a TOMLDocument.
+
+    The input goes through the same checks as with :func:`parse`, including
+    redefined keys and tables, but whitespace and comments are dropped, and
+    it is read one top-level table at a time as by :func:`load`.
+
+    Returns the first error found, or an empty list if the document is valid.
+    The errors are those :func:`parse` would raise, at the same positions.
+
+    :param all_errors: if true, the first error of each top-level table (or
+        array of tables element) is returned: checking goes on with the next
+        table.
+
+    :Example:
+
+    >>> [str(e) for e in validate('a = 1\\na = 2\\n')]
+    ['Key "a" already exists. at line 2 col 0']
+    """
+    start = None
+    if not isinstance(source, (str, bytes)) and source.seekable():
+        start = source.tell()
+
+    try:
+        return validate_lines(iter_lines(source), all_errors)
+    except UnicodeDecodeError:
+        text: str | bytes
+        if isinstance(source, (str, bytes)):
+            text = source
+        elif start is not None:
+            source.seek(start)
+            text = source.read()
+        else:
+            raise
+
+        # Not UTF-8: fall back to the encodings tried by parse()
+        return validate_lines(iter_lines(Parser(text)._src), all_errors)
 
 
 def document() -> TOMLDocument:
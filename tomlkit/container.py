@@ -2,10 +2,18 @@ from __future__ import annotations
 
 import copy
 import math
+import threading
 
+from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from itertools import count
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import NamedTuple
+from typing import overload
 
 
 if TYPE_CHECKING:
@@ -17,7 +25,9 @@ from tomlkit._utils import merge_dicts
 from tomlkit.exceptions import KeyAlreadyPresent
 from tomlkit.exceptions import NonExistentKey
 from tomlkit.exceptions import TOMLKitError
+from tomlkit.items import AbstractTable
 from tomlkit.items import AoT
+from tomlkit.items import Array
 from tomlkit.items import Comment
 from tomlkit.items import Item
 from tomlkit.items import Key
@@ -26,10 +36,62 @@ from tomlkit.items import SingleKey
 from tomlkit.items import Table
 from tomlkit.items import Trivia
 from tomlkit.items import Whitespace
+from tomlkit.items import _record_edit
 from tomlkit.items import item as _item
 
 
 _NOT_SET = object()
+# The numbers Container._changes is set to, see there
+_CHANGES = count(1)
+# Guards the statistics of Container.value, see value_cache_info()
+_VALUE_STATS_LOCK = threading.Lock()
+
+
+class _Rendering(NamedTuple):
+    """The text a container rendered, and what it was rendered from"""
+
+    # What the container was rendered as (a document, a table or an element
+    # of an array of tables) and under which name
+    args: tuple[Any, ...]
+    # Item._edits at the time
+    edits: int
+    # The container and the containers of the tables in it, with their
+    # version at the time (None for tables not loaded yet)
+    parts: list[tuple[Container, int]]
+    text: str
+
+
+class _Value(NamedTuple):
+    """The value a container computed, and what it was computed from"""
+
+    # Container._changes and Item._edits at the time
+    changes: int
+    edits: int
+    # The container and the containers of the tables in it, with their
+    # version at the time
+    parts: list[tuple[Container, int]]
+    value: dict[str, Any]
+
+
+class _Proxy(NamedTuple):
+    """The proxy merging an out-of-order table, and what it was made from"""
+
+    # The indices of the parts of the table in the body
+    indices: tuple[int, ...]
+    # Container._changes and Item._edits at the time
+    changes: int
+    edits: int
+    # The container and the containers of the parts, with their version at
+    # the time
+    parts: list[tuple[Container, int]]
+    proxy: OutOfOrderTableProxy
+
+
+class _ValueCacheInfo(NamedTuple):
+    """Statistics of the cache of Container.value, see value_cache_info()"""
+
+    hits: int
+    misses: int
 
 
 class Container(_CustomDict):  # type: ignore[type-arg]
@@ -39,6 +101,26 @@ class Container(_CustomDict):  # type: ignore[type-arg]
     This class implements the `dict` interface with copy/deepcopy protocol.
     """
 
+    # Removed items leave a Null placeholder in the body, so that the indices
+    # of the items after them stay valid. The placeholders are dropped once
+    # there are this many, and more of them than keys.
+    COMPACT_THRESHOLD = 16
+
+    # Whether the container belongs to an item whose text a container cached,
+    # such as an inline table, see Item._cached
+    _cached = False
+    # Whether items were merged into others while parsing, so that they render
+    # in another order than they were parsed in
+    _reordered = False
+    # Set to a new number on every change to the body of any container, so
+    # that a cached value can tell at once that nothing changed since. Taking
+    # the next number is atomic, unlike incrementing, so changes made in
+    # several threads at once cannot end up with the same number.
+    _changes = 0
+    # Lookups of the cached values of containers, see value_cache_info()
+    _value_hits = 0
+    _value_misses = 0
+
     def __init__(self, parsed: bool = False) -> None:
         self._map: dict[Key, int | tuple[int, ...]] = {}
         self._body: list[tuple[Key | None, Item]] = []
@@ -53,6 +135,18 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         # out-of-order tables doesn't have to scan every key in the map;
         # stale entries are filtered by the per-key isinstance check
         self._out_of_order_keys: set[Key] = set()
+        # number of Null placeholders in the body, see _compact()
+        self._dead = 0
+        # where values go before the first table, while the body is unchanged,
+        # see _get_last_index_before_table()
+        self._values_end: int | None = None
+        # incremented on every change to the body, so that the renderings
+        # made of the items can tell whether they are still current
+        self._version = 0
+        self._rendered: _Rendering | None = None
+        self._value: _Value | None = None
+        # the proxies of the out-of-order tables, see _out_of_order_table()
+        self._proxies: dict[Key, _Proxy] = {}
 
     @property
     def body(self) -> list[tuple[Key | None, Item]]:
@@ -67,11 +161,11 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         # rebuilds a SingleKey from the bare string on every key only to throw
         # it away. Out-of-order keys (a tuple index) still go through
         # OutOfOrderTableProxy so their validation (and fragment merge) runs
-        # exactly as before. _map iterates in the same insertion order as the
-        # old self.items().
+        # as before, once until their parts change. _map iterates in the same
+        # insertion order as the old self.items().
         for key, idx in self._map.items():
             if isinstance(idx, tuple):
-                value: Any = OutOfOrderTableProxy(self, idx)
+                value: Any = self._out_of_order_table(key, idx)
             else:
                 value = self._body[idx][1]
             unwrapped[key.key] = value.unwrap() if hasattr(value, "unwrap") else value
@@ -80,8 +174,38 @@ class Container(_CustomDict):  # type: ignore[type-arg]
 
     @property
     def value(self) -> dict[str, Any]:
-        """The wrapped dict value"""
+        """
+        The wrapped dict value.
+
+        It is copied from a value computed once and cached until the
+        container or the tables in it change, see :meth:`value_cache_info`:
+        its dicts and lists can be modified without changing the container
+        or the values it returns later.
+        """
+        return {k: _copy_plain(v) for k, v in self._cached_value().items()}
+
+    def _cached_value(self) -> dict[str, Any]:
+        """
+        Returns the value of the container, which is cached, hence must not
+        be modified.
+        """
+        cached = self._value
+        if cached is not None and cached.edits == Item._edits:
+            if cached.changes == Container._changes:
+                _count_value_lookup(hit=True)
+                return cached.value
+
+            if all(c._version == version for c, version in cached.parts):
+                # Only other containers changed since
+                self._value = cached._replace(changes=Container._changes)
+                _count_value_lookup(hit=True)
+                return cached.value
+
+        _count_value_lookup(hit=False)
+        changes = Container._changes
+        parts: list[tuple[Container, int]] = [(self, self._version)]
         d: dict[str, Any] = {}
+        merged: set[str] = set()
         for k, v in self._body:
             if k is None:
                 continue
@@ -90,25 +214,76 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             val: Any = v.value
 
             if isinstance(val, Container):
-                val = val.value
+                table = val
+                val = table._cached_value()
+                assert table._value is not None
+                parts += table._value.parts
+            elif isinstance(v, AoT):
+                # Its list of tables is built along with the value: editing
+                # it must count as an edit of a cached item
+                v._cached = True
 
             if key_str in d:
-                merge_dicts(d[key_str], val)
+                # The values of tables are cached in them, so merged copies
+                if key_str not in merged:
+                    d[key_str] = _copy_plain(d[key_str])
+                    merged.add(key_str)
+
+                merge_dicts(d[key_str], _copy_plain(val))
             else:
                 d[key_str] = val
 
+        self._value = _Value(changes, Item._edits, parts, d)
+
         return d
 
+    def view(self) -> ContainerView:
+        """
+        Returns a read-only mapping over the container, for reading it as
+        plain Python objects without copying it as :meth:`unwrap` does.
+
+        Tables and arrays are looked up as views of their own, and other
+        values as plain ``int``, ``str``, ``datetime``... objects, when they
+        are accessed. The views reflect later changes to the container.
+
+        :Example:
+
+        >>> doc = parse('[a]\nb = [1, 2]\n')
+        >>> view = doc.view()
+        >>> type(view["a"]["b"][0])
+        <class 'int'>
+        """
+        return ContainerView(self)
+
+    @classmethod
+    def value_cache_info(cls) -> _ValueCacheInfo:
+        """
+        Returns how many times the :attr:`value` of a container was looked up
+        from its cache (hits) or computed (misses), across all containers.
+        """
+        with _VALUE_STATS_LOCK:
+            return _ValueCacheInfo(Container._value_hits, Container._value_misses)
+
+    def _changed(self) -> None:
+        """Records a change to the body"""
+        self._values_end = None
+        self._version += 1
+        Container._changes = next(_CHANGES)
+        if self._cached:
+            self._cached = False
+            _record_edit()
+
     def parsing(self, parsing: bool) -> None:
         self._parsed = parsing
         self._validation_cache.clear()
+        self._changed()
 
         for _, v in self._body:
             if isinstance(v, Table):
-                v.value.parsing(parsing)
+                v._container.parsing(parsing)
             elif isinstance(v, AoT):
                 for t in v.body:
-                    t.value.parsing(parsing)
+                    t._container.parsing(parsing)
 
     def add(self, key: Key | Item | str, item: Any = None) -> Container:
         """
@@ -151,7 +326,14 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         return
 
     def _get_last_index_before_table(self) -> int:
+        if self._values_end is not None:
+            return self._values_end
+
         last_index = -1
+        # Whether dotted tables render a header depends on their children,
+        # which change without this container knowing: the result is only
+        # kept when there are none
+        cache = True
         for i, (k, v) in enumerate(self._body):
             if isinstance(v, Null):
                 continue  # Null elements are inserted after deletion
@@ -162,18 +344,19 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             if isinstance(v, (Table, AoT)) and k is not None and not k.is_dotted():
                 break
 
-            if (
-                isinstance(v, Table)
-                and k is not None
-                and k.is_dotted()
-                and self._renders_table_header(v)
-            ):
-                # A dotted-key super table renders inline (`a.b = 1`) only as
-                # long as none of its children render a `[table]` header; once
-                # one does, anything appended after it would land inside that
-                # table's scope.
-                break
+            if isinstance(v, Table) and k is not None and k.is_dotted():
+                cache = False
+                if self._renders_table_header(v):
+                    # A dotted-key super table renders inline (`a.b = 1`) only
+                    # as long as none of its children render a `[table]`
+                    # header; once one does, anything appended after it would
+                    # land inside that table's scope.
+                    break
             last_index = i
+
+        if cache:
+            self._values_end = last_index + 1
+
         return last_index + 1
 
     def _renders_table_header(self, table: Table) -> bool:
@@ -240,14 +423,16 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             assert isinstance(key, Key)
             item.name = key.key
 
-        prev = self._previous_item()
-        prev_ws = isinstance(prev, Whitespace) or ends_with_whitespace(prev)
         if isinstance(item, Table):
             if not self._parsed:
                 item.invalidate_display_name()
             if (
                 self._body
-                and not (self._parsed or item.trivia.indent or prev_ws)
+                and not (
+                    self._parsed
+                    or item.trivia.indent
+                    or self._previous_ends_with_whitespace()
+                )
                 and key is not None
                 and not key.is_dotted()
             ):
@@ -255,7 +440,9 @@ class Container(_CustomDict):  # type: ignore[type-arg]
 
         if isinstance(item, AoT) and self._body and not self._parsed:
             item.invalidate_display_name()
-            if item and not ("\n" in item[0].trivia.indent or prev_ws):
+            if item and not (
+                "\n" in item[0].trivia.indent or self._previous_ends_with_whitespace()
+            ):
                 item[0].trivia.indent = "\n" + item[0].trivia.indent
 
         if key is not None and key in self:
@@ -274,6 +461,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
                 if item.is_aot_element():
                     # New AoT element found later on
                     # Adding it to the current AoT
+                    self._merging_into(current_body_element)
                     if not isinstance(current, AoT):
                         current = AoT([current, item], parsed=self._parsed)
 
@@ -290,6 +478,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
                             # unrelated tables in between) extends the last element
                             # of the array, per the TOML spec.
                             last = current[-1]
+                            self._merging_into(current_body_element)
                             for k, v in item.value.body:
                                 last.value.append(k, v)
 
@@ -297,6 +486,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
                         # Tried to define a table after an AoT with the same name.
                         raise KeyAlreadyPresent(key)
 
+                    self._merging_into(current_body_element)
                     current.append(item)
 
                     return self
@@ -334,6 +524,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
                         # Mutating in place is O(1) per merge. The defensive copy
                         # that protected the out-of-order validation pass has been
                         # moved into OutOfOrderTableProxy (its only consumer).
+                        self._merging_into(current_body_element)
                         for k, v in item.value.body:
                             current.append(k, v)
 
@@ -366,6 +557,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
                     # Tried to define an AoT after a table with the same name.
                     raise KeyAlreadyPresent(key)
 
+                self._merging_into(current_body_element)
                 for table in item.body:
                     current.append(table)
 
@@ -374,6 +566,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
                 raise KeyAlreadyPresent(key)
 
         is_table = isinstance(item, (Table, AoT))
+        cached = False
         if (
             key is not None
             and self._body
@@ -385,6 +578,13 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             # item that is not a table and insert after it
             # If no such item exists, insert at the top of the table
             last_index = self._get_last_index_before_table()
+            cached = self._values_end is not None and not is_table
+            # Go past the placeholders of removed items, as if they had been
+            # dropped already (see _compact())
+            while last_index < len(self._body) and isinstance(
+                self._body[last_index][1], Null
+            ):
+                last_index += 1
 
             if last_index < len(self._body):
                 after_item = self._body[last_index][1]
@@ -393,9 +593,15 @@ class Container(_CustomDict):  # type: ignore[type-arg]
                     or "\n" in after_item.trivia.indent
                 ):
                     after_item.trivia.indent = "\n" + after_item.trivia.indent
-                return self._insert_at(last_index, key, item)
-            else:
-                previous_item = self._body[-1][1]
+                self._insert_at(last_index, key, item)
+                if cached:
+                    # The next values go after this one
+                    self._values_end = last_index + 1
+
+                return self
+
+            previous_item = self._previous_item()
+            if previous_item is not None:
                 if isinstance(previous_item, Table) and previous_item.is_super_table():
                     previous_child = previous_item.value._previous_item()
                     if (
@@ -413,10 +619,24 @@ class Container(_CustomDict):  # type: ignore[type-arg]
                     previous_item.trivia.trail += "\n"
 
         self._raw_append(key, item)
+        if cached:
+            self._values_end = len(self._body)
         if validate and key is not None:
             self._validate_out_of_order_table(key)
         return self
 
+    def _merging_into(self, element: tuple[Key | None, Item]) -> None:
+        """Records that an item is merged into the given one of the body"""
+        if self._parsed and element is not self._body[-1]:
+            # Its items render before the ones parsed since
+            self._reordered = True
+
+    def _previous_ends_with_whitespace(self) -> bool:
+        # Only computed when needed: while parsing, the last table may not
+        # have been loaded yet (see LazyItems)
+        prev = self._previous_item()
+        return isinstance(prev, Whitespace) or ends_with_whitespace(prev)
+
     def _validate_table_candidate(self, current: Table, candidate: Table) -> None:
         for k, v in candidate.value.body:
             if k is None:
@@ -466,12 +686,22 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         elif key is not None:
             self._map[key] = len(self._body)
 
+        self._changed()
         self._body.append((key, item))
         if item.is_table() and key is not None:
             self._table_keys.append(key)
 
         if key is not None:
-            dict.__setitem__(self, key.key, item.value)
+            # The values of tables, without loading lazy ones
+            value: Any
+            if isinstance(item, Table):
+                value = item._container
+            elif isinstance(item, AoT):
+                value = [table._container for table in item.body]
+            else:
+                value = item.value
+
+            dict.__setitem__(self, key.key, value)
 
     def _remove_at(self, idx: int) -> None:
         key = self._body[idx][0]
@@ -480,7 +710,9 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         if index is None:
             raise NonExistentKey(key)
         self._validation_cache.clear()
+        self._changed()
         self._body[idx] = (None, Null())
+        self._dead += 1
 
         if isinstance(index, tuple):
             index_list = list(index)
@@ -493,8 +725,36 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             dict.__delitem__(self, key.key)
             self._map.pop(key)
 
+        self._maybe_compact()
+
     def remove(self, key: Key | str) -> Container:
         """Remove a key from the container."""
+        self._remove(key)
+        self._maybe_compact()
+
+        return self
+
+    def remove_many(self, keys: Iterable[Key | str]) -> Container:
+        """
+        Remove several keys from the container, dropping the placeholders
+        they leave in the body at most once.
+
+        :raises NonExistentKey: if any of the keys is missing, in which case
+            none of them is removed.
+        """
+        _keys = [k if isinstance(k, Key) else SingleKey(k) for k in keys]
+        for key in _keys:
+            if key not in self._map:
+                raise NonExistentKey(key)
+
+        for key in dict.fromkeys(_keys):
+            self._remove(key)
+
+        self._maybe_compact()
+
+        return self
+
+    def _remove(self, key: Key | str) -> None:
         if not isinstance(key, Key):
             key = SingleKey(key)
 
@@ -503,15 +763,58 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             raise NonExistentKey(key)
 
         self._validation_cache.clear()
+        self._changed()
         if isinstance(idx, tuple):
             for i in idx:
                 self._body[i] = (None, Null())
+            self._dead += len(idx)
         else:
             self._body[idx] = (None, Null())
+            self._dead += 1
 
         dict.__delitem__(self, key.key)
 
-        return self
+    def _maybe_compact(self) -> None:
+        dead = self._dead
+        if dead >= self.COMPACT_THRESHOLD and dead >= len(self._map):
+            self._compact()
+
+    def _compact(self) -> None:
+        """
+        Drops the Null placeholders left in the body by removals, and updates
+        the indices of the items after them in one pass.
+        """
+        body = self._body
+        # An inline table renders a comma followed by a removed item, and by
+        # no other, as a trailing comma (see InlineTable.as_string()): keep
+        # the placeholder after the last key, if any.
+        keep = -1
+        for i in range(len(body) - 1, -1, -1):
+            k, v = body[i]
+            if k is not None:
+                break
+
+            if isinstance(v, Null):
+                keep = i
+                break
+
+        indices: list[int] = []
+        compacted: list[tuple[Key | None, Item]] = []
+        for i, (k, v) in enumerate(body):
+            indices.append(len(compacted))
+            if k is None and isinstance(v, Null) and i != keep:
+                continue
+
+            compacted.append((k, v))
+
+        body[:] = compacted
+        self._dead = int(keep >= 0)
+        self._changed()
+        for key, idx in self._map.items():
+            if isinstance(idx, tuple):
+                self._map[key] = tuple(indices[i] for i in idx)
+            else:
+                self._map[key] = indices[idx]
 
     def _insert_after(
         self, key: Key | str, other_key: Key | str, item: Any
@@ -538,20 +841,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         if "\n" not in current_item.trivia.trail:
             current_item.trivia.trail += "\n"
 
-        # Increment indices after the current index
-        for k, v in self._map.items():
-            if isinstance(v, tuple):
-                new_indices = []
-                for v_ in v:
-                    if v_ > idx:
-                        v_ = v_ + 1
-
-                    new_indices.append(v_)
-
-                self._map[k] = tuple(new_indices)
-            elif v > idx:
-                self._map[k] = v + 1
-
+        self._shift_indices(idx + 1)
         self._map[other_key] = idx + 1
         self._body.insert(idx + 1, (other_key, item))
 
@@ -560,6 +850,20 @@ class Container(_CustomDict):  # type: ignore[type-arg]
 
         return self
 
+    def _shift_indices(self, start: int) -> None:
+        """
+        Increments the indices from ``start`` on, before inserting an item
+        there. Only the keys of the items after it are looked up, rather than
+        every key, so inserting before the last few items is cheap.
+        """
+        self._changed()
+        for k in {k for k, _ in self._body[start:] if k is not None}:
+            idx = self._map.get(k)
+            if isinstance(idx, tuple):
+                self._map[k] = tuple(i + 1 if i >= start else i for i in idx)
+            elif idx is not None and idx >= start:
+                self._map[k] = idx + 1
+
     def _insert_at(self, idx: int, key: Key | str, item: Any) -> Container:
         if idx > len(self._body) - 1:
             raise ValueError(f"Unable to insert at position {idx}")
@@ -579,20 +883,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             ):
                 previous_item.trivia.trail += "\n"
 
-        # Increment indices after the current index
-        for k, v in self._map.items():
-            if isinstance(v, tuple):
-                new_indices = []
-                for v_ in v:
-                    if v_ >= idx:
-                        v_ = v_ + 1
-
-                    new_indices.append(v_)
-
-                self._map[k] = tuple(new_indices)
-            elif v >= idx:
-                self._map[k] = v + 1
-
+        self._shift_indices(idx)
         if key in self._map:
             current_idx = self._map[key]
             if not isinstance(current_idx, tuple):
@@ -620,10 +911,44 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             # The item we are getting is an out of order table
             # so we need a proxy to retrieve the proper objects
             # from the parent container
-            return OutOfOrderTableProxy(self, idx)
+            return self._out_of_order_table(key, idx)
 
         return self._body[idx][1]
 
+    def _out_of_order_table(
+        self, key: Key, indices: tuple[int, ...]
+    ) -> OutOfOrderTableProxy:
+        """
+        Returns the proxy merging the parts of an out-of-order table, which is
+        cached until the container or one of the parts changes.
+        """
+        cached = self._proxies.get(key)
+        if (
+            cached is not None
+            and cached.indices == indices
+            and cached.edits == Item._edits
+        ):
+            if cached.changes == Container._changes:
+                return cached.proxy
+
+            if all(c._version == version for c, version in cached.parts):
+                # Only other containers changed since
+                self._proxies[key] = cached._replace(changes=Container._changes)
+                return cached.proxy
+
+        proxy = OutOfOrderTableProxy(self, indices)
+        parts: list[tuple[Container, int]] = [(self, self._version)]
+        for i in indices:
+            table = self._body[i][1]
+            if isinstance(table, Table):
+                parts.append((table.value, table.value._version))
+
+        self._proxies[key] = _Proxy(
+            indices, Container._changes, Item._edits, parts, proxy
+        )
+
+        return proxy
+
     def last_item(self) -> Item | None:
         """Get the last item."""
         if self._body:
@@ -632,34 +957,171 @@ class Container(_CustomDict):  # type: ignore[type-arg]
 
     def as_string(self) -> str:
         """Render as TOML string."""
-        s = ""
+        args = ("document",)
+        cached = self._cached_rendering(args)
+        if cached is not None:
+            return cached
+
+        return self._cache_rendering(args, "".join(self._iter_body(stream=False)))
+
+    def iter_render(self) -> Iterator[str]:
+        """
+        Render as TOML string in fragments, which joined are :meth:`as_string`,
+        so that it can be written out without being built in full first.
+        """
+        cached = self._cached_rendering(("document",))
+        if cached is not None:
+            yield cached
+            return
+
+        yield from self._iter_body(stream=True)
+
+    def _iter_body(self, stream: bool) -> Iterator[str]:
+        # The last character rendered which is not a space, if any
+        last = ""
         for k, v in self._body:
-            if k is not None:
-                if isinstance(v, Table):
-                    if (
-                        s.strip(" ")
-                        and not s.strip(" ").endswith("\n")
-                        and "\n" not in v.trivia.indent
-                    ):
-                        s += "\n"
-                    s += self._render_table(k, v)
-                elif isinstance(v, AoT):
-                    if (
-                        s.strip(" ")
-                        and not s.strip(" ").endswith("\n")
-                        and "\n" not in v.trivia.indent
-                    ):
-                        s += "\n"
-                    s += self._render_aot(k, v)
-                else:
-                    s += self._render_simple_item(k, v)
+            fragments: Iterable[str]
+            if k is not None and isinstance(v, (Table, AoT)):
+                if last not in ("", "\n") and "\n" not in v.trivia.indent:
+                    yield "\n"
+                    last = "\n"
+
+                fragments = self._table_fragments(k, v, None, stream)
+            elif stream:
+                fragments = self._iter_render_simple_item(k, v)
+            else:
+                fragments = (self._render_simple_item(k, v),)
+
+            for text in fragments:
+                yield text
+                last = _last_char(text, last)
+
+    def _cached_rendering(self, args: tuple[Any, ...]) -> str | None:
+        """
+        Returns the text the container was last rendered as, if it was
+        rendered the same way and nothing it is made of changed since.
+        """
+        rendered = self._rendered
+        if rendered is None or rendered.args != args or rendered.edits != Item._edits:
+            return None
+
+        for container, version in rendered.parts:
+            if container._version != version:
+                return None
+
+        return rendered.text
+
+    def _cache_rendering(self, args: tuple[Any, ...], text: str) -> str:
+        """
+        Caches the text the container was rendered as, once the tables in it
+        were rendered, and returns it.
+        """
+        parts: list[tuple[Container, int]] = [(self, self._version)]
+        for _, v in self._body:
+            if isinstance(v, Table):
+                parts += v._container._rendering_parts()
+            elif isinstance(v, AoT):
+                for table in v.body:
+                    parts += table._container._rendering_parts()
+
+        self._rendered = _Rendering(args, Item._edits, parts, text)
+
+        return text
+
+    def _rendering_parts(self) -> list[tuple[Container, int]]:
+        if self._rendered is None:
+            # The container of a lazy table not loaded yet, which loading
+            # changes
+            return [(self, self._version)]
+
+        return self._rendered.parts
+
+    def _cache_source(self, source: str) -> None:
+        """
+        Caches the source the container was parsed from as its rendering,
+        unless parsing reordered its items.
+        """
+        parts = self._parsed_parts()
+        if parts is not None:
+            self._rendered = _Rendering(("document",), Item._edits, parts, source)
+
+    def _parsed_parts(self) -> list[tuple[Container, int]] | None:
+        """
+        Marks the items as cached, as rendering them does, and returns the
+        parts of the rendering (see _Rendering), or None if parsing reordered
+        them.
+        """
+        if self._reordered:
+            return None
+
+        parts: list[tuple[Container, int]] = [(self, self._version)]
+        for _, v in self._body:
+            if isinstance(v, Table):
+                tables = [v]
+            elif isinstance(v, AoT):
+                v._cache(nested=False)
+                tables = v.body
             else:
-                s += self._render_simple_item(k, v)
+                v._cache()
+                continue
+
+            for table in tables:
+                table._cache(nested=False)
+                table_parts = table._container._parsed_parts()
+                if table_parts is None:
+                    return None
+
+                parts += table_parts
+
+        return parts
+
+    def _table_fragments(
+        self, key: Key, item: Table | AoT, prefix: str | None, stream: bool
+    ) -> Iterable[str]:
+        """
+        Renders a table or an array of tables, in fragments when streaming or
+        else in one piece cached along the way.
+        """
+        if isinstance(item, AoT):
+            if stream:
+                return self._iter_render_aot(key, item, prefix=prefix)
 
-        return s
+            return (self._render_aot(key, item, prefix=prefix),)
+
+        if stream:
+            return self._iter_render_table(key, item, prefix=prefix)
+
+        return (self._render_table(key, item, prefix=prefix),)
 
     def _render_table(self, key: Key, table: Table, prefix: str | None = None) -> str:
-        cur = ""
+        args = ("table", key.as_string(), key.is_dotted(), prefix)
+        cached = table._container._cached_rendering(args)
+        if cached is not None:
+            return cached
+
+        text = "".join(self._iter_table(key, table, prefix, stream=False))
+        if table._lazy is not None:
+            # Not loaded, hence unchanged since parsing
+            return text
+
+        return table.value._cache_rendering(args, text)
+
+    def _iter_render_table(
+        self, key: Key, table: Table, prefix: str | None = None
+    ) -> Iterator[str]:
+        cached = table.value._cached_rendering(
+            ("table", key.as_string(), key.is_dotted(), prefix)
+        )
+        if cached is not None:
+            yield cached
+        else:
+            yield from self._iter_table(key, table, prefix, stream=True)
+
+    def _iter_table(
+        self, key: Key, table: Table, prefix: str | None, stream: bool
+    ) -> Iterator[str]:
+        # The items are marked as they are rendered
+        table._cache(nested=False)
 
         if table.display_name is not None:
             _key = table.display_name
@@ -669,6 +1131,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             if prefix is not None:
                 _key = prefix + "." + _key
 
+        header = ""
         if (
             not table.is_super_table()
             or (
@@ -694,7 +1157,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             newline_in_table_trivia = (
                 "\n" if "\n" not in table.trivia.trail and len(table.value) > 0 else ""
             )
-            cur += (
+            header = (
                 f"{table.trivia.indent}"
                 f"{open_}"
                 f"{decode(_key)}"
@@ -705,59 +1168,90 @@ class Container(_CustomDict):  # type: ignore[type-arg]
                 f"{newline_in_table_trivia}"
             )
         elif table.trivia.indent == "\n":
-            cur += table.trivia.indent
+            header = table.trivia.indent
 
+        if header:
+            yield header
+
+        if table._lazy is not None:
+            yield table._lazy.as_string()
+            return
+
+        last = _last_char(header, "")
         for k, v in table.value.body:
-            if isinstance(v, Table):
-                if (
-                    cur.strip(" ")
-                    and not cur.strip(" ").endswith("\n")
-                    and "\n" not in v.trivia.indent
-                ):
-                    cur += "\n"
+            fragments: Iterable[str]
+            if isinstance(v, (Table, AoT)):
+                if last not in ("", "\n") and "\n" not in v.trivia.indent:
+                    yield "\n"
+                    last = "\n"
+
                 assert k is not None
-                if v.is_super_table():
-                    if k.is_dotted() and not key.is_dotted():
-                        # Dotted key inside table
-                        cur += self._render_table(k, v)
-                    else:
-                        cur += self._render_table(k, v, prefix=_key)
-                else:
-                    cur += self._render_table(k, v, prefix=_key)
-            elif isinstance(v, AoT):
                 if (
-                    cur.strip(" ")
-                    and not cur.strip(" ").endswith("\n")
-                    and "\n" not in v.trivia.indent
+                    isinstance(v, Table)
+                    and v.is_super_table()
+                    and k.is_dotted()
+                    and not key.is_dotted()
                 ):
-                    cur += "\n"
-                assert k is not None
-                cur += self._render_aot(k, v, prefix=_key)
+                    # Dotted key inside table
+                    fragments = self._table_fragments(k, v, None, stream)
+                else:
+                    fragments = self._table_fragments(k, v, _key, stream)
             else:
-                cur += self._render_simple_item(
-                    k, v, prefix=_key if key.is_dotted() else None
-                )
+                item_prefix = _key if key.is_dotted() else None
+                if stream:
+                    fragments = self._iter_render_simple_item(k, v, prefix=item_prefix)
+                else:
+                    fragments = (self._render_simple_item(k, v, prefix=item_prefix),)
 
-        return cur
+            for text in fragments:
+                yield text
+                last = _last_char(text, last)
 
     def _render_aot(self, key: Key, aot: AoT, prefix: str | None = None) -> str:
         _key = key.as_string()
         if prefix is not None:
             _key = prefix + "." + _key
 
-        cur = ""
+        aot._cache(nested=False)
         _key = decode(_key)
-        for table in aot.body:
-            cur += self._render_aot_table(table, prefix=_key)
+        return "".join(self._render_aot_table(table, prefix=_key) for table in aot.body)
 
-        return cur
+    def _iter_render_aot(
+        self, key: Key, aot: AoT, prefix: str | None = None
+    ) -> Iterator[str]:
+        _key = key.as_string()
+        if prefix is not None:
+            _key = prefix + "." + _key
+
+        aot._cache(nested=False)
+        _key = decode(_key)
+        for table in aot.body:
+            cached = table._container._cached_rendering(("element", _key))
+            if cached is not None:
+                yield cached
+            else:
+                yield from self._iter_aot_table(table, _key, stream=True)
 
     def _render_aot_table(self, table: Table, prefix: str | None = None) -> str:
-        cur = ""
+        args = ("element", prefix)
+        cached = table._container._cached_rendering(args)
+        if cached is not None:
+            return cached
+
+        text = "".join(self._iter_aot_table(table, prefix, stream=False))
+        if table._lazy is not None:
+            return text
+
+        return table.value._cache_rendering(args, text)
+
+    def _iter_aot_table(
+        self, table: Table, prefix: str | None, stream: bool
+    ) -> Iterator[str]:
+        table._cache(nested=False)
         _key = prefix or ""
         open_, close = "[[", "]]"
 
-        cur += (
+        yield (
             f"{table.trivia.indent}"
             f"{open_}"
             f"{decode(_key)}"
@@ -767,28 +1261,30 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             f"{table.trivia.trail}"
         )
 
+        if table._lazy is not None:
+            yield table._lazy.as_string()
+            return
+
         for k, v in table.value.body:
             if isinstance(v, Table):
                 assert k is not None
-                if v.is_super_table():
-                    if k.is_dotted():
-                        # Dotted key inside table
-                        cur += self._render_table(k, v)
-                    else:
-                        cur += self._render_table(k, v, prefix=_key)
+                if v.is_super_table() and k.is_dotted():
+                    # Dotted key inside table
+                    yield from self._table_fragments(k, v, None, stream)
                 else:
-                    cur += self._render_table(k, v, prefix=_key)
+                    yield from self._table_fragments(k, v, _key, stream)
             elif isinstance(v, AoT):
                 assert k is not None
-                cur += self._render_aot(k, v, prefix=_key)
+                yield from self._table_fragments(k, v, _key, stream)
+            elif stream:
+                yield from self._iter_render_simple_item(k, v)
             else:
-                cur += self._render_simple_item(k, v)
-
-        return cur
+                yield self._render_simple_item(k, v)
 
     def _render_simple_item(
         self, key: Key | None, item: Item, prefix: str | None = None
     ) -> str:
+        item._cache()
         if key is None:
             return item.as_string()
 
@@ -806,6 +1302,25 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             f"{item.trivia.trail}"
         )
 
+    def _iter_render_simple_item(
+        self, key: Key | None, item: Item, prefix: str | None = None
+    ) -> Iterator[str]:
+        if key is None or not isinstance(item, Array):
+            yield self._render_simple_item(key, item, prefix=prefix)
+            return
+
+        # Arrays can be as large as the rest of the document
+        item._cache()
+        _key = key.as_string()
+        if prefix is not None:
+            _key = prefix + "." + _key
+
+        yield f"{item.trivia.indent}{decode(_key)}{key.sep}"
+        yield from item._iter_render()
+        yield (
+            f"{item.trivia.comment_ws}{decode(item.trivia.comment)}{item.trivia.trail}"
+        )
+
     def __len__(self) -> int:
         return dict.__len__(self)
 
@@ -818,6 +1333,11 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         if isinstance(item, Item) and item.is_boolean():
             return item.value
 
+        if isinstance(item, Table) and item._lazy is not None:
+            # Loaded when looked up, as some consumers (such as json) skip
+            # the dicts that look empty without calling items()
+            item._load()
+
         return item
 
     def __contains__(self, key: object) -> bool:
@@ -827,7 +1347,8 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         # key the same way ``item()`` does -- ``str`` becomes a ``SingleKey``
         # (a non-str/non-``Key`` argument still raises ``TypeError``) -- then
         # probe ``_map`` directly. For an out-of-order table the proxy is still
-        # built so its validation runs exactly as before.
+        # looked up so its validation runs as before (once until its parts
+        # change).
         if not isinstance(key, Key):
             key = SingleKey(key)  # type: ignore[arg-type]
         idx = self._map.get(key)
@@ -840,7 +1361,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             # proxy (which is linear in the number of fragments)
             validated, _ = self._validation_cache.get(key, (0, None))
             if not (self._parsed and validated == len(idx)):
-                OutOfOrderTableProxy(self, idx)
+                self._out_of_order_table(key, idx)
         return True
 
     def __setitem__(self, key: Key | str, value: Any) -> None:
@@ -873,10 +1394,12 @@ class Container(_CustomDict):  # type: ignore[type-arg]
     ) -> None:
         value = _item(value)
         self._validation_cache.clear()
+        self._changed()
 
         if isinstance(idx, tuple):
             for i in idx[1:]:
                 self._body[i] = (None, Null())
+            self._dead += len(idx) - 1
 
             idx = idx[0]
 
@@ -922,7 +1445,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             isinstance(value, (AoT, Table)) != isinstance(v, (AoT, Table))
             or reposition_dotted
         ):
-            self.remove(k)
+            self._remove(k)
             if isinstance(value, (AoT, Table)):
                 # New tables must appear after all entries that render inline:
                 # plain values and dotted keys (which are super tables). Skip
@@ -979,6 +1502,9 @@ class Container(_CustomDict):  # type: ignore[type-arg]
             assert isinstance(new_key, Key)
             dict.__setitem__(self, new_key.key, value.value)
 
+        # Only now that the indices above are no longer needed
+        self._maybe_compact()
+
     def __str__(self) -> str:
         return str(self.value)
 
@@ -989,7 +1515,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         if not isinstance(other, dict):
             return NotImplemented
 
-        return bool(_equal_with_nan(self.value, other))
+        return bool(_equal_with_nan(self._cached_value(), other))
 
     def _getstate(self, protocol: int) -> tuple[bool]:
         return (self._parsed,)
@@ -1012,11 +1538,33 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         self._out_of_order_keys = {
             k for k, v in self._map.items() if isinstance(v, tuple)
         }
+        self._dead = sum(k is None and isinstance(v, Null) for k, v in self._body)
+        self._changed()
 
         for key, item in self._body:
             if key is not None:
                 dict.__setitem__(self, key.key, item.value)
 
+    def _reset(self, other: Container) -> None:
+        """
+        Replaces the items of the container by those of another one, which
+        is not to be used afterwards.
+        """
+        dict.clear(self)
+        for k, v in dict.items(other):
+            dict.__setitem__(self, k, v)
+
+        self._map = other._map
+        self._body = other._body
+        self._parsed = other._parsed
+        self._table_keys = other._table_keys
+        self._out_of_order_keys = other._out_of_order_keys
+        self._dead = other._dead
+        self._reordered = other._reordered
+        self._validation_cache.clear()
+        self._proxies.clear()
+        self._changed()
+
     def copy(self) -> Self:
         return copy.copy(self)
 
@@ -1028,6 +1576,7 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         c._body += self.body
         c._map.update(self._map)
         c._out_of_order_keys |= self._out_of_order_keys
+        c._dead = self._dead
 
         return c
 
@@ -1053,6 +1602,24 @@ class Container(_CustomDict):  # type: ignore[type-arg]
         return prev[-1] if prev else None
 
 
+class LazyItems(NamedTuple):
+    """
+    The items of a table only parsed when the table is first accessed, see
+    ``parse(lazy=True)``.
+    """
+
+    # The text of the items in the source
+    source: str
+    start: int
+    end: int
+    # Parses the items into the table's container
+    load: Callable[[], None]
+
+    def as_string(self) -> str:
+        # Unchanged since parsing: the source text is the rendering
+        return self.source[self.start : self.end]
+
+
 class OutOfOrderTableProxy(_CustomDict):  # type: ignore[type-arg]
     @staticmethod
     def validate(
@@ -1118,7 +1685,9 @@ class OutOfOrderTableProxy(_CustomDict):  # type: ignore[type-arg]
         chain duplicate ``Table`` parts and would raise ``KeyAlreadyPresent``.
         The fragments are presented as a new merged ``AoT`` referencing the
         live element tables, without mutating either fragment (the parts keep
-        rendering their own elements).
+        rendering their own elements). Elements added to or removed from the
+        merged ``AoT`` are added to or removed from the fragments, see
+        :class:`_MergedAoT`.
 
         Returns the merged ``AoT``, or ``None`` if this is not such a fragment.
         """
@@ -1137,7 +1706,13 @@ class OutOfOrderTableProxy(_CustomDict):  # type: ignore[type-arg]
         if not isinstance(existing, AoT):
             return None
 
-        merged = AoT([*existing.body, *item.body], parsed=True)
+        # Appending to the fragments must count as an edit of a cached item,
+        # as the merged array is then out of date
+        existing._cached = item._cached = True
+        if isinstance(existing, _MergedAoT):
+            merged = _MergedAoT([*existing._fragments, item])
+        else:
+            merged = _MergedAoT([existing, item])
         internal._body[idx] = (internal._body[idx][0], merged)
         dict.__setitem__(internal, key.key, merged.value)
         return merged
@@ -1257,6 +1832,158 @@ class OutOfOrderTableProxy(_CustomDict):  # type: ignore[type-arg]
         return self[key]
 
 
+class _MergedAoT(AoT):
+    """
+    The elements of an array of tables split across the parts of an
+    out-of-order table, which are added to and removed from the fragment of
+    the array they belong to, so that the parts render them.
+    """
+
+    def __init__(self, fragments: list[AoT]) -> None:
+        super().__init__([], parsed=True)
+        self._fragments = fragments
+        for fragment in fragments:
+            self._body += fragment.body
+            list.extend(self, fragment.body)
+
+    def _fragment(self, index: int) -> tuple[AoT, int]:
+        """
+        Returns the fragment the element at the given index is in (or is to
+        be inserted in), and its index in there.
+        """
+        for fragment in self._fragments[:-1]:
+            if index < len(fragment):
+                return fragment, index
+
+            index -= len(fragment)
+
+        return self._fragments[-1], index
+
+    def __setitem__(self, key: slice | int, value: Any) -> None:  # type: ignore[override]
+        if isinstance(key, slice):
+            raise TypeError("Cannot assign slices of an array of tables in parts")
+
+        index = range(len(self))[key]
+        fragment, i = self._fragment(index)
+        fragment[i] = value
+        self._edited()
+        self._body[index] = fragment.body[i]
+        list.__setitem__(self, index, fragment.body[i])
+
+    def __delitem__(self, key: slice | int) -> None:  # type: ignore[override]
+        positions = range(len(self))
+        indices = positions[key] if isinstance(key, slice) else [positions[key]]
+        # From the last one, so that the indices of the others stay valid
+        for index in sorted(indices, reverse=True):
+            fragment, i = self._fragment(index)
+            del fragment[i]
+
+        self._edited()
+        del self._body[key]
+        list.__delitem__(self, key)
+
+    def insert(self, index: int, value: dict[str, Any]) -> None:  # type: ignore[override]
+        length = len(self)
+        if index < 0:
+            index = max(index + length, 0)
+
+        index = min(index, length)
+        fragment, i = self._fragment(index)
+        fragment.insert(i, value)
+        self._edited()
+        self._body.insert(index, fragment.body[i])
+        list.insert(self, index, fragment.body[i])
+
+    def __reduce_ex__(self, protocol: int) -> tuple[type, tuple[object, ...]]:  # type: ignore[override]
+        # Copies are plain arrays of tables, made of copies of the elements
+        return AoT, self._getstate(protocol)
+
+
+class ContainerView(Mapping[str, Any]):
+    """
+    A read-only view of a container, see :meth:`Container.view`.
+    """
+
+    __slots__ = ("_container",)
+
+    def __init__(self, container: Container) -> None:
+        self._container = container
+
+    def __getitem__(self, key: str) -> Any:
+        return _view(self._container.item(key))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._container)
+
+    def __len__(self) -> int:
+        return len(self._container)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._container
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+
+class ArrayView(Sequence[Any]):
+    """
+    A read-only view of an array, or of the tables of an array of tables,
+    see :meth:`Container.view`.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: list[Any]) -> None:
+        self._items = items
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ArrayView: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return ArrayView(list.__getitem__(self._items, index))
+
+        return _view(list.__getitem__(self._items, index))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        # Equal to lists (and other sequences) of the same values, as arrays are
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            self[i] == other[i] for i in range(len(self))
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+
+def _view(value: Any) -> Any:
+    """Returns the view of a table or an array, or the plain value of a scalar"""
+    if isinstance(value, OutOfOrderTableProxy):
+        return ContainerView(value._internal_container)
+
+    if isinstance(value, AbstractTable):
+        return ContainerView(value.value)
+
+    if isinstance(value, AoT):
+        return ArrayView(value.body)
+
+    if isinstance(value, Array):
+        return ArrayView(value)
+
+    if isinstance(value, Item):
+        return value.unwrap()
+
+    return value
+
+
 def ends_with_whitespace(it: Any) -> bool:
     """Returns ``True`` if the given item ``it`` is a ``Table`` or ``AoT`` object
     ending with a ``Whitespace``.
@@ -1269,6 +1996,39 @@ def ends_with_whitespace(it: Any) -> bool:
     return isinstance(it, AoT) and len(it) > 0 and ends_with_whitespace(it[-1])
 
 
+def _count_value_lookup(hit: bool) -> None:
+    """Counts a lookup of the cached value of a container"""
+    with _VALUE_STATS_LOCK:
+        if hit:
+            Container._value_hits += 1
+        else:
+            Container._value_misses += 1
+
+
+def _copy_plain(value: Any) -> Any:
+    """
+    Copies the plain dicts and lists nested in a value, which are built along
+    with it, but not the items in them (such as arrays), as the value of a
+    container computed again would.
+    """
+    if type(value) is dict:
+        return {k: _copy_plain(v) for k, v in value.items()}
+
+    if type(value) is list:
+        return [_copy_plain(v) for v in value]
+
+    return value
+
+
+def _last_char(text: str, last: str) -> str:
+    """
+    Returns the last character of ``text`` which is not a space, or ``last``
+    if there is none, to follow the end of a rendering as it is built.
+    """
+    stripped = text.rstrip(" ")
+    return stripped[-1] if stripped else last
+
+
 def _equal_with_nan(left: Any, right: Any) -> bool:
     if isinstance(left, dict) and isinstance(right, dict):
         if left.keys() != right.keys():
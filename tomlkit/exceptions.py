@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from collections.abc import Collection
+from typing import Any
 
 
 class TOMLKitError(Exception):
-    pass
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuilt without calling __init__, whose signature varies between
+        # subclasses, e.g. to be sent back from a worker process
+        return _new_error, (type(self), self.args), self.__dict__
+
+
+def _new_error(cls: type[TOMLKitError], args: tuple[Any, ...]) -> TOMLKitError:
+    return cls.__new__(cls, *args)
 
 
 class ParseError(ValueError, TOMLKitError):
@@ -17,18 +26,39 @@ class ParseError(ValueError, TOMLKitError):
     def __init__(self, line: int, col: int, message: str | None = None) -> None:
         self._line = line
         self._col = col
+        # Computes the line and column when they are first needed, for errors
+        # raised by the parser, which are often caught and discarded
+        self._position: Callable[[], tuple[int, int]] | None = None
 
         if message is None:
             message = "TOML parse error"
 
-        super().__init__(f"{message} at line {self._line} col {self._col}")
+        self._message = message
+
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return f"{self._message} at line {self.line} col {self.col}"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The position can't be pickled
+        self._locate()
+
+        return super().__reduce__()
+
+    def _locate(self) -> None:
+        if self._position is not None:
+            self._line, self._col = self._position()
+            self._position = None
 
     @property
     def line(self) -> int:
+        self._locate()
         return self._line
 
     @property
     def col(self) -> int:
+        self._locate()
         return self._col
 
 
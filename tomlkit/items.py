@@ -17,6 +17,7 @@ from datetime import time
 from datetime import timedelta
 from datetime import tzinfo
 from enum import Enum
+from itertools import count
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import TypeVar
@@ -36,8 +37,10 @@ from tomlkit.exceptions import InvalidStringError
 
 if TYPE_CHECKING:
     from typing import Protocol
+    from typing import Self
 
     from tomlkit import container
+    from tomlkit.container import LazyItems
     from tomlkit.container import OutOfOrderTableProxy
 
     class Encoder(Protocol):
@@ -46,7 +49,13 @@ if TYPE_CHECKING:
 
 ItemT = TypeVar("ItemT", bound="Item")
 CUSTOM_ENCODERS: list[Encoder] = []
-AT = TypeVar("AT", bound="AbstractTable")
+# The numbers Item._edits is set to, see there
+_EDITS = count(1)
+
+
+def _record_edit() -> None:
+    """Records an edit of an item that a container cached, see Item._cached"""
+    Item._edits = next(_EDITS)
 
 
 @overload
@@ -329,6 +338,30 @@ class Trivia:
     # Trailing newline.
     trail: str = "\n"
 
+    # See Item._cached
+    _cached = False
+
+    def __init__(
+        self,
+        indent: str = "",
+        comment_ws: str = "",
+        comment: str = "",
+        trail: str = "\n",
+    ) -> None:
+        # Not through __setattr__(), as new trivia are not cached
+        attrs = self.__dict__
+        attrs["indent"] = indent
+        attrs["comment_ws"] = comment_ws
+        attrs["comment"] = comment
+        attrs["trail"] = trail
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._cached:
+            object.__setattr__(self, "_cached", False)
+            _record_edit()
+
+        object.__setattr__(self, name, value)
+
     def copy(self) -> Trivia:
         return dataclasses.replace(self)
 
@@ -354,6 +387,8 @@ class Key(abc.ABC):
     _keys: list[SingleKey]
     _dotted: bool
     key: str
+    # Offsets of the key in the parsed source, if tracked
+    _span: tuple[int, int] | None = None
 
     @abc.abstractmethod
     def __hash__(self) -> int:
@@ -472,6 +507,18 @@ class Item:
     An item within a TOML document.
     """
 
+    # Offsets of the item in the parsed source (of the header for tables), if
+    # tracked, see TOMLDocument.locate()
+    _span: tuple[int, int] | None = None
+    # Whether the item is part of the text a container cached when rendering
+    # it, see Container._cached_rendering(). Changing it in place (or its
+    # trivia) then counts as an edit, which stops containers from reusing the
+    # text they cached before.
+    _cached = False
+    # Set to a new number on every such edit, which is atomic unlike
+    # incrementing it, see Container._changes
+    _edits = 0
+
     def __init__(self, trivia: Trivia) -> None:
         self._trivia = trivia
 
@@ -531,6 +578,44 @@ class Item:
     def is_aot(self) -> bool:
         return isinstance(self, AoT)
 
+    def _cache(self, nested: bool = True) -> None:
+        """
+        Marks the item as part of the text cached by a container, along with
+        the items nested in it unless ``nested`` is false.
+        """
+        self._cached = True
+        object.__setattr__(self._trivia, "_cached", True)
+        # Arrays and tables (cheaper to tell apart from the other items than
+        # by checking for these classes)
+        if not nested or not isinstance(self, (list, dict)):
+            return
+
+        # Without recursion, as values can be nested deeper than its limit
+        items: list[Item] = [self]
+        while items:
+            current = items.pop()
+            children: Iterable[Item]
+            if isinstance(current, Array):
+                children = current._iter_items()
+            elif isinstance(current, AoT):
+                children = current.body
+            elif isinstance(current, AbstractTable):
+                current.value._cached = True
+                children = (v for _, v in current.value.body)
+            else:
+                continue
+
+            for child in children:
+                child._cache(nested=False)
+                if isinstance(child, (list, dict)):
+                    items.append(child)
+
+    def _edited(self) -> None:
+        """Records a change to the item, see ``_cached``"""
+        if self._cached:
+            self._cached = False
+            _record_edit()
+
     def _getstate(self, protocol: int = 3) -> tuple[object, ...]:
         return (self._trivia,)
 
@@ -574,6 +659,10 @@ class Whitespace(Item):
     def as_string(self) -> str:
         return self._s
 
+    def _cache(self, nested: bool = True) -> None:
+        # No trivia, and only changed along with the array it is in, if any
+        pass
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self._s!r}>"
 
@@ -1458,28 +1547,37 @@ class Array(Item, _CustomList):  # type: ignore[type-arg]
             3,
         ]
         """
+        self._edited()
         self._multiline = multiline
 
         return self
 
     def as_string(self) -> str:
+        return "".join(self._iter_render())
+
+    def _iter_render(self) -> Iterator[str]:
+        """Renders the array in fragments, about one per element"""
         if not self._multiline or not self._value:
-            return f"[{''.join(v.as_string() for v in self._iter_items())}]"
-
-        s = "[\n"
-        s += "".join(
-            self.trivia.indent
-            + " " * 4
-            + v.value.as_string()
-            + ("," if not isinstance(v.value, Null) else "")
-            + (v.comment.as_string() if v.comment is not None else "")
-            + "\n"
-            for v in self._value
-            if v.value is not None
-        )
-        s += self.trivia.indent + "]"
+            yield "["
+            for v in self._iter_items():
+                yield v.as_string()
+            yield "]"
+            return
+
+        yield "[\n"
+        for group in self._value:
+            if group.value is None:
+                continue
 
-        return s
+            yield (
+                self.trivia.indent
+                + " " * 4
+                + group.value.as_string()
+                + ("," if not isinstance(group.value, Null) else "")
+                + (group.comment.as_string() if group.comment is not None else "")
+                + "\n"
+            )
+        yield self.trivia.indent + "]"
 
     def _reindex(self) -> None:
         self._index_map.clear()
@@ -1516,6 +1614,7 @@ class Array(Item, _CustomList):  # type: ignore[type-arg]
         """
         if comment and ("\n" in comment or "\r" in comment):
             raise ValueError("Comment cannot contain line breaks")
+        self._edited()
         new_values: list[Item] = []
         first_indent = f"\n{indent}" if newline else indent
         if first_indent:
@@ -1570,6 +1669,7 @@ class Array(Item, _CustomList):  # type: ignore[type-arg]
 
     def clear(self) -> None:
         """Clear the array."""
+        self._edited()
         list.clear(self)
         self._index_map.clear()
         self._value.clear()
@@ -1584,6 +1684,7 @@ class Array(Item, _CustomList):  # type: ignore[type-arg]
         return list.__getitem__(self, key)
 
     def __setitem__(self, key: int | slice, value: Any) -> None:  # type: ignore[override]
+        self._edited()
         it = item(value, _parent=self)
         list.__setitem__(self, key, it)
         if isinstance(key, slice):
@@ -1593,6 +1694,7 @@ class Array(Item, _CustomList):  # type: ignore[type-arg]
         self._value[self._index_map[key]].value = it
 
     def insert(self, pos: int, value: Any) -> None:  # type: ignore[override]
+        self._edited()
         it = item(value, _parent=self)
         length = len(self)
         if not isinstance(it, (Comment, Whitespace)):
@@ -1653,6 +1755,7 @@ class Array(Item, _CustomList):  # type: ignore[type-arg]
         self._reindex()
 
     def __delitem__(self, key: int | slice) -> None:  # type: ignore[override]
+        self._edited()
         length = len(self)
         list.__delitem__(self, key)
 
@@ -1732,15 +1835,38 @@ class Array(Item, _CustomList):  # type: ignore[type-arg]
 class AbstractTable(Item, _CustomDict):  # type: ignore[type-arg]
     """Common behaviour of both :class:`Table` and :class:`InlineTable`"""
 
+    # Where the items are parsed from when first accessed, for the tables
+    # of documents parsed with ``lazy=True``
+    _lazy: LazyItems | None = None
+
     def __init__(self, value: container.Container, trivia: Trivia):
         Item.__init__(self, trivia)
 
-        self._value = value
+        self._container = value
 
-        for k, v in self._value.body:
+        for k, v in value.body:
             if k is not None:
                 dict.__setitem__(self, k.key, v)
 
+    @property
+    def _value(self) -> container.Container:
+        if self._lazy is not None:
+            self._load()
+
+        return self._container
+
+    @_value.setter
+    def _value(self, value: container.Container) -> None:
+        self._container = value
+
+    def _load(self) -> None:
+        """
+        Parses the items of a lazy table into its container.
+        """
+        lazy, self._lazy = self._lazy, None
+        assert lazy is not None
+        lazy.load()
+
     def unwrap(self) -> dict[str, Any]:
         # Delegate to the inner container's unwrap, which walks its _body
         # directly instead of re-resolving every key through items()/__getitem__
@@ -1753,23 +1879,23 @@ class AbstractTable(Item, _CustomDict):  # type: ignore[type-arg]
         return self._value
 
     @overload
-    def append(self: AT, key: None, value: Comment | Whitespace) -> AT: ...
+    def append(self, key: None, value: Comment | Whitespace) -> Self: ...
 
     @overload
-    def append(self: AT, key: Key | str, value: Any) -> AT: ...
+    def append(self, key: Key | str, value: Any) -> Self: ...
 
-    def append(self: AT, key: Key | str | None, value: Any) -> AT:
+    def append(self, key: Key | str | None, value: Any) -> Self:
         raise NotImplementedError
 
     @overload
-    def add(self: AT, key: Comment | Whitespace) -> AT: ...
+    def add(self, key: Comment | Whitespace) -> Self: ...
 
     @overload
-    def add(self: AT, key: Key | str, value: Any = ...) -> AT: ...
+    def add(self, key: Key | str, value: Any = ...) -> Self: ...
 
     def add(
-        self: AT, key: Key | str | Comment | Whitespace, value: Any | None = None
-    ) -> AT:
+        self, key: Key | str | Comment | Whitespace, value: Any | None = None
+    ) -> Self:
         if value is None:
             if not isinstance(key, (Comment, Whitespace)):
                 msg = "Non comment/whitespace items must have an associated key"
@@ -1782,7 +1908,7 @@ class AbstractTable(Item, _CustomDict):  # type: ignore[type-arg]
 
         return self.append(key, value)
 
-    def remove(self: AT, key: Key | str) -> AT:
+    def remove(self, key: Key | str) -> Self:
         self._value.remove(key)
 
         if isinstance(key, Key):
@@ -1793,6 +1919,18 @@ class AbstractTable(Item, _CustomDict):  # type: ignore[type-arg]
 
         return self
 
+    def remove_many(self, keys: Iterable[Key | str]) -> Self:
+        """
+        Remove several keys from the table at once, see
+        :meth:`Container.remove_many`.
+        """
+        keys = list(keys)
+        self._value.remove_many(keys)
+        for name in dict.fromkeys(k.key if isinstance(k, Key) else k for k in keys):
+            dict.__delitem__(self, name)
+
+        return self
+
     def item(self, key: Key | str) -> Item | OutOfOrderTableProxy:
         return self._value.item(key)
 
@@ -1803,7 +1941,7 @@ class AbstractTable(Item, _CustomDict):  # type: ignore[type-arg]
     def __str__(self) -> str:
         return str(self.value)
 
-    def copy(self: AT) -> AT:
+    def copy(self) -> Self:
         return copy.copy(self)
 
     def __repr__(self) -> str:
@@ -1901,8 +2039,13 @@ class Table(AbstractTable):
         self._value.append(key, _item)
 
         if isinstance(key, Key):
-            key = next(iter(key)).key
-            _item = self._value[key]
+            key = next(iter(key))
+            # The parts of an out-of-order table are only gathered (through
+            # a proxy merging all of them) when looked up
+            if not isinstance(self._value._map.get(key), tuple):
+                _item = self._value[key]
+
+            key = key.key
 
         if key is not None:
             dict.__setitem__(self, key, _item)
@@ -1930,8 +2073,13 @@ class Table(AbstractTable):
         self._value.append(key, _item, validate=False)
 
         if isinstance(key, Key):
-            key = next(iter(key)).key
-            _item = self._value[key]
+            key = next(iter(key))
+            if isinstance(self._value._map.get(key), tuple):
+                self._value._validate_out_of_order_table(key)
+            else:
+                _item = self._value[key]
+
+            key = key.key
 
         if key is not None:
             dict.__setitem__(self, key, _item)
@@ -1988,6 +2136,7 @@ class Table(AbstractTable):
 
     def invalidate_display_name(self) -> None:
         """Call ``invalidate_display_name`` on the contained tables"""
+        self._edited()
         self.display_name = None
 
         for child in self.values():
@@ -2304,12 +2453,19 @@ class AoT(Item, _CustomList):  # type: ignore[type-arg]
     def __getitem__(self, key: int) -> Table: ...
 
     def __getitem__(self, key: int | slice) -> Table | list[Table]:
-        return self._body[key]
+        tables = self._body[key]
+        for table in tables if isinstance(tables, list) else (tables,):
+            if table._lazy is not None:
+                table._load()
+
+        return tables
 
     def __setitem__(self, key: slice | int, value: Any) -> None:  # type: ignore[override]
+        self._edited()
         self._body[key] = item(value, _parent=self)
 
     def __delitem__(self, key: slice | int) -> None:  # type: ignore[override]
+        self._edited()
         del self._body[key]
         list.__delitem__(self, key)
 
@@ -2317,6 +2473,7 @@ class AoT(Item, _CustomList):  # type: ignore[type-arg]
         value = item(value, _parent=self)
         if not isinstance(value, Table):
             raise ValueError(f"Unsupported insert value type: {type(value)}")
+        self._edited()
         length = len(self)
         if index < 0:
             index += length
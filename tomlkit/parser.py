@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import dataclasses
 import datetime
 import re
 import string
 
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Any
-from typing import Callable
+from typing import NamedTuple
 
 from tomlkit._compat import decode
 from tomlkit._utils import RFC_3339_LOOSE
 from tomlkit._utils import _escaped
 from tomlkit._utils import parse_rfc3339
 from tomlkit.container import Container
+from tomlkit.container import LazyItems
 from tomlkit.exceptions import EmptyKeyError
 from tomlkit.exceptions import EmptyTableNameError
 from tomlkit.exceptions import InternalParserError
@@ -23,6 +29,7 @@ from tomlkit.exceptions import InvalidNumberError
 from tomlkit.exceptions import InvalidTimeError
 from tomlkit.exceptions import InvalidUnicodeValueError
 from tomlkit.exceptions import ParseError
+from tomlkit.exceptions import TOMLKitError
 from tomlkit.exceptions import UnexpectedCharError
 from tomlkit.exceptions import UnexpectedEofError
 from tomlkit.items import AoT
@@ -47,7 +54,7 @@ from tomlkit.items import Time
 from tomlkit.items import Trivia
 from tomlkit.items import Whitespace
 from tomlkit.source import Source
-from tomlkit.source import _StateHandler
+from tomlkit.source import iter_lines
 from tomlkit.toml_document import TOMLDocument
 
 
@@ -89,27 +96,107 @@ _CTRL_MULTI = frozenset(
 _MULTI_LITERAL_STOP = _CTRL_MULTI | {"'", "\r"}  # literal: closing quote or CR
 _MULTI_BASIC_STOP = _CTRL_MULTI | {'"', "\\", "\r"}  # basic: quote, escape or CR
 
+# Coarse lexing used to find where tables end without parsing them (see
+# split_units() and lazy parsing): only strings, comments and brackets matter.
+_UNIT_TOKEN = re.compile(
+    r'"""' r"|'''" r'|"(?:[^"\\\n]|\\.)*"' r"|'[^'\n]*'" r"|[#\[\]{}]"
+)
+# Table header made of bare keys only, read without a Parser
+_BARE_HEADER = re.compile(
+    r"[ \t]*(\[\[?)[ \t]*([A-Za-z0-9_-]+(?:[ \t]*\.[ \t]*[A-Za-z0-9_-]+)*)[ \t]*\]"
+)
+_UNIT_STRING_END = {
+    '"""': re.compile(r'(?s)(?:[^"\\]|\\.|"(?!""))*""""{0,2}'),
+    "'''": re.compile(r"(?s).*?''''{0,2}"),
+}
+
+# Valid bodies of basic strings up to their closing delimiter, matched in one
+# go before falling back to the character by character parse, which reports
+# the exact position of any error. Written as "unrolled loops" so that a
+# failed match does not backtrack.
+_BASIC_ESCAPE = r'\\(?:[btnfre"\\]|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|x[0-9a-fA-F]{2})'
+_SINGLE_BASIC_CHARS = r'[^"\\\x00-\x08\x0a-\x1f\x7f]*'
+_SINGLE_BASIC_BODY = re.compile(
+    rf'({_SINGLE_BASIC_CHARS}(?:{_BASIC_ESCAPE}{_SINGLE_BASIC_CHARS})*)(")'
+)
+# Multiline bodies may also contain CRLF line endings, runs of one or two
+# quotes and backslashes ending a line, and be closed by up to five quotes
+_MULTI_BASIC_CHARS = r'[^"\\\x00-\x08\x0b-\x1f\x7f]*'
+_MULTI_BASIC_BODY = re.compile(
+    rf"({_MULTI_BASIC_CHARS}(?:"
+    rf'(?:\r\n|"{{1,2}}(?!")|{_BASIC_ESCAPE}|\\[ \t\r]*\n[ \t\r\n]*(?![ \t\r\n]))'
+    rf"{_MULTI_BASIC_CHARS})*)"
+    r'("{3,5})(?!")'
+)
+# Escapes of a valid body, with the values of the single character ones
+_BASIC_UNESCAPE = re.compile(
+    r"\\(?:u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|x[0-9a-fA-F]{2}|[ \t\r\n]+|.)"
+)
+_UNESCAPED = {f"\\{c}": value for c, value in _escaped.items()}
+
+# Common shapes of lines and values, matched straight into plain values by
+# Parser.parse_values(). Anything else goes through the regular methods.
+_PLAIN_SPACES = re.compile(r"[ \t]*")
+_PLAIN_COMMENT = r"#[^\x00-\x08\x0a-\x1f\x7f]*"
+# Rest of a line after a value or table header, or a blank or comment line
+_PLAIN_END = re.compile(rf"[ \t]*(?:{_PLAIN_COMMENT})?(?:\n|\r\n|\Z)")
+# Whitespace, line endings and comments between the items of arrays and
+# inline tables
+_PLAIN_SEP = re.compile(rf"(?:[ \t\n]|\r\n|{_PLAIN_COMMENT}(?=\r?\n))*")
+_PLAIN_KEY = re.compile(
+    r"[ \t]*([A-Za-z0-9_-]+(?:[ \t]*\.[ \t]*[A-Za-z0-9_-]+)*)[ \t]*=[ \t]*"
+)
+_PLAIN_BASIC = re.compile(r'"(?!"")([^"\\\x00-\x08\x0a-\x1f\x7f]*)"')
+_PLAIN_LITERAL = re.compile(r"'(?!'')([^'\x00-\x08\x0a-\x1f\x7f]*)'")
+_PLAIN_INT = re.compile(r"(?:0|[1-9][0-9]{0,17})(?![^ \t\n\r#,\]}])")
+# Arrays and inline tables are matched recursively, so deeper ones are left
+# to the regular parse
+_PLAIN_MAX_DEPTH = 32
+
 
 class Parser:
     """
     Parser for TOML documents.
     """
 
-    # Deeply nested documents would overflow the interpreter stack: arrays and
-    # inline tables are parsed recursively, and every fragment of a dotted key
-    # adds a level of nested containers. Refuse documents beyond this depth.
+    # Deeply nested documents would overflow the interpreter stack: while
+    # arrays and inline tables are parsed without recursion, the items parsed
+    # are rendered and unwrapped recursively, and every fragment of a dotted
+    # key adds a level of nested containers. By default, documents beyond this
+    # depth are refused.
     MAX_NESTING_DEPTH = 100
 
-    def __init__(self, string: str | bytes) -> None:
-        # Input to parse
-        self._src = Source(decode(string))
+    def __init__(
+        self, string: str | bytes, line_offset: int = 0, max_depth: int | None = None
+    ) -> None:
+        # Input to parse, possibly one chunk of a larger document starting
+        # after line_offset lines (see parse_lines())
+        self._src = Source(
+            decode(string, ["utf-8-sig", "latin1", "ascii"]), line_offset
+        )
 
-        self._aot_stack: list[Key] = []
-        self._nesting_depth = 0
+        # When False, only values are kept: whitespace and comments are still
+        # scanned (and validated) but never stored, see parse_values().
+        self._preserve = True
+        # Whether top-level tables are parsed on first access, see parse()
+        self._lazy = False
+        # Whether the offsets of keys, values and table headers are recorded
+        self._track_positions = False
 
-    @property
-    def _state(self) -> _StateHandler:
-        return self._src.state
+        self._aot_stack: list[Key] = []
+        # How deep values and dotted keys may be nested
+        self._max_depth = self.MAX_NESTING_DEPTH if max_depth is None else max_depth
+        # Number of table bodies being parsed, and the top-level chunks of
+        # the document when they are being recorded, see reparse()
+        self._table_depth = 0
+        self._spans: list[Span] | None = None
+        # Name of the table header last peeked at: where the name starts, the
+        # parsed key, and where it ends (with the marker there), so that
+        # parsing the header does not parse its name again
+        self._peeked: tuple[int, Key, int, int] | None = None
+        # Keys parsed so far by their spelling and separator, so that the
+        # keys repeated in every table of an array share one object
+        self._keys: dict[tuple[str, str], Key] = {}
 
     @property
     def _idx(self) -> int:
@@ -172,9 +259,242 @@ class Parser:
         """
         return self._src.parse_error(exception, *args, **kwargs)
 
-    def parse(self) -> TOMLDocument:
+    def parse(
+        self,
+        lazy: bool = False,
+        track_positions: bool = False,
+        incremental: bool = False,
+    ) -> TOMLDocument:
+        """
+        Parses the document.
+
+        If ``lazy`` is true, only the table headers are parsed up front: the
+        items of each top-level table (or array of tables element) are parsed
+        when the table is first accessed, and syntax errors in them are only
+        raised then.
+
+        If ``track_positions`` is true, the offsets of each key, value and
+        table header in the source are recorded, see
+        :meth:`TOMLDocument.locate`.
+
+        If ``incremental`` is true, the source and the offsets of its
+        top-level chunks are kept, so that :meth:`TOMLDocument.reparse` only
+        parses again the chunk an edit falls in.
+        """
+        self._lazy = lazy
+        self._track_positions = track_positions
+        self._spans = [] if incremental else None
+        body = TOMLDocument(True)
+        self._parse_into(body)
+        body.parsing(False)
+
+        body._track_positions = track_positions
+        if self._spans is not None:
+            body._source = self._src
+            body._spans, self._spans = self._spans, None
+
+        body._cache_source(self._src)
+
+        return body
+
+    def parse_values(self) -> dict[str, Any]:
+        """
+        Parses the document into plain Python objects, as
+        ``parse().unwrap()`` would.
+
+        The usual lines and values are read straight into dicts, lists and
+        scalars, without building items. Other documents, including invalid
+        ones, are parsed again into items, dropping whitespace and comments
+        as they are read, so that errors are the same as with :meth:`parse`.
+        """
+        tables = _PlainTables()
+        try:
+            self._parse_plain(tables)
+        except Exception:  # noqa: BLE001
+            # Whatever the error, the one raised is that of the regular parse
+            self._src.restore(0, 0)
+        else:
+            return tables.root
+
+        self._preserve = False
         body = TOMLDocument(True)
+        self._parse_into(body)
+
+        return body.unwrap()
+
+    def _parse_plain(self, tables: _PlainTables) -> None:
+        """
+        Reads the document into the plain values of ``tables``.
+
+        Raises _Fallback (or any other error) for anything left to the
+        regular parse, in which case the values read are incomplete.
+        """
+        src = self._src
+        end = len(src)
+        pos = 0
+        while pos < end:
+            m = _PLAIN_END.match(src, pos)
+            if m is not None:
+                # Blank or comment line
+                pos = m.end()
+                continue
+
+            pos = _skip(_PLAIN_SPACES, src, pos)
+            if src.startswith("[", pos):
+                m = _BARE_HEADER.match(src, pos)
+                is_aot = m is not None and m.group(1) == "[["
+                if m is None or src.startswith("]", m.end()) != is_aot:
+                    src.skip_to(pos)
+                    is_aot, key, _ = self._parse_table_header()
+                    parts = [k.key for k in key]
+                    pos = src.idx
+                else:
+                    parts = self._plain_parts(m.group(2))
+                    m = _PLAIN_END.match(src, m.end() + is_aot)
+                    if m is None:
+                        raise _Fallback
+
+                    pos = m.end()
+
+                tables.open(parts, is_aot)
+                continue
+
+            parts, pos = self._plain_key(pos)
+            value, pos = self._plain_value(pos, 0)
+            m = _PLAIN_END.match(src, pos)
+            if m is None:
+                raise _Fallback
+
+            pos = m.end()
+            _put_plain(tables.current, parts, value, tables.dotted)
+
+    def _plain_parts(self, key: str) -> list[str]:
+        if "." not in key:
+            return [key]
+
+        parts = [part.strip(" \t") for part in key.split(".")]
+        if len(parts) > self._max_depth:
+            raise _Fallback
+
+        return parts
+
+    def _plain_key(self, pos: int) -> tuple[list[str], int]:
+        """
+        Reads the key of a key/value pair starting at ``pos``, and returns
+        its fragments with where its value starts.
+        """
+        m = _PLAIN_KEY.match(self._src, pos)
+        if m is not None:
+            return self._plain_parts(m.group(1)), m.end()
+
+        self._src.skip_to(pos)
+        _, key = self._parse_key_and_separator()
+
+        return [k.key for k in key], self._src.idx
+
+    def _plain_value(self, pos: int, depth: int) -> tuple[Any, int]:
+        """
+        Reads the value starting at ``pos``, nested in ``depth`` arrays and
+        inline tables, and returns it with where it ends.
+        """
+        src = self._src
+        c = src[pos : pos + 1]
+        m = None
+        if c == '"':
+            m = _PLAIN_BASIC.match(src, pos)
+        elif c == "'":
+            m = _PLAIN_LITERAL.match(src, pos)
+        elif c == "[":
+            return self._plain_array(pos, depth)
+        elif c == "{":
+            return self._plain_inline_table(pos, depth)
+        elif c == "t":
+            if src.startswith("true", pos):
+                return True, pos + 4
+        elif c == "f":
+            if src.startswith("false", pos):
+                return False, pos + 5
+        elif c.isdigit():
+            m = _PLAIN_INT.match(src, pos)
+            if m is not None:
+                return int(m.group()), m.end()
+
+        if m is not None:
+            return m.group(1), m.end()
+
+        src.skip_to(pos)
+        value = self._parse_value().unwrap()
+
+        return value, src.idx
+
+    def _plain_array(self, pos: int, depth: int) -> tuple[list[Any], int]:
+        if depth >= self._max_depth or depth >= _PLAIN_MAX_DEPTH:
+            raise _Fallback
+
+        src = self._src
+        values = []
+        pos = _skip(_PLAIN_SEP, src, pos + 1)
+        while not src.startswith("]", pos):
+            value, pos = self._plain_value(pos, depth + 1)
+            values.append(value)
+            pos = _skip(_PLAIN_SEP, src, pos)
+            if src.startswith(",", pos):
+                pos = _skip(_PLAIN_SEP, src, pos + 1)
+            elif not src.startswith("]", pos):
+                raise _Fallback
+
+        return values, pos + 1
+
+    def _plain_inline_table(self, pos: int, depth: int) -> tuple[dict[str, Any], int]:
+        if depth >= self._max_depth or depth >= _PLAIN_MAX_DEPTH:
+            raise _Fallback
+
+        src = self._src
+        table: dict[str, Any] = {}
+        dotted: set[int] = set()
+        pos = _skip(_PLAIN_SEP, src, pos + 1)
+        while not src.startswith("}", pos):
+            parts, pos = self._plain_key(pos)
+            value, pos = self._plain_value(pos, depth + 1)
+            _put_plain(table, parts, value, dotted)
+            pos = _skip(_PLAIN_SEP, src, pos)
+            if src.startswith(",", pos):
+                pos = _skip(_PLAIN_SEP, src, pos + 1)
+            elif not src.startswith("}", pos):
+                raise _Fallback
+
+        return table, pos + 1
+
+    def _parse_into(self, body: TOMLDocument) -> None:
+        self._parse_key_values(body)
+        if self._spans is not None:
+            self._spans.append(Span(0, 0, self._span_end(), len(body.body)))
+
+        for key, value in self._parse_tables():
+            count = len(body.body)
+            try:
+                body.append(key, value)
+            except Exception as e:
+                raise self.parse_error(ParseError, str(e)) from e
+
+            if self._spans is not None:
+                self._record_spans(body, key, count)
+
+    def _parse_tables(self) -> Iterator[tuple[Key, Item]]:
+        """
+        Parses the top-level tables and arrays of tables up to the end of the
+        input, yielding each one as it is to be appended to the document.
+        """
+        while not self.end():
+            key, value = self._parse_table(lazy=self._lazy)
+            if isinstance(value, Table) and value.is_aot_element():
+                # This is just the first table in an AoT. Parse the rest of the array
+                # along with it.
+                value = self._parse_aot(value, key, self._lazy)
 
+            yield key, value
+
+    def _parse_key_values(self, body: Container) -> None:
         # Take all keyvals outside of tables/AoT's.
         while not self.end():
             # Break out if a table is found
@@ -187,6 +507,11 @@ class Parser:
                 break
 
             key, value = item
+            if key is None and not self._preserve:
+                # Whitespace or comment, not kept in values-only mode
+                self.mark()
+                continue
+
             if (key is not None and key.is_multi()) or not self._merge_ws(value, body):
                 # We actually have a table
                 try:
@@ -196,21 +521,68 @@ class Parser:
 
             self.mark()
 
-        while not self.end():
-            key, value = self._parse_table()
-            if isinstance(value, Table) and value.is_aot_element():
-                # This is just the first table in an AoT. Parse the rest of the array
-                # along with it.
-                value = self._parse_aot(value, key)
+    def _span_end(self) -> int:
+        # The next chunk starts with the indentation of its table header
+        return len(self._src) if self.end() else self._marker
 
-            try:
-                body.append(key, value)
-            except Exception as e:
-                raise self.parse_error(ParseError, str(e)) from e
+    def _record_spans(self, body: TOMLDocument, key: Key, count: int) -> None:
+        """
+        Gives the spans recorded for the tables just appended to the document
+        the index of the item they ended up in.
+        """
+        assert self._spans is not None
+        first = len(self._spans)
+        while first and self._spans[first - 1].item < 0:
+            first -= 1
+
+        spans = self._spans[first:]
+        del self._spans[first:]
+        if len(body.body) != count + 1:
+            # Merged into an existing item, whose text is now split across
+            # several chunks: it can only be reparsed with the whole document
+            index = body._map[key]
+            indices = index if isinstance(index, tuple) else (index,)
+            self._spans[1:] = [s for s in self._spans[1:] if s.item not in indices]
+            return
+
+        value = body.body[count][1]
+        if isinstance(value, AoT) and len(spans) == len(value.body):
+            self._spans.extend(
+                span._replace(item=count, element=i) for i, span in enumerate(spans)
+            )
+        elif isinstance(value, Table) and len(spans) == 1:
+            self._spans.append(spans[0]._replace(item=count))
 
-        body.parsing(False)
+    def iter_events(self, offset: int = 0) -> Iterator[Event]:
+        """
+        Parses the document lazily into a stream of events, without building
+        the document itself.
 
-        return body
+        Each event is produced as soon as its text has been parsed, so the
+        caller can stop at any point. Only the syntax is validated: redefined
+        keys and tables are not detected. ``offset`` is added to the source
+        offsets of the events.
+        """
+        table: tuple[str, ...] = ()
+        while not self.end():
+            start = self._idx
+            item = self._parse_item()
+            if item is None:
+                is_aot, name, _ = self._parse_table_header()
+                table = tuple(k.key for k in name)
+                kind = "aot_header" if is_aot else "table_header"
+                yield Event(kind, table, offset + start, offset + self._idx)
+                continue
+
+            key, value = item
+            if key is not None:
+                path = table + tuple(k.key for k in key)
+                kind = "key_value"
+            else:
+                path = table
+                kind = "comment" if isinstance(value, Comment) else "whitespace"
+
+            yield Event(kind, path, offset + start, offset + self._idx, value)
 
     def _merge_ws(self, item: Item, container: Container) -> bool:
         """
@@ -234,18 +606,15 @@ class Parser:
 
         return True
 
-    def _is_child(self, parent: Key, child: Key) -> bool:
+    def _is_child(self, parent: tuple[Key, ...], child: Key) -> bool:
         """
-        Returns whether a key is strictly a child of another key.
+        Returns whether a key is strictly a child of another key, given as
+        the tuple of its parts.
         AoT siblings are not considered children of one another.
         """
-        parent_parts = tuple(parent)
         child_parts = tuple(child)
 
-        if parent_parts == child_parts:
-            return False
-
-        return parent_parts == child_parts[: len(parent_parts)]
+        return len(child_parts) > len(parent) and child_parts[: len(parent)] == parent
 
     def _parse_item(self) -> tuple[Key | None, Item] | None:
         """
@@ -253,7 +622,8 @@ class Parser:
         if the item is value-like.
         """
         self.mark()
-        with self._state as state:
+        checkpoint = self._src.save()
+        try:
             while True:
                 c = self._current
                 if c == "\n":
@@ -263,11 +633,7 @@ class Parser:
                     return None, Whitespace(self.extract())
                 elif c in " \t\r":
                     if c == "\r":
-                        with self._state(restore=True):
-                            if not self.inc() or self._current != "\n":
-                                raise self.parse_error(
-                                    InvalidControlChar, CTRL_M, "documents"
-                                )
+                        self._check_crlf("documents")
                     # Skip whitespace.
                     if not self.inc():
                         return None, Whitespace(self.extract())
@@ -282,13 +648,31 @@ class Parser:
                     return None
                 else:
                     # Beginning of a KV pair.
-                    # Return to beginning of whitespace so it gets included
-                    # as indentation for the KV about to be parsed.
-                    state.restore = True
                     break
+        except BaseException:
+            self._src.restore(checkpoint)
+            raise
+
+        # Return to beginning of whitespace so it gets included
+        # as indentation for the KV about to be parsed.
+        self._src.restore(checkpoint)
 
         return self._parse_key_value(True)
 
+    def _check_crlf(self, context: str) -> None:
+        """
+        Raises an error, located after it, if the current carriage return
+        is not followed by a line feed.
+        """
+        src = self._src
+        if not src.startswith("\n", src._idx + 1):
+            checkpoint = src.save()
+            src.inc()
+            error = self.parse_error(InvalidControlChar, CTRL_M, context)
+            src.restore(checkpoint)
+
+            raise error
+
     def _parse_comment_trail(self, parse_trail: bool = True) -> tuple[str, str, str]:
         """
         Returns (comment_ws, comment, trail)
@@ -328,11 +712,7 @@ class Parser:
                 break
             elif c in " \t\r":
                 if c == "\r":
-                    with self._state(restore=True):
-                        if not self.inc() or self._current != "\n":
-                            raise self.parse_error(
-                                InvalidControlChar, CTRL_M, "comments"
-                            )
+                    self._check_crlf("comments")
                 self.inc()
             else:
                 raise self.parse_error(UnexpectedCharError, c)
@@ -345,9 +725,7 @@ class Parser:
             self._src.advance_while(_SPACES)
 
             if self._current == "\r":
-                with self._state(restore=True):
-                    if not self.inc() or self._current != "\n":
-                        raise self.parse_error(InvalidControlChar, CTRL_M, "documents")
+                self._check_crlf("documents")
                 self.inc()
 
             if self._current == "\n":
@@ -359,6 +737,36 @@ class Parser:
         return comment_ws, comment, trail
 
     def _parse_key_value(self, parse_comment: bool = False) -> tuple[Key, Item]:
+        indent, key = self._parse_key_and_separator()
+
+        # Value
+        start = self._idx
+        val = self._parse_value()
+        if self._track_positions:
+            # Dates swallow the whitespace after them
+            val._span = (start, self._idx - len(val.trivia.comment_ws))
+
+        # Comment
+        if parse_comment:
+            cws, comment, trail = self._parse_comment_trail()
+            meta = val.trivia
+            if not meta.comment_ws:
+                meta.comment_ws = cws
+
+            meta.comment = comment
+            meta.trail = trail
+        else:
+            val.trivia.trail = ""
+
+        val.trivia.indent = indent
+
+        return key, val
+
+    def _parse_key_and_separator(self) -> tuple[str, Key]:
+        """
+        Parses the indent, key and equal sign of a key/value pair, up to its
+        value.
+        """
         # Leading indent
         self.mark()
 
@@ -386,23 +794,7 @@ class Parser:
         else:
             key.sep += self.extract()
 
-        # Value
-        val = self._parse_value()
-        # Comment
-        if parse_comment:
-            cws, comment, trail = self._parse_comment_trail()
-            meta = val.trivia
-            if not meta.comment_ws:
-                meta.comment_ws = cws
-
-            meta.comment = comment
-            meta.trail = trail
-        else:
-            val.trivia.trail = ""
-
-        val.trivia.indent = indent
-
-        return key, val
+        return indent, self._intern(key)
 
     def _parse_key(self) -> Key:
         """
@@ -413,16 +805,34 @@ class Parser:
         fragments = 1
         while self._current == ".":
             fragments += 1
-            if fragments > self.MAX_NESTING_DEPTH:
+            if fragments > self._max_depth:
                 raise self.parse_error(
                     ParseError,
-                    f"TOML key nested more than {self.MAX_NESTING_DEPTH} levels deep",
+                    f"TOML key nested more than {self._max_depth} levels deep",
                 )
             self.inc()
             key = key.concat(self._parse_simple_key())
 
+        if self._track_positions and key.is_multi():
+            parts = key._keys
+            assert parts[0]._span is not None and parts[-1]._span is not None
+            key._span = (parts[0]._span[0], parts[-1]._span[1])
+
         return key
 
+    def _intern(self, key: Key) -> Key:
+        """
+        Returns the key parsed before with the same spelling and separator,
+        if any, or remembers the given one. Its separator must be final.
+
+        Dotted keys are not shared: their parts are updated when they are
+        added to a container.
+        """
+        if key.is_multi() or self._track_positions:
+            return key
+
+        return self._keys.setdefault((key.as_string(), key.sep), key)
+
     def _parse_simple_key(self) -> Key:
         """
         Parses a single (non-dotted) key fragment.
@@ -430,10 +840,16 @@ class Parser:
         self.mark()
         # Skip any leading whitespace (bulk scan)
         self._src.advance_while(_SPACES)
+        start = self._idx
         if self._current in "\"'":
-            return self._parse_quoted_key()
+            key = self._parse_quoted_key()
         else:
-            return self._parse_bare_key()
+            key = self._parse_bare_key()
+
+        if self._track_positions:
+            key._span = (start, start + len(key.as_string().strip(" \t")))
+
+        return key
 
     def _parse_quoted_key(self) -> Key:
         """
@@ -493,10 +909,8 @@ class Parser:
             return self._parse_true()
         elif c == BoolType.FALSE.value[0]:
             return self._parse_false()
-        elif c == "[":
-            return self._parse_nested(self._parse_array)
-        elif c == "{":
-            return self._parse_nested(self._parse_inline_table)
+        elif c in "[{":
+            return self._parse_nested()
         elif c in "+-" or self._peek(4) in {
             "+inf",
             "-inf",
@@ -605,7 +1019,8 @@ class Parser:
         return self._parse_bool(BoolType.FALSE)
 
     def _parse_bool(self, style: BoolType) -> Bool:
-        with self._state:
+        checkpoint = self._src.save()
+        try:
             style = BoolType(style)
 
             # only keep parsing for bool if the characters match the style
@@ -614,28 +1029,80 @@ class Parser:
                 self.consume(c, min=1, max=1)
 
             return Bool(style, Trivia())
+        except BaseException:
+            self._src.restore(checkpoint)
+            raise
 
-    def _parse_nested(self, parse: Callable[[], Item]) -> Item:
+    def _parse_nested(self) -> Item:
         """
-        Parses an array or inline table, enforcing the nesting depth limit.
+        Parses the array or inline table at the current position.
+
+        The arrays and inline tables nested in it are parsed in the same loop,
+        with a stack of those still open, rather than recursively: how deep
+        values may be nested is only limited by ``max_depth``.
         """
-        self._nesting_depth += 1
-        if self._nesting_depth > self.MAX_NESTING_DEPTH:
-            raise self.parse_error(
-                ParseError,
-                f"TOML value nested more than {self.MAX_NESTING_DEPTH} levels deep",
-            )
-        try:
-            return parse()
-        finally:
-            self._nesting_depth -= 1
+        stack: list[_OpenArray | _OpenInlineTable] = []
+        while True:
+            # Open the array or inline table at the current position
+            if len(stack) >= self._max_depth:
+                raise self.parse_error(
+                    ParseError,
+                    f"TOML value nested more than {self._max_depth} levels deep",
+                )
+            self.mark()
+            start = self._idx
+            if self._current == "[":
+                stack.append(_OpenArray(start, []))
+            else:
+                stack.append(_OpenInlineTable(start, Container(True)))
+            # Consume opening bracket, EOF here is an issue (middle of value)
+            self.inc(exception=UnexpectedEofError)
 
-    def _parse_array(self) -> Array:
-        # Consume opening bracket, EOF here is an issue (middle of array)
-        self.inc(exception=UnexpectedEofError)
+            while True:
+                frame = stack[-1]
+                value: Item | None
+                if isinstance(frame, _OpenArray):
+                    value = self._parse_array(frame)
+                else:
+                    value = self._parse_inline_table(frame)
+                if value is None:
+                    # Another value opens at the current position
+                    break
+
+                stack.pop()
+                if not stack:
+                    return value
+
+                self._add_nested(stack[-1], value, frame.start)
+
+    def _add_nested(
+        self, frame: _OpenArray | _OpenInlineTable, value: Item, start: int
+    ) -> None:
+        """
+        Adds a value starting at ``start`` to the array or inline table being
+        parsed.
+        """
+        if self._track_positions:
+            # Dates swallow the whitespace after them
+            value._span = (start, self._idx - len(value.trivia.comment_ws))
 
-        elems: list[Item] = []
-        prev_value = None
+        if isinstance(frame, _OpenArray):
+            frame.elems.append(value)
+            frame.prev_value = True
+        else:
+            value.trivia.trail = ""
+            value.trivia.indent = frame.indent
+            assert frame.key is not None
+            frame.elems.add(frame.key, value)
+            frame.expect_key = False
+
+    def _parse_array(self, frame: _OpenArray) -> Array | None:
+        """
+        Parses the items of an array up to its closing bracket, or up to an
+        array or inline table in it, in which case None is returned.
+        """
+        elems = frame.elems
+        prev_value = frame.prev_value
         while True:
             # consume whitespace
             mark = self._idx
@@ -643,18 +1110,21 @@ class Parser:
             indent = self._src[mark : self._idx]
             newline = _NL & set(indent)
             if newline:
-                elems.append(Whitespace(indent))
+                if self._preserve:
+                    elems.append(Whitespace(indent))
                 continue
 
             # consume comment
             if self._current == "#":
                 cws, comment, trail = self._parse_comment_trail(parse_trail=False)
-                elems.append(Comment(Trivia(indent, cws, comment, trail)))
+                if self._preserve:
+                    elems.append(Comment(Trivia(indent, cws, comment, trail)))
                 continue
 
             # consume indent
             if indent:
-                elems.append(Whitespace(indent))
+                if self._preserve:
+                    elems.append(Whitespace(indent))
                 continue
 
             # consume value
@@ -665,18 +1135,28 @@ class Parser:
             # exception eagerly computes a line/column, which scans the whole
             # source. On a large file with many arrays this is a big, pure waste.
             if not prev_value and self._current != "]":
-                elems.append(self._parse_value())
+                if self._current in "[{":
+                    frame.prev_value = False
+                    return None
+
+                start = self._idx
+                value = self._parse_value()
+                if self._track_positions:
+                    value._span = (start, self._idx - len(value.trivia.comment_ws))
+
+                elems.append(value)
                 prev_value = True
                 continue
 
             # consume comma
             if prev_value and self._current == ",":
                 self.inc(exception=UnexpectedEofError)
-                # If the previous item is Whitespace, add to it
-                if isinstance(elems[-1], Whitespace):
-                    elems[-1]._s = elems[-1].s + ","
-                else:
-                    elems.append(Whitespace(","))
+                if self._preserve:
+                    # If the previous item is Whitespace, add to it
+                    if isinstance(elems[-1], Whitespace):
+                        elems[-1]._s = elems[-1].s + ","
+                    else:
+                        elems.append(Whitespace(","))
                 prev_value = False
                 continue
 
@@ -697,47 +1177,52 @@ class Parser:
 
         raise self.parse_error(ParseError, "Failed to parse array")
 
-    def _parse_inline_table(self) -> InlineTable:
-        # consume opening bracket, EOF here is an issue (middle of array)
-        self.inc(exception=UnexpectedEofError)
-
-        elems = Container(True)
-        expect_key = True
+    def _parse_inline_table(self, frame: _OpenInlineTable) -> InlineTable | None:
+        """
+        Parses the items of an inline table up to its closing brace, or up to
+        an array or inline table in it, in which case None is returned.
+        """
+        elems = frame.elems
         while True:
             while True:
                 # consume whitespace and newlines
                 mark = self._idx
                 self.consume(" \t\n\r")
                 raw = self._src[mark : self._idx]
-                if raw:
+                if raw and self._preserve:
                     elems.add(Whitespace(raw))
 
                 if self._current != "#":
                     break
 
                 cws, comment, trail = self._parse_comment_trail(parse_trail=False)
-                elems.add(Comment(Trivia("", cws, comment, trail)))
+                if self._preserve:
+                    elems.add(Comment(Trivia("", cws, comment, trail)))
 
             if self._current == "}":
                 # consume closing bracket, EOF here doesn't matter
                 self.inc()
                 break
 
-            if expect_key:
+            if frame.expect_key:
                 if self._current == ",":
                     raise self.parse_error(UnexpectedCharError, self._current)
-                key, val = self._parse_key_value(False)
-                elems.add(key, val)
-                expect_key = False
+                frame.indent, frame.key = self._parse_key_and_separator()
+                if self._current in "[{":
+                    return None
+
+                start = self._idx
+                self._add_nested(frame, self._parse_value(), start)
                 continue
 
             if self._current != ",":
                 raise self.parse_error(UnexpectedCharError, self._current)
 
-            elems.add(Whitespace(","))
+            if self._preserve:
+                elems.add(Whitespace(","))
             # consume comma, EOF here is an issue (middle of inline table)
             self.inc(exception=UnexpectedEofError)
-            expect_key = True
+            frame.expect_key = True
 
         return InlineTable(elems, Trivia())
 
@@ -798,12 +1283,20 @@ class Parser:
         return None
 
     def _parse_literal_string(self) -> String:
-        with self._state:
+        checkpoint = self._src.save()
+        try:
             return self._parse_string(StringType.SLL)
+        except BaseException:
+            self._src.restore(checkpoint)
+            raise
 
     def _parse_basic_string(self) -> String:
-        with self._state:
+        checkpoint = self._src.save()
+        try:
             return self._parse_string(StringType.SLB)
+        except BaseException:
+            self._src.restore(checkpoint)
+            raise
 
     def _parse_escaped_char(self, multiline: bool) -> str:
         if multiline and self._current in _WS:
@@ -861,6 +1354,36 @@ class Parser:
 
         raise self.parse_error(InvalidCharInStringError, self._current)
 
+    def _parse_basic_string_body(self, delim: StringType) -> String | None:
+        """
+        Parses the rest of a basic string with a regular expression, decoding
+        all of its escapes at once.
+
+        Returns None, without moving, if the string is not valid, to let the
+        character by character parse report the error.
+        """
+        src = self._src
+        body = _MULTI_BASIC_BODY if delim.is_multiline() else _SINGLE_BASIC_BODY
+        m = body.match(src, src._idx)
+        if m is None:
+            return None
+
+        value = m.group(1)
+        if "\\" in value:
+            try:
+                value = _BASIC_UNESCAPE.sub(_unescape, value)
+            except ValueError:
+                # Not a unicode scalar value
+                return None
+
+        # Quotes before the closing delimiter of a multiline string
+        quotes = m.group(2)[:-3]
+        src.skip_to(m.end())
+
+        return String(
+            delim, value + quotes, src[src._marker : m.start(2)] + quotes, Trivia()
+        )
+
     def _parse_string(self, delim: StringType) -> String:
         # only keep parsing for string if the current character matches the delim
         if self._current != delim.unit:
@@ -893,13 +1416,13 @@ class Parser:
             if self._current == "\n":
                 # consume the newline, EOF here is an issue (middle of string)
                 self.inc(exception=UnexpectedEofError)
-            else:
-                cur: str = self._current
-                with self._state(restore=True):
-                    if self.inc():
-                        cur += self._current
-                if cur == "\r\n":
-                    self.inc_n(2, exception=UnexpectedEofError)
+            elif self._src.startswith("\r\n", self._idx):
+                self.inc_n(2, exception=UnexpectedEofError)
+
+        if delim.is_basic():
+            string = self._parse_basic_string_body(delim)
+            if string is not None:
+                return string
 
         # PERF: stop-set for the string-body bulk fast-path. The body run is
         # appended in a single slice up to the next delimiter / escape / control
@@ -930,9 +1453,7 @@ class Parser:
             ):
                 raise self.parse_error(InvalidControlChar, code, "strings")
             elif delim.is_multiline() and not escaped and self._current == "\r":
-                with self._state(restore=True):
-                    if not self.inc() or self._current != "\n":
-                        raise self.parse_error(InvalidControlChar, CTRL_M, "strings")
+                self._check_crlf("strings")
                 value += self._current
                 self.inc(exception=UnexpectedEofError)
             elif not escaped and self._current == delim.unit:
@@ -1001,44 +1522,24 @@ class Parser:
                 value += src[run_start : src._idx]
 
     def _parse_table(
-        self, parent_name: Key | None = None, parent: Table | None = None
+        self,
+        parent_name: Key | None = None,
+        parent: Table | None = None,
+        lazy: bool = False,
     ) -> tuple[Key, Table | AoT]:
         """
         Parses a table element.
-        """
-        if self._current != "[":
-            raise self.parse_error(
-                InternalParserError, "_parse_table() called on non-bracket character."
-            )
-
-        indent = self.extract()
-        self.inc()  # Skip opening bracket
-
-        if self.end():
-            raise self.parse_error(UnexpectedEofError)
-
-        is_aot = False
-        if self._current == "[":
-            if not self.inc():
-                raise self.parse_error(UnexpectedEofError)
 
-            is_aot = True
-        try:
-            key = self._parse_key()
-        except EmptyKeyError:
-            raise self.parse_error(EmptyTableNameError) from None
-        if self.end():
-            raise self.parse_error(UnexpectedEofError)
-        elif self._current != "]":
-            raise self.parse_error(UnexpectedCharError, self._current)
-
-        key.sep = ""
+        If ``lazy`` is true, the items of the table are only parsed when the
+        table is first accessed.
+        """
+        start = self._marker
+        is_aot, key, trivia = self._parse_table_header()
+        body_start = self._idx
+        indent = trivia.indent
+        cws, comment, trail = trivia.comment_ws, trivia.comment, trivia.trail
         full_key = key
         name_parts = tuple(key)
-        if any(" " in part.key.strip() and part.is_bare() for part in name_parts):
-            raise self.parse_error(
-                ParseError, f'Invalid table name "{full_key.as_string()}"'
-            )
 
         missing_table = False
         if parent_name:
@@ -1053,21 +1554,10 @@ class Parser:
 
         values = Container(True)
 
-        self.inc()  # Skip closing bracket
-        if is_aot:
-            if self.end():
-                raise self.parse_error(UnexpectedEofError)
-            elif self._current != "]":
-                raise self.parse_error(UnexpectedCharError, self._current)
-
-            self.inc()  # Skip second closing bracket
-
-        cws, comment, trail = self._parse_comment_trail()
-
         result: Table | AoT = Null()  # type: ignore[assignment]
         table = Table(
             values,
-            Trivia(indent, cws, comment, trail),
+            trivia,
             is_aot,
             name=name_parts[0].key if name_parts else key.key,
             display_name=full_key.as_string(),
@@ -1092,18 +1582,16 @@ class Parser:
             result = table
             key = name_parts[0]
 
+            # The tables created here are new, so none of them has a child yet
             for i, _name in enumerate(name_parts[1:]):
-                child = table.get(
-                    _name,
-                    Table(
-                        Container(True),
-                        Trivia(indent, cws, comment, trail),
-                        is_aot and i == len(name_parts) - 2,
-                        is_super_table=i < len(name_parts) - 2,
-                        name=_name.key,
-                        display_name=(
-                            full_key.as_string() if i == len(name_parts) - 2 else None
-                        ),
+                child = Table(
+                    Container(True),
+                    Trivia(indent, cws, comment, trail),
+                    is_aot and i == len(name_parts) - 2,
+                    is_super_table=i < len(name_parts) - 2,
+                    name=_name.key,
+                    display_name=(
+                        full_key.as_string() if i == len(name_parts) - 2 else None
                     ),
                 )
 
@@ -1118,31 +1606,56 @@ class Parser:
             if name_parts:
                 key = name_parts[0]
 
-        while not self.end():
-            parsed = self._parse_item()
-            if parsed:
-                _key, _val = parsed
-                if not self._merge_ws(_val, values):
-                    table.raw_append(_key, _val)
-            else:
-                if self._current == "[":
-                    _, key_next = self._peek_table()
+        if self._track_positions:
+            # The header, without its indentation and comment
+            header = start + len(indent)
+            brackets = 4 if is_aot else 2
+            table._span = (header, header + len(full_key.as_string()) + brackets)
 
-                    if self._is_child(full_key, key_next):
-                        key_next, table_next = self._parse_table(full_key, table)
+        if lazy:
+            self._skip_table_body(full_key, table)
+        else:
+            self._parse_table_body(full_key, table)
 
-                        table.raw_append(key_next, table_next)
+        if self._spans is not None and not self._table_depth:
+            # A top-level table (or array of tables element)
+            self._spans.append(Span(start, body_start, self._span_end(), -1))
+
+        if isinstance(result, Null):
+            result = table
+
+            if is_aot and (not self._aot_stack or full_key != self._aot_stack[-1]):
+                result = self._parse_aot(result, full_key, lazy)
+
+        return key, result
 
-                        # Picking up any sibling
-                        while not self.end():
-                            _, key_next = self._peek_table()
+    def _parse_table_body(self, full_key: Key, table: Table) -> None:
+        """
+        Parses the items of a table, along with its child tables.
+        """
+        values = table.value
+        self._table_depth += 1
+        while not self.end():
+            parsed = self._parse_item()
+            if parsed:
+                _key, _val = parsed
+                if _key is None and not self._preserve:
+                    continue
+                if not self._merge_ws(_val, values):
+                    table.raw_append(_key, _val)
+            else:
+                if self._current == "[":
+                    # Picking up the child tables and their siblings
+                    parent = tuple(full_key)
+                    while not self.end():
+                        _, key_next = self._peek_table()
 
-                            if not self._is_child(full_key, key_next):
-                                break
+                        if not self._is_child(parent, key_next):
+                            break
 
-                            key_next, table_next = self._parse_table(full_key, table)
+                        key_next, table_next = self._parse_table(full_key, table)
 
-                            table.raw_append(key_next, table_next)
+                        table.raw_append(key_next, table_next)
 
                     break
                 else:
@@ -1150,14 +1663,131 @@ class Parser:
                         InternalParserError,
                         "_parse_item() returned None on a non-bracket character.",
                     )
-        table.value._validate_out_of_order_table()
-        if isinstance(result, Null):
-            result = table
 
-            if is_aot and (not self._aot_stack or full_key != self._aot_stack[-1]):
-                result = self._parse_aot(result, full_key)
+        self._table_depth -= 1
+        values._validate_out_of_order_table()
 
-        return key, result
+    def _skip_table_body(self, full_key: Key, table: Table) -> None:
+        """
+        Moves past the items and child tables of a table without parsing
+        them: the table's container parses them when first accessed.
+        """
+        start = self._idx
+        end = self._find_table_end(full_key)
+        aot_stack = list(self._aot_stack)
+
+        def load() -> None:
+            # Parse from where the body starts, in the same state as
+            # _parse_table_body() would have, then resume where we were.
+            values = table.value
+            parsed = values._parsed
+            values.parsing(True)
+            checkpoint, marker = self._src.save(), self._marker
+            stack, self._aot_stack = self._aot_stack, aot_stack
+            try:
+                self._src.skip_to(start)
+                self._parse_table_body(full_key, table)
+            finally:
+                self._aot_stack = stack
+                self._src.restore(checkpoint, marker)
+
+            if not parsed:
+                values.parsing(False)
+
+        table._lazy = LazyItems(self._src, start, end, load)
+
+        # Stop on the next header like _parse_table_body() does
+        self._src.skip_to(end)
+        self.mark()
+        self._src.advance_while(_SPACES)
+
+    def _find_table_end(self, full_key: Key) -> int:
+        """
+        Returns the index of the first table header after the current
+        position which is not a child of the given table (or the end of
+        the input).
+        """
+        src = self._src
+        pos = self._idx
+        parts = tuple(part.key for part in full_key)
+        delim: str | None = None
+        depth = 0
+        while pos < len(src):
+            eol = src.find("\n", pos) + 1 or len(src)
+            line = src[pos:eol]
+            header = _peek_header(line, delim, depth)
+            if header is not None and (
+                header[1] == parts or header[1][: len(parts)] != parts
+            ):
+                # Not a child of the table
+                break
+
+            delim, depth = _scan_line(line, delim, depth)
+            pos = eol
+
+        return pos
+
+    def _parse_table_header(self) -> tuple[bool, Key, Trivia]:
+        """
+        Parses a table header up to the end of its line.
+
+        Returns whether it is an AoT header, the table name and the trivia
+        of the header.
+        """
+        if self._current != "[":
+            raise self.parse_error(
+                InternalParserError, "_parse_table() called on non-bracket character."
+            )
+
+        indent = self.extract()
+        self.inc()  # Skip opening bracket
+
+        if self.end():
+            raise self.parse_error(UnexpectedEofError)
+
+        is_aot = False
+        if self._current == "[":
+            if not self.inc():
+                raise self.parse_error(UnexpectedEofError)
+
+            is_aot = True
+
+        peeked = self._peeked
+        if peeked is not None and peeked[0] == self._idx:
+            # Already parsed by _peek_table()
+            self._peeked = None
+            _, key, end, marker = peeked
+            self._src.restore(end, marker)
+        else:
+            try:
+                key = self._parse_key()
+            except EmptyKeyError:
+                raise self.parse_error(EmptyTableNameError) from None
+
+        if self.end():
+            raise self.parse_error(UnexpectedEofError)
+        elif self._current != "]":
+            raise self.parse_error(UnexpectedCharError, self._current)
+
+        key.sep = ""
+        key = self._intern(key)
+        if any(" " in part.key.strip() and part.is_bare() for part in key):
+            raise self.parse_error(
+                ParseError, f'Invalid table name "{key.as_string()}"'
+            )
+
+        self.inc()  # Skip closing bracket
+        if is_aot:
+            if self.end():
+                raise self.parse_error(UnexpectedEofError)
+            elif self._current != "]":
+                raise self.parse_error(UnexpectedCharError, self._current)
+
+            self.inc()  # Skip second closing bracket
+
+        cws, comment, trail = self._parse_comment_trail()
+
+        return is_aot, key, Trivia(indent, cws, comment, trail)
 
     def _peek_table(self) -> tuple[bool, Key]:
         """
@@ -1168,7 +1798,8 @@ class Parser:
         as well as whether it is part of an AoT.
         """
         # we always want to restore after exiting this scope
-        with self._state(save_marker=True, restore=True):
+        checkpoint, marker = self._src.save(), self._marker
+        try:
             if self._current != "[":
                 raise self.parse_error(
                     InternalParserError,
@@ -1181,12 +1812,22 @@ class Parser:
             if self._current == "[":
                 self.inc()
                 is_aot = True
-            try:
-                return is_aot, self._parse_key()
-            except EmptyKeyError:
-                raise self.parse_error(EmptyTableNameError) from None
 
-    def _parse_aot(self, first: Table, name_first: Key) -> AoT:
+            start = self._idx
+            peeked = self._peeked
+            if peeked is None or peeked[0] != start:
+                try:
+                    key = self._parse_key()
+                except EmptyKeyError:
+                    raise self.parse_error(EmptyTableNameError) from None
+
+                peeked = self._peeked = (start, key, self._idx, self._marker)
+
+            return is_aot, peeked[1]
+        finally:
+            self._src.restore(checkpoint, marker)
+
+    def _parse_aot(self, first: Table, name_first: Key, lazy: bool = False) -> AoT:
         """
         Parses all siblings of the provided table first and bundles them into
         an AoT.
@@ -1196,7 +1837,7 @@ class Parser:
         while not self.end():
             is_aot_next, name_next = self._peek_table()
             if is_aot_next and name_next == name_first:
-                _, table = self._parse_table(name_first)
+                _, table = self._parse_table(name_first, lazy=lazy)
                 assert isinstance(table, Table)
                 payload.append(table)
             else:
@@ -1213,7 +1854,8 @@ class Parser:
         n is the max number of characters that will be peeked.
         """
         # we always want to restore after exiting this scope
-        with self._state(restore=True):
+        checkpoint = self._src.save()
+        try:
             buf = ""
             for _ in range(n):
                 if self._current not in " \t\n\r#,]}" + self._src.EOF:
@@ -1223,6 +1865,8 @@ class Parser:
 
                 break
             return buf
+        finally:
+            self._src.restore(checkpoint)
 
     def _peek_unicode(self, is_long: bool) -> tuple[str | None, str | None]:
         """
@@ -1232,7 +1876,8 @@ class Parser:
         Returns the unicode value is it's a valid one else None.
         """
         # we always want to restore after exiting this scope
-        with self._state(save_marker=True, restore=True):
+        checkpoint, marker = self._src.save(), self._marker
+        try:
             if self._current not in {"u", "U"}:
                 raise self.parse_error(
                     InternalParserError, "_peek_unicode() entered on non-unicode value"
@@ -1268,9 +1913,12 @@ class Parser:
                     value = None
 
             return value, extracted
+        finally:
+            self._src.restore(checkpoint, marker)
 
     def _peek_hex(self) -> tuple[str | None, str | None]:
-        with self._state(save_marker=True, restore=True):
+        checkpoint, marker = self._src.save(), self._marker
+        try:
             if self._current != "x":
                 raise self.parse_error(
                     InternalParserError, "_peek_hex() entered on non-hex value"
@@ -1292,3 +1940,854 @@ class Parser:
                 value = None
 
             return value, extracted
+        finally:
+            self._src.restore(checkpoint, marker)
+
+
+@dataclasses.dataclass(frozen=True)
+class Event:
+    """
+    An event produced by :meth:`Parser.iter_events`.
+    """
+
+    # One of "table_header", "aot_header", "key_value", "comment" or
+    # "whitespace".
+    kind: str
+    # Full name of the table for headers, of the value for key/value pairs,
+    # and of the current table otherwise.
+    path: tuple[str, ...]
+    # Offsets of the event's text in the source.
+    start: int
+    end: int
+    # The parsed item, None for headers.
+    value: Item | None = None
+
+
+@dataclasses.dataclass
+class _OpenArray:
+    """
+    An array being parsed by :meth:`Parser._parse_nested`.
+    """
+
+    # Offset of its opening bracket
+    start: int
+    elems: list[Item]
+    # Whether the last item parsed is a value, not yet followed by a comma
+    prev_value: bool = False
+
+
+@dataclasses.dataclass
+class _OpenInlineTable:
+    """
+    An inline table being parsed by :meth:`Parser._parse_nested`.
+    """
+
+    # Offset of its opening brace
+    start: int
+    elems: Container
+    # Whether a key comes next, rather than a comma or the closing brace
+    expect_key: bool = True
+    # The indent and key of the value being parsed
+    indent: str = ""
+    key: Key | None = None
+
+
+class _Fallback(Exception):
+    """
+    Raised by :meth:`Parser._parse_plain` for input it leaves to the regular
+    parse, which either accepts it or reports the error.
+    """
+
+
+class _PlainTables:
+    """
+    The tables of a document being parsed by :meth:`Parser._parse_plain`,
+    with how each one was defined, by their ids.
+
+    Only the ways of extending a table that are always valid are followed:
+    anything else, such as a table defined twice or a header naming a table
+    defined with dotted keys, is left to the regular parse.
+    """
+
+    def __init__(self) -> None:
+        self.root: dict[str, Any] = {}
+        # The table the key/value pairs parsed next go to
+        self.current = self.root
+        # Tables only named in the header of one of their children
+        self.implicit: set[int] = set()
+        # Tables with a header of their own, and those of them with children
+        # defined before their header
+        self.explicit: set[int] = set()
+        self.promoted: set[int] = set()
+        # Tables defined with dotted keys
+        self.dotted: set[int] = set()
+        # Lists of the tables of arrays of tables
+        self.aots: set[int] = set()
+        # Those of them in a table that is not itself in an array of tables,
+        # and the tables of arrays of tables
+        self.nested_aots: set[int] = set()
+        self.elements: set[int] = set()
+        # The current table and the tables it is in
+        self.path: set[int] = {id(self.root)}
+
+    def open(self, parts: list[str], is_aot: bool) -> None:
+        """
+        Makes the table with the given header the current one.
+        """
+        table = self.root
+        path = {id(table)}
+        for part in parts[:-1]:
+            child = table.get(part)
+            if child is None:
+                child = table[part] = {}
+                self.implicit.add(id(child))
+            elif id(child) in self.aots:
+                self._check_nested_aot(child)
+                child = child[-1]
+            elif id(child) in self.promoted and id(child) not in self.path:
+                # The regular parse refuses some of the headers of sub-tables
+                # after one of a super-table they were defined before
+                raise _Fallback
+            elif id(child) not in self.implicit and id(child) not in self.explicit:
+                raise _Fallback
+
+            table = child
+            path.add(id(table))
+
+        new: dict[str, Any] = {}
+        child = table.get(parts[-1])
+        if is_aot:
+            if child is None:
+                child = table[parts[-1]] = []
+                self.aots.add(id(child))
+                if table is not self.root and id(table) not in self.elements:
+                    self.nested_aots.add(id(child))
+            elif id(child) not in self.aots:
+                raise _Fallback
+            else:
+                self._check_nested_aot(child)
+
+            child.append(new)
+            self.elements.add(id(new))
+        elif child is None:
+            table[parts[-1]] = new
+        elif id(child) in self.implicit:
+            self.implicit.discard(id(child))
+            self.promoted.add(id(child))
+            new = child
+        else:
+            raise _Fallback
+
+        self.explicit.add(id(new))
+        self.current = new
+        path.add(id(new))
+        self.path = path
+
+    def _check_nested_aot(self, aot: list[dict[str, Any]]) -> None:
+        if id(aot) in self.nested_aots and id(aot[-1]) not in self.path:
+            # Arrays of tables in tables are only followed from their last
+            # table: the regular parse refuses some of the other cases
+            raise _Fallback
+
+
+def _skip(pattern: re.Pattern[str], src: str, pos: int) -> int:
+    """
+    Returns where a pattern that also matches the empty string, such as
+    ``_PLAIN_SEP``, ends when matched at ``pos``.
+    """
+    m = pattern.match(src, pos)
+    assert m is not None
+
+    return m.end()
+
+
+def _put_plain(
+    table: dict[str, Any], parts: list[str], value: Any, dotted: set[int]
+) -> None:
+    """
+    Adds a plain value with a possibly dotted key to a table, creating the
+    tables of the key's fragments, whose ids are added to ``dotted``.
+    """
+    for part in parts[:-1]:
+        child = table.get(part)
+        if child is None:
+            child = table[part] = {}
+            dotted.add(id(child))
+        elif id(child) not in dotted:
+            raise _Fallback
+
+        table = child
+
+    if parts[-1] in table:
+        raise _Fallback
+
+    table[parts[-1]] = value
+
+
+class Unit(NamedTuple):
+    """
+    A top-level chunk of a document, as produced by :func:`split_units`.
+    """
+
+    text: str
+    # Number of lines preceding the chunk in the document
+    line_offset: int
+    # Name of the array of tables this chunk continues, if any
+    aot: Key | None
+    # Whether the chunk ends the document
+    final: bool = False
+
+
+class Span(NamedTuple):
+    """
+    The text of a top-level chunk of a parsed document: either the key/value
+    pairs before the first table, or a table (or array of tables element)
+    with its child tables.
+    """
+
+    start: int
+    # Where the items start, after the table header if any
+    body: int
+    end: int
+    # Index of the chunk's item in the document body, or the number of items
+    # of the key/value pairs before the first table
+    item: int
+    # Index of the element for arrays of tables
+    element: int | None = None
+
+
+def _unescape(m: re.Match[str]) -> str:
+    escape = m.group()
+    if escape in _UNESCAPED:
+        return _UNESCAPED[escape]
+
+    prefix, digits = escape[1], escape[2:]
+    if prefix in "uUx":
+        codepoint = int(digits, 16)
+        if 0xD800 <= codepoint <= 0xDFFF:
+            raise ValueError("surrogate code point")
+
+        # Raises ValueError past U+10FFFF
+        return chr(codepoint)
+
+    # A backslash ending a line trims the following whitespace
+    return ""
+
+
+def _peek_header(
+    line: str, delim: str | None, depth: int
+) -> tuple[bool, tuple[str, ...]] | None:
+    """
+    Returns whether the line is an AoT header and the parts of its table name,
+    or None if it is not a table header, given the state returned by
+    :func:`_scan_line` for the previous lines.
+    """
+    if delim is not None or depth or not line.lstrip(" \t").startswith("["):
+        return None
+
+    m = _BARE_HEADER.match(line)
+    if m is not None:
+        parts = tuple(part.strip(" \t") for part in m.group(2).split("."))
+        return len(m.group(1)) == 2, parts
+
+    parser = Parser(line)
+    parser._src.advance_while(_SPACES)
+    try:
+        is_aot, key = parser._peek_table()
+    except ParseError:
+        # Not a valid header: the error is raised when parsing it
+        return None
+
+    return is_aot, tuple(part.key for part in key)
+
+
+def _scan_line(line: str, delim: str | None, depth: int) -> tuple[str | None, int]:
+    """
+    Returns the multiline string delimiter left open and the depth of nested
+    arrays and inline tables after the given line, starting from the state
+    after the previous lines.
+    """
+    pos = 0
+    if delim is not None:
+        m = _UNIT_STRING_END[delim].match(line)
+        if m is None:
+            return delim, depth
+
+        delim = None
+        pos = m.end()
+
+    for m in _UNIT_TOKEN.finditer(line, pos):
+        if m.start() < pos:
+            continue
+
+        token = m.group()
+        if token in _UNIT_STRING_END:
+            end = _UNIT_STRING_END[token].match(line, m.end())
+            if end is None:
+                return token, depth
+
+            pos = end.end()
+        elif token[0] in "\"'":
+            # A string closed on the same line
+            continue
+        elif token == "#":
+            break
+        elif token in "[{":
+            depth += 1
+        elif depth:
+            depth -= 1
+
+    return delim, depth
+
+
+def split_units(lines: Iterable[str]) -> Iterator[Unit]:
+    """
+    Groups the lines of a document into chunks that can be parsed one after
+    the other into the same document, with the exact same result as parsing
+    the whole text at once.
+
+    A chunk is either the key/value pairs before the first table, or a table
+    header with its body and the headers of its descendants, which is what the
+    parser appends to the document in one go. The elements of a top-level
+    array of tables are chunks of their own, so that a document made of
+    thousands of ``[[package]]`` entries is never held in memory as a whole.
+    """
+    buf: list[str] = []
+    line_offset = 0
+    head: tuple[str, ...] | None = None
+    head_aot: str | None = None
+    aot: Key | None = None
+    # Open multiline string delimiter and bracket depth at the start of a line
+    delim: str | None = None
+    depth = 0
+
+    for lineno, line in enumerate(lines):
+        header = _peek_header(line, delim, depth)
+        if header is not None:
+            is_aot, parts = header
+            if head is None or parts == head or parts[: len(head)] != head:
+                # Not a descendant of the current chunk's table
+                if buf:
+                    yield Unit("".join(buf), line_offset, aot)
+
+                buf = []
+                line_offset = lineno
+                if is_aot and head_aot is not None and parts == (head_aot,):
+                    # Next element of the same array of tables
+                    aot = SingleKey(head_aot)
+                else:
+                    aot = None
+                    head = parts
+                    # Only single key arrays are gathered by _parse_aot()
+                    head_aot = parts[0] if is_aot and len(parts) == 1 else None
+
+        buf.append(line)
+        delim, depth = _scan_line(line, delim, depth)
+
+    if buf:
+        yield Unit("".join(buf), line_offset, aot, True)
+
+
+def _unit_parser(
+    unit: Unit,
+    preserve: bool,
+    keys: dict[tuple[str, str], Key] | None = None,
+    max_depth: int | None = None,
+) -> Parser:
+    parser = Parser(unit.text, unit.line_offset, max_depth)
+    parser._src._continued = not unit.final
+    parser._preserve = preserve
+    if keys is not None:
+        # Share the keys of the chunks parsed before
+        parser._keys = keys
+    if unit.aot is not None:
+        # Same state as when _parse_aot() parses the next elements
+        parser._aot_stack.append(unit.aot)
+
+    return parser
+
+
+def parse_lines(
+    lines: Iterable[str], preserve: bool = True, max_depth: int | None = None
+) -> TOMLDocument:
+    """
+    Parses a document given as an iterable of lines, holding only one
+    top-level chunk of its text in memory at a time (see :func:`split_units`).
+
+    When ``preserve`` is false whitespace and comments are not kept, as with
+    :meth:`Parser.parse_values`. ``max_depth`` is passed on to :class:`Parser`.
+    """
+    body = TOMLDocument(True)
+    keys: dict[tuple[str, str], Key] = {}
+    # An error adding an array of tables to the document, with the chunk of
+    # the last of its elements parsed since
+    failed: tuple[Exception, Unit] | None = None
+    for unit in split_units(lines):
+        if failed is not None and unit.aot is None:
+            break
+
+        parser = _unit_parser(unit, preserve, keys, max_depth)
+        failed = _parse_unit(parser, unit, body, failed)
+
+    if failed is not None:
+        error, last = failed
+        raise _unit_error(last, len(last.text), str(error)) from error
+
+    body.parsing(False)
+
+    return body
+
+
+def _parse_unit(
+    parser: Parser,
+    unit: Unit,
+    body: TOMLDocument,
+    failed: tuple[Exception, Unit] | None = None,
+) -> tuple[Exception, Unit] | None:
+    """
+    Parses a chunk into the document, and returns the error adding an array
+    of tables to it, if any, with the chunk it was raised in.
+
+    A whole parse only adds an array of tables to the document once all its
+    elements are parsed, while they are chunks of their own: the error is
+    raised by the caller at the end of the last of them, unless parsing one
+    raises first. Chunks after an error (``failed``) are only parsed.
+    """
+    parser._parse_key_values(body)
+    for key, value in parser._parse_tables():
+        if failed is not None:
+            failed = failed[0], unit
+            continue
+
+        try:
+            body.append(key, value)
+        except Exception as e:
+            if not isinstance(value, AoT) and unit.aot is None:
+                raise parser.parse_error(ParseError, str(e)) from e
+
+            failed = e, unit
+
+    return failed
+
+
+def _unit_error(unit: Unit, idx: int, message: str) -> ParseError:
+    """
+    Creates a parse error at the given offset of the text of a chunk, where
+    parsing the whole document would raise it.
+    """
+    src = Source(unit.text, unit.line_offset)
+    src._continued = not unit.final
+    src.skip_to(idx)
+
+    return src.parse_error(ParseError, message)
+
+
+def parse_values_lines(
+    lines: Iterable[str], max_depth: int | None = None
+) -> dict[str, Any] | None:
+    """
+    Parses a document given as an iterable of lines into plain Python
+    objects, one top-level chunk at a time, as :meth:`Parser.parse_values`
+    does.
+
+    Returns None for documents that method parses into items, including
+    invalid ones: they must be given to ``parse_lines(lines, preserve=False)``
+    again, which reports errors.
+    """
+    tables = _PlainTables()
+    for unit in split_units(lines):
+        try:
+            Parser(unit.text, unit.line_offset, max_depth)._parse_plain(tables)
+        except Exception:  # noqa: BLE001
+            return None
+
+    return tables.root
+
+
+def validate_lines(
+    lines: Iterable[str], all_errors: bool = False
+) -> list[TOMLKitError]:
+    """
+    Checks a document given as an iterable of lines as :func:`parse_lines`
+    parses it, without keeping whitespace and comments, and returns the
+    first error found, if any.
+
+    With ``all_errors``, checking goes on after an error from the next table
+    header, along with the tables parsed before, and the first error of each
+    top-level chunk (see :func:`split_units`) is returned.
+    """
+    body = TOMLDocument(True)
+    keys: dict[tuple[str, str], Key] = {}
+    errors: list[TOMLKitError] = []
+    chunks = [split_units(lines)]
+    failed: tuple[Exception, Unit] | None = None
+    while chunks:
+        unit = next(chunks[-1], None)
+        if failed is not None and (unit is None or unit.aot is None):
+            # Past the elements of an array of tables that could not be added
+            # to the document (see _parse_unit())
+            cause, last = failed
+            failed = None
+            errors.append(_unit_error(last, len(last.text), str(cause)))
+            if not all_errors:
+                break
+
+            if unit is not None:
+                chunks.append(iter([unit]))
+
+            continue
+
+        if unit is None:
+            chunks.pop()
+            continue
+
+        parser = _unit_parser(unit, False, keys)
+        try:
+            failed = _parse_unit(parser, unit, body, failed)
+            continue
+        except TOMLKitError as e:
+            # Raised as is by a whole parse if not a ParseError, such as a key
+            # defined twice in an inline table
+            error = e
+            failed = None
+
+        errors.append(error)
+        if not all_errors:
+            break
+
+        # The rest of the chunk may not have been split where it should, as
+        # after an unclosed array: split it again from the next table header
+        if isinstance(error, ParseError):
+            line = error.line
+        else:
+            line = parser._src._to_linecol(parser._src.idx)[0]
+
+        rest = list(iter_lines(unit.text))
+        start = max(line - unit.line_offset, 1)
+        for i in range(start, len(rest)):
+            if _peek_header(rest[i], None, 0) is not None:
+                chunks.append(_shift_units(rest[i:], unit.line_offset + i, unit.final))
+                break
+
+    return errors
+
+
+def _shift_units(lines: Iterable[str], offset: int, final: bool) -> Iterator[Unit]:
+    """
+    Splits the lines as :func:`split_units` does, for lines that start
+    ``offset`` lines into the document, and end it if ``final`` is true.
+    """
+    for unit in split_units(lines):
+        yield unit._replace(
+            line_offset=unit.line_offset + offset, final=unit.final and final
+        )
+
+
+def parse_parallel(
+    string: str | bytes,
+    workers: int,
+    preserve: bool = True,
+    max_depth: int | None = None,
+) -> TOMLDocument:
+    """
+    Parses a document in ``workers`` processes.
+
+    The document is split into top-level chunks (see :func:`split_units`),
+    which are parsed in batches by the worker processes. Their tables are then
+    appended to the document in order, as :func:`parse_lines` would, so that
+    out-of-order tables and arrays of tables are handled (and errors raised)
+    exactly as when parsing in a single process.
+    """
+    text = decode(string, ["utf-8-sig", "latin1", "ascii"])
+    units = split_units(iter_lines(text))
+    body = TOMLDocument(True)
+    first = next(units, None)
+    if first is not None:
+        # Key/value pairs before the first table go straight in the document
+        _unit_parser(first, preserve, max_depth=max_depth)._parse_into(body)
+
+    # A few batches per worker, to even out their load
+    batches = list(_batch_units(units, max(len(text) // (workers * 4), 1 << 16)))
+    failed: tuple[Exception, Unit] | None = None
+    if batches:
+        with ProcessPoolExecutor(min(workers, len(batches))) as executor:
+            results = executor.map(
+                _parse_batch, batches, repeat(preserve), repeat(max_depth)
+            )
+            for i, tables in enumerate(results):
+                batch = batches[i]
+                # A syntax error ends the tables of a batch early
+                if len(tables) > len(batch):
+                    raise RuntimeError(
+                        f"{len(tables)} results for a batch of {len(batch)} chunks"
+                    )
+
+                for j, unit_tables in enumerate(tables):
+                    failed = _append_tables(body, batch[j], unit_tables, failed)
+
+    if failed is not None:
+        error, last = failed
+        raise _unit_error(last, len(last.text), str(error)) from error
+
+    body.parsing(False)
+
+    return body
+
+
+def _append_tables(
+    body: TOMLDocument,
+    unit: Unit,
+    tables: list[tuple[Key, Item, int]] | TOMLKitError,
+    failed: tuple[Exception, Unit] | None,
+) -> tuple[Exception, Unit] | None:
+    """
+    Appends the tables parsed from a chunk to the document, as
+    :func:`_parse_unit` does.
+    """
+    if isinstance(tables, TOMLKitError):
+        raise tables
+
+    if failed is not None:
+        if unit.aot is not None:
+            return failed[0], unit
+
+        error, last = failed
+        raise _unit_error(last, len(last.text), str(error)) from error
+
+    for key, value, end in tables:
+        try:
+            body.append(key, value)
+        except Exception as e:
+            if isinstance(value, AoT) or unit.aot is not None:
+                return e, unit
+
+            # Raised where parsing the chunk in this process would have
+            raise _unit_error(unit, end, str(e)) from e
+
+    return None
+
+
+def _batch_units(units: Iterable[Unit], size: int) -> Iterator[list[Unit]]:
+    batch: list[Unit] = []
+    length = 0
+    for unit in units:
+        batch.append(unit)
+        length += len(unit.text)
+        if length >= size:
+            yield batch
+            batch = []
+            length = 0
+
+    if batch:
+        yield batch
+
+
+def _parse_batch(
+    units: list[Unit], preserve: bool, max_depth: int | None = None
+) -> list[list[tuple[Key, Item, int]] | TOMLKitError]:
+    """
+    Parses the tables of each of the given chunks, with the offset at which
+    each one ends, in a worker process of :func:`parse_parallel`.
+
+    A syntax error is returned in place of the tables of its chunk, and ends
+    the batch, so that it is only raised after the tables of the chunks
+    before it have been added to the document.
+    """
+    results: list[list[tuple[Key, Item, int]] | TOMLKitError] = []
+    keys: dict[tuple[str, str], Key] = {}
+    for unit in units:
+        parser = _unit_parser(unit, preserve, keys, max_depth)
+        # The chunk starts with a table header, the marker stays before its
+        # indentation
+        parser._src.advance_while(_SPACES)
+        try:
+            results.append(
+                [(key, value, parser._idx) for key, value in parser._parse_tables()]
+            )
+        except TOMLKitError as e:
+            results.append(e)
+            break
+
+    return results
+
+
+def reparse(doc: TOMLDocument, start: int, end: int, text: str) -> None:
+    """
+    Updates a document for the replacement of ``source[start:end]`` by
+    ``text`` in the source it was parsed from, parsing again only the
+    top-level chunk the edit falls in (see :class:`Span`).
+
+    The whole document is parsed again if the edit touches a table header,
+    if its result would not be the same as parsing the whole document (for
+    instance a table split across several chunks), if the document was not
+    parsed with ``incremental=True`` or tracks positions, or if it was
+    modified since it was parsed, in which case the offsets refer to its
+    rendering.
+    """
+    source = doc._source
+    if source is None or doc._cached_rendering(("document",)) is not source:
+        # The chunks no longer match the items
+        source = doc.as_string()
+        incremental = False
+    else:
+        incremental = True
+
+    if not 0 <= start <= end <= len(source):
+        raise ValueError(f"Invalid range {start}:{end} for a {len(source)} long text")
+
+    new = source[:start] + text + source[end:]
+    # Tracked positions change for all the items after the edit
+    if incremental and not doc._track_positions:
+        for i in range(len(doc._spans) - 1, -1, -1):
+            span = doc._spans[i]
+            if span.body <= start and end <= span.end:
+                if _reparse_span(doc, new, i, len(text) - (end - start)):
+                    return
+
+                break
+
+            if span.start < start:
+                # Starts in a table header, or spans several chunks
+                break
+
+    parser = Parser(new)
+    parsed = parser.parse(track_positions=doc._track_positions, incremental=True)
+    doc._reset(parsed)
+    doc._source, doc._spans = parsed._source, parsed._spans
+    doc._cache_source(parser._src)
+
+
+def _reparse_span(doc: TOMLDocument, new: str, i: int, delta: int) -> bool:
+    """
+    Parses again the chunk of the i-th span of the document after an edit,
+    and replaces its items in the document.
+
+    Returns False if the whole document has to be parsed again instead.
+    """
+    span = doc._spans[i]
+    end = span.end + delta
+    if end < len(new) and not new.endswith("\n", 0, end):
+        # Would run into the next table header
+        return False
+
+    parser = Parser(new[span.start : end])
+    spans = list(doc._spans)
+    try:
+        if i == 0:
+            scratch = Container(True)
+            parser._parse_key_values(scratch)
+            if not parser.end() or not _splice_key_values(doc, span.item, scratch):
+                return False
+
+            shift = len(scratch.body) - span.item
+            spans[0] = span._replace(end=end, item=len(scratch.body))
+        else:
+            shift = 0
+            spans[i] = span._replace(end=end)
+            if span.element is None:
+                parser._src.advance_while(_SPACES)
+                key, value = parser._parse_table()
+                if not parser.end() or not _splice_table(doc, span.item, key, value):
+                    return False
+            else:
+                name, current = doc.body[span.item]
+                assert name is not None
+                parser._aot_stack.append(name)
+                parser._src.advance_while(_SPACES)
+                _, value = parser._parse_table()
+                if (
+                    not parser.end()
+                    or not isinstance(current, AoT)
+                    or not isinstance(value, Table)
+                    or not value.is_aot_element()
+                    or doc._map.get(name) != span.item
+                ):
+                    return False
+
+                value.value.parsing(False)
+                current._edited()
+                current.body[span.element] = value
+                list.__setitem__(current, span.element, value)
+                dict.__setitem__(doc, name.key, [t._container for t in current.body])
+                doc._changed()
+    except ParseError:
+        # Might be valid along with the rest of the document (an unclosed
+        # multiline string for instance), or not: parse it all to find out
+        return False
+
+    for j in range(i + 1, len(spans)):
+        s = spans[j]
+        spans[j] = s._replace(
+            start=s.start + delta,
+            body=s.body + delta,
+            end=s.end + delta,
+            item=s.item + shift,
+        )
+
+    doc._source = new
+    doc._spans = spans
+    doc._cache_source(new)
+
+    return True
+
+
+def _splice_table(doc: TOMLDocument, index: int, key: Key, value: Item) -> bool:
+    """
+    Replaces the top-level table at the given index of the body of a document
+    by a table parsed again.
+    """
+    current_key, current = doc.body[index]
+    if (
+        current_key != key
+        or doc._map.get(current_key) != index
+        or not isinstance(current, Table)
+        or not isinstance(value, Table)
+        or value.is_aot_element()
+        or value.is_super_table() != current.is_super_table()
+    ):
+        return False
+
+    value.value.parsing(False)
+    doc.body[index] = (current_key, value)
+    dict.__setitem__(doc, current_key.key, value.value)
+    doc._validation_cache.clear()
+    doc._changed()
+
+    return True
+
+
+def _splice_key_values(doc: TOMLDocument, count: int, scratch: Container) -> bool:
+    """
+    Replaces the first ``count`` items of the body of a document, the
+    key/value pairs before the first table, by the items of ``scratch``.
+    """
+    rest = doc.body[count:]
+    keys = {key for key, _ in rest if key is not None}
+    if any(
+        key in keys for key, _ in doc.body[:count] + scratch.body if key is not None
+    ):
+        # Shared with a table of the document
+        return False
+
+    scratch.parsing(False)
+    shift = len(scratch.body) - count
+    index = dict(scratch._map)
+    for key, idx in doc._map.items():
+        if key in keys:
+            if isinstance(idx, tuple):
+                index[key] = tuple(i + shift for i in idx)
+            else:
+                index[key] = idx + shift
+
+    tables = len(doc._table_keys) - sum(k in keys for k in doc._table_keys)
+    doc._table_keys[:tables] = scratch._table_keys
+    doc._body[:count] = scratch.body
+    doc._map = index
+    doc._validation_cache.clear()
+    doc._changed()
+    dict.clear(doc)
+    for key, idx in index.items():
+        last = idx[-1] if isinstance(idx, tuple) else idx
+        dict.__setitem__(doc, key.key, doc.body[last][1].value)
+
+    return True
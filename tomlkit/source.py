@@ -1,7 +1,19 @@
 from __future__ import annotations
 
+import codecs
+
+from bisect import bisect_right
+from collections.abc import Generator
+from collections.abc import Iterator
+from mmap import mmap
+from typing import IO
+from typing import TYPE_CHECKING
 from typing import Any
 
+
+if TYPE_CHECKING:
+    from typing import Self
+
 from tomlkit.exceptions import ParseError
 from tomlkit.exceptions import UnexpectedCharError
 
@@ -78,10 +90,24 @@ class Source(str):
     # is detected positionally (`end()` / `_idx >= len`), never by comparing to this
     # value, so a real NUL byte in the input is not mistaken for EOF.
     EOF = "\0"
+    # Whether more of the document follows this source, when it is only one
+    # chunk of it, so that its end is the start of the next line
+    _continued = False
 
-    def __init__(self, _: str) -> None:
+    def __new__(cls, source: str, line_offset: int = 0) -> Self:
+        return super().__new__(cls, source)
+
+    def __init__(self, _: str, line_offset: int = 0) -> None:
         super().__init__()
 
+        # Number of lines preceding this source when it is only one chunk of a
+        # larger document (see parser.parse_lines()), so that errors report
+        # their line within the whole document.
+        self._line_offset = line_offset
+        # Offsets of the start of each line, only computed to locate errors
+        self._line_starts: list[int] | None = None
+        self._located = False
+
         # Track an integer index over the underlying str (Source subclasses str):
         # init is O(1) and `inc()` just bumps the index and reads the next char,
         # instead of materializing a list of (index, char) pairs up front.
@@ -183,6 +209,31 @@ class Source(str):
         self._current = self.EOF
         return False
 
+    def save(self) -> int:
+        """
+        Returns a checkpoint of the current position to go back to with
+        restore(), without creating a state object as ``state`` does.
+        """
+        return self._idx
+
+    def restore(self, checkpoint: int, marker: int | None = None) -> None:
+        """
+        Goes back to a checkpoint returned by save(), and to the given marker
+        if any.
+        """
+        self._idx = checkpoint
+        self._current = self[checkpoint] if checkpoint < len(self) else self.EOF
+        if marker is not None:
+            self._marker = marker
+
+    def skip_to(self, idx: int) -> bool:
+        """
+        Moves to the given index, or to the end of the input if it is past it.
+        Returns whether the end of the input has not been reached.
+        """
+        self._idx = idx - 1
+        return self.inc()
+
     def inc_n(self, n: int, exception: type[ParseError] | None = None) -> bool:
         """
         Increments the parser by n characters
@@ -224,17 +275,108 @@ class Source(str):
     ) -> ParseError:
         """
         Creates a generic "parse error" at the current position.
+
+        Its line and column are only computed when they are looked up.
         """
-        line, col = self._to_linecol()
+        error = exception(0, 0, *args, **kwargs)
+        idx = self._idx
+        error._position = lambda: self._to_linecol(idx)
+
+        return error
+
+    def _to_linecol(self, idx: int) -> tuple[int, int]:
+        if idx >= len(self) and (not self or self[-1] == "\n"):
+            # Past the line feed ending the input: on its last line, as errors
+            # at the end of a document are, unless the document goes on
+            return self.count("\n") + self._line_offset + self._continued, 0
+
+        starts = self._line_starts
+        if starts is None:
+            if not self._located:
+                # Counting line feeds is faster for a single error, the table
+                # of line starts only pays off from the second one on
+                self._located = True
+                line = self.count("\n", 0, idx) + 1
+                return line + self._line_offset, idx - self.rfind("\n", 0, idx) - 1
+
+            starts = self._line_starts = [0]
+            i = self.find("\n")
+            while i >= 0:
+                starts.append(i + 1)
+                i = self.find("\n", i + 1)
+
+        line = bisect_right(starts, idx)
+
+        return line + self._line_offset, idx - starts[line - 1]
+
+
+def iter_lines(
+    fp: IO[str] | IO[bytes] | str | bytes | bytearray | memoryview | mmap,
+    size: int = 1 << 16,
+) -> Generator[str, None, None]:
+    """
+    Reads a file object (or a string, or a bytes-like object such as a memory
+    map) block by block and yields its lines, each one ending with its line feed (except
+    possibly the last one).
+
+    Only line feeds split lines, as in TOML, so a ``\\r\\n`` pair stays at
+    the end of its line. Binary input is decoded as UTF-8 along the way,
+    without a leading byte order mark.
+    """
+    decoder = None
+    pending: list[str] = []
+    for block in _iter_blocks(fp, size):
+        if not isinstance(block, str):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+            block = decoder.decode(block)
+
+        if "\n" not in block:
+            pending.append(block)
+            continue
+
+        lines = block.split("\n")
+        if pending:
+            pending.append(lines[0])
+            lines[0] = "".join(pending)
+            pending = []
+
+        last = lines.pop()
+        for line in lines:
+            yield line + "\n"
+
+        if last:
+            pending.append(last)
+
+    if decoder is not None:
+        pending.append(decoder.decode(b"", final=True))
+
+    last = "".join(pending)
+    if last:
+        yield last
+
+
+def _iter_blocks(
+    fp: IO[str] | IO[bytes] | str | bytes | bytearray | memoryview | mmap, size: int
+) -> Iterator[str | bytes | memoryview]:
+    if isinstance(fp, str):
+        for start in range(0, len(fp), size):
+            yield fp[start : start + size]
+
+        return
 
-        return exception(line, col, *args, **kwargs)
+    if isinstance(fp, (bytes, bytearray, memoryview, mmap)):
+        # Slices of a memoryview share the underlying buffer
+        with memoryview(fp) as view, view.cast("B") as data:
+            for start in range(0, len(data), size):
+                yield data[start : start + size]
 
-    def _to_linecol(self) -> tuple[int, int]:
-        cur = 0
-        for i, line in enumerate(self.splitlines()):
-            if cur + len(line) + 1 > self.idx:
-                return (i + 1, self.idx - cur)
+        return
 
-            cur += len(line) + 1
+    while True:
+        block = fp.read(size)
+        if not block:
+            break
 
-        return len(self.splitlines()), 0
+        yield block
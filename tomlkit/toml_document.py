@@ -1,7 +1,101 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+
 from tomlkit.container import Container
+from tomlkit.container import OutOfOrderTableProxy
+from tomlkit.exceptions import NonExistentKey
+from tomlkit.items import AbstractTable
+from tomlkit.items import AoT
+from tomlkit.items import Array
+from tomlkit.items import Key
+from tomlkit.items import SingleKey
+
+
+if TYPE_CHECKING:
+    from tomlkit.parser import Span
 
 
 class TOMLDocument(Container):
     """
     A TOML document.
     """
+
+    # The text the document was parsed from with incremental=True and its
+    # top-level chunks, so that only the chunk an edit falls in is parsed
+    # again by reparse()
+    _source: str | None = None
+    _spans: Sequence[Span] = ()
+    # Whether the positions of the items were recorded when parsing
+    _track_positions = False
+
+    def locate(
+        self, path: Key | str | Sequence[Key | str | int], key: bool = False
+    ) -> tuple[int, int] | None:
+        """
+        Returns the start and end offsets in the parsed text of the item at
+        the given path, made of keys and of indices in arrays, or of its key
+        if ``key`` is true. For tables, this is the range of their header.
+
+        Positions are only known for documents parsed with
+        ``track_positions=True``: None is returned for items added since,
+        implicit tables and arrays of tables, whose text is not in one piece.
+
+        :Example:
+
+        >>> doc = parse('[a]\nb = [1, 2]\n', track_positions=True)
+        >>> doc.locate(["a", "b", 1])
+        (12, 13)
+        >>> doc.locate("a")
+        (0, 3)
+        """
+        if isinstance(path, (Key, str)):
+            path = (path,)
+
+        current: Any = self
+        found: Key | None = None
+        for part in path:
+            if isinstance(current, OutOfOrderTableProxy):
+                current = current._internal_container
+            elif isinstance(current, AbstractTable):
+                current = current.value
+
+            if isinstance(part, int):
+                if not isinstance(current, (Array, AoT)):
+                    raise NonExistentKey(part)
+
+                found = None
+                current = current[part]
+                continue
+
+            if not isinstance(current, Container):
+                raise NonExistentKey(part)
+
+            item = current.item(part)
+            index = current._map[part if isinstance(part, Key) else SingleKey(part)]
+            found = None if isinstance(index, tuple) else current.body[index][0]
+            current = item
+
+        return getattr(found if key else current, "_span", None)
+
+    def reparse(self, start: int, end: int, text: str) -> None:
+        """
+        Updates the document for the replacement of ``source[start:end]`` by
+        ``text``, where ``source`` is the text the document renders as: the
+        text it was parsed from (or the result of the previous call) unless
+        it was modified since.
+
+        For documents parsed with ``incremental=True``, only the top-level
+        table (or the key/value pairs before the first table) the edit falls
+        in is parsed again, unless the edit touches a table header or the
+        document was modified by other means since, in which case the whole
+        text is.
+
+        :raises ParseError: if the edited text is not valid TOML, in which
+            case the document is left unchanged.
+        """
+        from tomlkit.parser import reparse
+
+        reparse(self, start, end, text)
@@ -1,9 +1,17 @@
+import contextlib
 import os
 import re
+import shutil
+import uuid
 
+from collections.abc import Iterable
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
-from tomlkit.api import loads
+from tomlkit.api import validate
+from tomlkit.exceptions import TOMLKitError
+from tomlkit.parser import parse_lines
+from tomlkit.source import iter_lines
 from tomlkit.toml_document import TOMLDocument
 
 
@@ -28,32 +36,92 @@ class TOMLFile:
 
     def read(self) -> TOMLDocument:
         """Read the file content as a :class:`tomlkit.toml_document.TOMLDocument`."""
-        with open(self._path, encoding="utf-8", newline="") as f:
-            content = f.read()
+        eols = {"\n": 0, "\r\n": 0}
+
+        def normalized(lines: Iterable[str]) -> Iterator[str]:
+            for line in lines:
+                if line.endswith("\r\n"):
+                    eols["\r\n"] += 1
+                    line = line[:-2] + "\n"
+                elif line.endswith("\n"):
+                    eols["\n"] += 1
+
+                yield line
+
+        with open(self._path, "rb") as f:
+            # The file is parsed as it is read, converting consistent
+            # Windows line endings along the way
+            doc = parse_lines(normalized(iter_lines(f)))
 
             # check if consistent line endings
-            num_newline = content.count("\n")
-            if num_newline > 0:
-                num_win_eol = content.count("\r\n")
-                if num_win_eol == num_newline:
-                    self._linesep = "\r\n"
-                    content = content.replace("\r\n", "\n")
-                elif num_win_eol == 0:
-                    self._linesep = "\n"
-                else:
-                    self._linesep = "mixed"
-
-            return loads(content)
+            if eols["\r\n"] and eols["\n"]:
+                self._linesep = "mixed"
+                f.seek(0)
+                doc = parse_lines(iter_lines(f))
+            elif eols["\r\n"]:
+                self._linesep = "\r\n"
+            elif eols["\n"]:
+                self._linesep = "\n"
+
+            return doc
+
+    def validate(self, all_errors: bool = False) -> list[TOMLKitError]:
+        """
+        Check that the file is a valid TOML document without building a
+        :class:`tomlkit.toml_document.TOMLDocument`, see :func:`tomlkit.validate`.
+        """
+        with open(self._path, "rb") as f:
+            return validate(f, all_errors=all_errors)
 
     def write(self, data: TOMLDocument) -> None:
-        """Write the TOMLDocument to the file."""
-        content = data.as_string()
+        """
+        Write the TOMLDocument to the file.
+
+        The document is written to a temporary file next to it, which then
+        replaces it, so that the file is left as it was if rendering fails.
+        """
+        path = os.path.realpath(self._path)
+        directory, name = os.path.split(path)
+        tmp = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+        # Created with the permissions of a new file, unless it replaces one
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with open(fd, "w", encoding="utf-8", newline="") as f:
+                f.writelines(_apply_linesep(data.iter_render(), self._linesep))
+
+            if os.path.exists(path):
+                shutil.copymode(path, tmp)
+
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+
+            raise
+
+
+def _apply_linesep(chunks: Iterable[str], linesep: str) -> Iterator[str]:
+    """
+    Converts the line endings of the text made of the chunks to ``linesep``,
+    one chunk at a time.
+    """
+    if linesep not in ("\n", "\r\n"):
+        yield from chunks
+        return
+
+    # A carriage return ending a chunk could start a Windows line ending
+    # continued in the next one, so it is held back until then
+    pending = ""
+    for chunk in chunks:
+        chunk = pending + chunk
+        pending = ""
+        if chunk.endswith("\r"):
+            chunk, pending = chunk[:-1], "\r"
 
-        # apply linesep
-        if self._linesep == "\n":
-            content = content.replace("\r\n", "\n")
-        elif self._linesep == "\r\n":
-            content = re.sub(r"(?<!\r)\n", "\r\n", content)
+        if linesep == "\n":
+            yield chunk.replace("\r\n", "\n")
+        else:
+            yield re.sub(r"(?<!\r)\n", "\r\n", chunk)
 
-        with open(self._path, "w", encoding="utf-8", newline="") as f:
-            f.write(content)
+    if pending:
+        yield pending